@@ -0,0 +1,28 @@
+"""Make ship class numbers unique
+
+Revision ID: 005_unique_ship_class_number
+Revises: 004_add_security_tables
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005_unique_ship_class_number'
+down_revision = '004_add_security_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Ship class seeding inserts with ON CONFLICT (class_number) DO NOTHING,
+    # which needs a unique index on the conflict column
+    op.drop_index(op.f('ix_ship_classes_class_number'), table_name='ship_classes')
+    op.create_index(op.f('ix_ship_classes_class_number'), 'ship_classes', ['class_number'], unique=True)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_ship_classes_class_number'), table_name='ship_classes')
+    op.create_index(op.f('ix_ship_classes_class_number'), 'ship_classes', ['class_number'], unique=False)
@@ -0,0 +1,26 @@
+"""Index armed mines by position
+
+Revision ID: 006_add_mine_range_index
+Revises: 005_unique_ship_class_number
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006_add_mine_range_index'
+down_revision = '005_unique_ship_class_number'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Mine detection selects active, armed mines within a bounding box
+    op.create_index('ix_mines_active_armed_coords', 'mines',
+                    ['is_active', 'is_armed', 'x_coord', 'y_coord'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_mines_active_armed_coords', table_name='mines')
@@ -0,0 +1,31 @@
+"""Store each ship's sector
+
+Revision ID: 007_add_ship_sector_columns
+Revises: 006_add_mine_range_index
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007_add_ship_sector_columns'
+down_revision = '006_add_mine_range_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Generated from the coordinates, so every writer keeps them current
+    op.add_column('ships', sa.Column('sector_x', sa.Integer(),
+                                     sa.Computed('CAST(floor(x_coord) AS INTEGER)', persisted=True)))
+    op.add_column('ships', sa.Column('sector_y', sa.Integer(),
+                                     sa.Computed('CAST(floor(y_coord) AS INTEGER)', persisted=True)))
+    op.create_index('ix_ships_sector', 'ships', ['sector_x', 'sector_y'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_ships_sector', table_name='ships')
+    op.drop_column('ships', 'sector_y')
+    op.drop_column('ships', 'sector_x')
@@ -18,7 +18,7 @@ from app.core.game_config import game_config, ConfigCategory, ConfigParameter
 from app.core.balance_service import balance_service, BalanceMetrics, BalanceFactor
 from app.core.scoring_service import scoring_service, ScoreBreakdown, PlayerRanking, TeamRanking
 from app.core.data_persistence import data_persistence_service
-from app.models.config import GameConfig, ConfigHistory, ConfigVersion, BalanceAdjustment
+from app.models.config import ConfigVersion, BalanceAdjustment
 from app.models.user import User
 from app.core.auth import get_current_user
 
@@ -69,6 +69,7 @@ class AdminStatsResponse(BaseModel):
 class BackupRequest(BaseModel):
     backup_name: Optional[str] = None
     include_data: bool = True
+    compress: bool = True
 
 
 class RestoreRequest(BaseModel):
@@ -165,7 +166,7 @@ async def get_all_configurations(
         for key, config in configs.items():
             result[key] = {
                 "value": config.value,
-                "type": config.config_type.value,
+                "type": config.config_type.label,
                 "category": config.category.value,
                 "description": config.description,
                 "min_value": config.min_value,
@@ -213,24 +214,16 @@ async def update_configuration(
         success = game_config.set_config(
             key=key,
             value=request.value,
-            admin_user=admin_user.userid
+            admin_user=admin_user.userid,
+            change_reason=request.reason
         )
         
         if not success:
             raise HTTPException(status_code=400, detail="Configuration validation failed")
         
         # Log to database
-        config_record = db.query(GameConfig).filter(GameConfig.key == key).first()
-        if config_record:
-            history_record = ConfigHistory(
-                config_id=config_record.id,
-                old_value=config_record.value,
-                new_value=request.value,
-                changed_by=admin_user.userid,
-                change_reason=request.reason
-            )
-            db.add(history_record)
-            db.commit()
+        game_config.flush_history(db)
+        db.commit()
         
         return {"message": f"Configuration '{key}' updated successfully", "value": request.value}
     except ValueError as e:
@@ -256,7 +249,8 @@ async def update_configurations_batch(
                 success = game_config.set_config(
                     key=update.key,
                     value=update.value,
-                    admin_user=admin_user.userid
+                    admin_user=admin_user.userid,
+                    change_reason=request.reason
                 )
                 
                 if success:
@@ -266,6 +260,10 @@ async def update_configurations_batch(
             except ValueError as e:
                 errors.append({"key": update.key, "error": str(e)})
         
+        # Log all changes to database in one batch
+        game_config.flush_history(db)
+        db.commit()
+        
         return {
             "message": f"Batch update completed: {len(results)} successful, {len(errors)} failed",
             "results": results,
@@ -289,6 +287,9 @@ async def reset_configuration(
         if not success:
             raise HTTPException(status_code=404, detail=f"Configuration '{key}' not found or has no default")
         
+        game_config.flush_history(db)
+        db.commit()
+        
         return {"message": f"Configuration '{key}' reset to default value"}
     except Exception as e:
         logger.error(f"Error resetting configuration {key}: {e}")
@@ -299,11 +300,12 @@ async def reset_configuration(
 async def get_configuration_history(
     key: Optional[str] = None,
     limit: int = 100,
+    db: Session = Depends(get_db),
     admin_user: User = Depends(get_admin_user)
 ):
     """Get configuration change history"""
     try:
-        history = game_config.get_config_history(limit)
+        history = game_config.get_config_history(limit, session=db)
         
         if key:
             # Filter by specific key
@@ -335,11 +337,13 @@ async def export_configurations(
 @router.post("/config/import")
 async def import_configurations(
     config_data: Dict[str, Any],
+    db: Session = Depends(get_db),
     admin_user: User = Depends(get_admin_user)
 ):
     """Import configurations from JSON"""
     try:
-        errors = game_config.import_config(config_data, admin_user.userid)
+        errors = game_config.import_config(config_data, admin_user.userid, session=db)
+        db.commit()
         
         return {
             "message": "Configuration import completed",
@@ -643,7 +647,8 @@ async def create_backup(
     try:
         backup_info = data_persistence_service.create_backup(
             backup_name=request.backup_name,
-            include_data=request.include_data
+            include_data=request.include_data,
+            compress=request.compress
         )
         
         return {
@@ -4,7 +4,7 @@ Galactic Empire - Game Engine API
 This module provides REST API endpoints for interacting with the game engine.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Response
 from pydantic import BaseModel
 from typing import Dict, List, Optional, Any
 import logging
@@ -191,7 +191,7 @@ async def create_ship(ship_data: ShipCreateRequest):
             shields=ship.shields,
             max_shields=ship.max_shields,
             damage=ship.damage,
-            status=ship.status,
+            status=ship.status.label,
             team_id=ship.team_id,
             last_update=ship.last_update.isoformat()
         )
@@ -200,14 +200,14 @@ async def create_ship(ship_data: ShipCreateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/ships/{ship_id}", response_model=Dict[str, Any])
+@router.get("/ships/{ship_id}")
 async def get_ship(ship_id: str):
     """Get ship status"""
     try:
         status = game_engine.get_ship_status(ship_id)
         if not status:
             raise HTTPException(status_code=404, detail="Ship not found")
-        return status
+        return Response(content=status.to_json(), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -266,7 +266,7 @@ async def get_ships_in_sector(x: float, y: float):
                     "position": {"x": ship.position.x, "y": ship.position.y},
                     "heading": ship.heading,
                     "speed": ship.speed,
-                    "status": ship.status
+                    "status": ship.status.label
                 }
                 for ship in ships
             ]
@@ -0,0 +1,345 @@
+"""
+Batched filesystem metadata calls over io_uring
+
+Submits many statx() or unlinkat() calls to the kernel in a single
+io_uring_enter() and reaps the results together, instead of paying one
+syscall per file. The ring is driven directly through the
+io_uring_setup/io_uring_enter syscalls with ctypes, so no liburing build
+is required.
+
+Each process creates one ring on first use and reuses it for every call;
+calls from several threads take turns on it. io_uring is only used on
+Linux x86-64 and can be disabled by setting the
+GE_DISABLE_IO_URING environment variable; otherwise, or when the kernel
+refuses to create a ring, every call falls back to plain os.stat() or
+os.unlink().
+"""
+
+import ctypes
+import errno
+import logging
+import mmap
+import os
+import platform
+import struct
+import threading
+from pathlib import Path
+from typing import List, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# Syscall numbers (x86-64)
+_SYS_IO_URING_SETUP = 425
+_SYS_IO_URING_ENTER = 426
+
+# Opcodes and flags from <linux/io_uring.h>
+_IORING_OP_STATX = 21
+_IORING_OP_UNLINKAT = 36
+_IORING_ENTER_GETEVENTS = 1
+_IORING_FEAT_SINGLE_MMAP = 1
+_IORING_OFF_SQ_RING = 0
+_IORING_OFF_CQ_RING = 0x8000000
+_IORING_OFF_SQES = 0x10000000
+
+# statx() arguments from <fcntl.h> and <linux/stat.h>
+_AT_FDCWD = -100
+_STATX_BASIC_STATS = 0x7FF
+
+# Submission queue depth of the shared ring; larger batches are submitted
+# in chunks of this size
+RING_ENTRIES = 256
+
+_SQE_SIZE = 64
+_CQE_SIZE = 16
+_STATX_SIZE = 256
+
+# struct io_uring_params: 10 u32 fields, then the SQ and CQ ring offsets
+_PARAMS = struct.Struct("<10I" + "7IIQ" + "8IQ")
+_SQE = struct.Struct("<BBHiQQIIQ")  # opcode, flags, ioprio, fd, off, addr, len, op_flags, user_data
+_CQE = struct.Struct("<QiI")  # user_data, res, flags
+_U32 = struct.Struct("<I")
+
+# Leading fields of struct statx up to the device numbers
+_STATX = struct.Struct("<IIQIIIHHQQQQ" + "qIi" * 4 + "IIII")
+
+_libc = None
+_uring_available = None
+
+# The ring of this process and the pid that created it; a forked child
+# must not share its parent's ring, so it creates its own
+_ring = None
+_ring_pid = None
+_ring_lock = threading.Lock()
+
+
+def _syscall(*args) -> int:
+    res = _libc.syscall(*args)
+    if res < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return res
+
+
+def _io_uring_supported() -> bool:
+    """Check once whether io_uring can be used in this process"""
+    global _libc, _uring_available
+
+    if os.environ.get("GE_DISABLE_IO_URING"):
+        return False
+
+    if _uring_available is None:
+        _uring_available = False
+        if platform.system() == "Linux" and platform.machine() == "x86_64":
+            try:
+                _libc = ctypes.CDLL(None, use_errno=True)
+                _libc.syscall.restype = ctypes.c_long
+                with _ring_lock:
+                    _shared_ring()
+                _uring_available = True
+            except (OSError, AttributeError) as e:
+                logger.info(f"io_uring unavailable, using os.stat fallback: {e}")
+
+    return _uring_available
+
+
+def _shared_ring() -> "_Ring":
+    """Get the ring of this process, creating it if needed (call with _ring_lock held)"""
+    global _ring, _ring_pid
+
+    pid = os.getpid()
+    if _ring is None or _ring.fd < 0 or _ring_pid != pid:
+        if _ring is not None:
+            # Closes only this process's copy of an inherited ring
+            _ring.close()
+        _ring = _Ring(RING_ENTRIES)
+        _ring_pid = pid
+    return _ring
+
+
+class _Ring:
+    """Minimal io_uring instance with blocking batch submission"""
+
+    def __init__(self, entries: int):
+        params = ctypes.create_string_buffer(_PARAMS.size)
+        self.fd = _syscall(_SYS_IO_URING_SETUP, ctypes.c_uint(entries), params)
+        self._maps = []
+        try:
+            fields = _PARAMS.unpack(params.raw)
+            sq_entries, cq_entries, features = fields[0], fields[1], fields[5]
+            (self.sq_head, self.sq_tail, self.sq_mask_off, _, _, _,
+             self.sq_array, _, _) = fields[10:19]
+            (self.cq_head, self.cq_tail, self.cq_mask_off, _, _,
+             self.cq_cqes, _, _, _) = fields[19:28]
+
+            sq_size = self.sq_array + sq_entries * 4
+            cq_size = self.cq_cqes + cq_entries * _CQE_SIZE
+            if features & _IORING_FEAT_SINGLE_MMAP:
+                self.sq = self.cq = self._map(max(sq_size, cq_size), _IORING_OFF_SQ_RING)
+            else:
+                self.sq = self._map(sq_size, _IORING_OFF_SQ_RING)
+                self.cq = self._map(cq_size, _IORING_OFF_CQ_RING)
+            self.sqes = self._map(sq_entries * _SQE_SIZE, _IORING_OFF_SQES)
+
+            self.entries = sq_entries
+            self.sq_mask = _U32.unpack_from(self.sq, self.sq_mask_off)[0]
+            self.cq_mask = _U32.unpack_from(self.cq, self.cq_mask_off)[0]
+        except BaseException:
+            self.close()
+            raise
+
+    def _map(self, size: int, offset: int) -> mmap.mmap:
+        m = mmap.mmap(self.fd, size, flags=mmap.MAP_SHARED,
+                      prot=mmap.PROT_READ | mmap.PROT_WRITE, offset=offset)
+        self._maps.append(m)
+        return m
+
+    def submit_and_wait(self, sqes: Sequence[tuple]) -> List[int]:
+        """
+        Submit up to `entries` SQEs and block until all of them complete
+
+        If waiting fails, completions may be left in the ring, so it is
+        closed and must not be used again.
+
+        Args:
+            sqes: Tuples of SQE fields in _SQE order; user_data must be the
+                  index of the entry in this batch
+
+        Returns:
+            The res value of each completion, in submission order
+        """
+        tail = _U32.unpack_from(self.sq, self.sq_tail)[0]
+        for sqe in sqes:
+            index = tail & self.sq_mask
+            _SQE.pack_into(self.sqes, index * _SQE_SIZE, *sqe)
+            _U32.pack_into(self.sq, self.sq_array + index * 4, index)
+            tail = (tail + 1) & 0xFFFFFFFF
+        _U32.pack_into(self.sq, self.sq_tail, tail)
+
+        # The syscall orders our ring writes before the kernel reads them,
+        # and its return orders the completions before our reads
+        n = len(sqes)
+        results = [0] * n
+        reaped = 0
+        try:
+            while reaped < n:
+                _syscall(_SYS_IO_URING_ENTER, self.fd, n if reaped == 0 else 0,
+                         n - reaped, _IORING_ENTER_GETEVENTS, None, 0)
+                head = _U32.unpack_from(self.cq, self.cq_head)[0]
+                cq_tail = _U32.unpack_from(self.cq, self.cq_tail)[0]
+                while head != cq_tail:
+                    user_data, res, _ = _CQE.unpack_from(
+                        self.cq, self.cq_cqes + (head & self.cq_mask) * _CQE_SIZE
+                    )
+                    results[user_data] = res
+                    head = (head + 1) & 0xFFFFFFFF
+                    reaped += 1
+                _U32.pack_into(self.cq, self.cq_head, head)
+        except BaseException:
+            self.close()
+            raise
+
+        return results
+
+    def close(self) -> None:
+        for m in self._maps:
+            m.close()
+        self._maps = []
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self) -> "_Ring":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _stat_result_from_statx(buf, offset: int) -> os.stat_result:
+    """Convert a raw struct statx into an os.stat_result"""
+    (_, blksize, _, nlink, uid, gid, mode, _, ino, size, blocks, _,
+     atime_s, atime_ns, _, _, _, _, ctime_s, ctime_ns, _, mtime_s, mtime_ns, _,
+     rdev_major, rdev_minor, dev_major, dev_minor) = _STATX.unpack_from(buf, offset)
+
+    # Float times are computed the same way os.stat() does
+    return os.stat_result(
+        (mode, ino, os.makedev(dev_major, dev_minor), nlink, uid, gid, size,
+         atime_s, mtime_s, ctime_s),
+        {
+            "st_atime": atime_s + atime_ns * 1e-9,
+            "st_mtime": mtime_s + mtime_ns * 1e-9,
+            "st_ctime": ctime_s + ctime_ns * 1e-9,
+            "st_atime_ns": atime_s * 1_000_000_000 + atime_ns,
+            "st_mtime_ns": mtime_s * 1_000_000_000 + mtime_ns,
+            "st_ctime_ns": ctime_s * 1_000_000_000 + ctime_ns,
+            "st_blksize": blksize,
+            "st_blocks": blocks,
+            "st_rdev": os.makedev(rdev_major, rdev_minor),
+        }
+    )
+
+
+def _encode_names(batch: Sequence[PathLike]):
+    """
+    Pack NUL-terminated path names into one buffer
+
+    Returns:
+        The buffer, which must outlive the submission, and the address of
+        each name in it
+    """
+    encoded = [os.fsencode(p) + b"\0" for p in batch]
+    names = ctypes.create_string_buffer(b"".join(encoded))
+    addresses = []
+    address = ctypes.addressof(names)
+    for name in encoded:
+        addresses.append(address)
+        address += len(name)
+    return names, addresses
+
+
+def batched_statx(paths: Sequence[PathLike]) -> List[os.stat_result]:
+    """
+    Stat many files with batched io_uring statx submissions
+
+    Args:
+        paths: Files to stat (symlinks are followed, as with os.stat)
+
+    Returns:
+        Stat results in the same order as `paths`
+
+    Raises:
+        OSError: If any of the files cannot be stat'ed
+    """
+    if not paths or not _io_uring_supported():
+        return [os.stat(p) for p in paths]
+
+    results: List[os.stat_result] = []
+    with _ring_lock:
+        ring = _shared_ring()
+        for start in range(0, len(paths), ring.entries):
+            batch = paths[start:start + ring.entries]
+
+            # All names share one buffer, as do the statx results; the
+            # kernel reads them, so both outlive the submission
+            names, name_addresses = _encode_names(batch)
+            stats = ctypes.create_string_buffer(_STATX_SIZE * len(batch))
+            stats_addr = ctypes.addressof(stats)
+
+            sqes = [
+                (_IORING_OP_STATX, 0, 0, _AT_FDCWD, stats_addr + i * _STATX_SIZE,
+                 name_address, _STATX_BASIC_STATS, 0, i)
+                for i, name_address in enumerate(name_addresses)
+            ]
+
+            for i, res in enumerate(ring.submit_and_wait(sqes)):
+                if res < 0:
+                    raise OSError(-res, os.strerror(-res), str(batch[i]))
+                results.append(_stat_result_from_statx(stats, i * _STATX_SIZE))
+
+    return results
+
+
+def batched_unlink(paths: Sequence[PathLike]) -> None:
+    """
+    Remove many files with batched io_uring unlinkat submissions
+
+    Every file is attempted; kernels without IORING_OP_UNLINKAT (before
+    5.11) report EINVAL, in which case the file is removed with os.unlink().
+
+    Args:
+        paths: Files to remove
+
+    Raises:
+        OSError: For the first file that could not be removed
+    """
+    if not paths or not _io_uring_supported():
+        for p in paths:
+            os.unlink(p)
+        return
+
+    error = None
+    with _ring_lock:
+        ring = _shared_ring()
+        for start in range(0, len(paths), ring.entries):
+            batch = paths[start:start + ring.entries]
+            names, name_addresses = _encode_names(batch)
+
+            sqes = [
+                (_IORING_OP_UNLINKAT, 0, 0, _AT_FDCWD, 0, name_address, 0, 0, i)
+                for i, name_address in enumerate(name_addresses)
+            ]
+
+            for i, res in enumerate(ring.submit_and_wait(sqes)):
+                try:
+                    if res == -errno.EINVAL:
+                        os.unlink(batch[i])
+                    elif res < 0:
+                        raise OSError(-res, os.strerror(-res), str(batch[i]))
+                except OSError as e:
+                    if error is None:
+                        error = e
+
+    if error is not None:
+        raise error
@@ -0,0 +1,23 @@
+"""
+Galactic Empire - Shared Constants
+
+This module defines enumerations shared between the game engine and the
+services built on it.
+"""
+
+from enum import IntEnum
+
+
+class ShipStatus(IntEnum):
+    """Status of an in-memory ship, as stored in the ship table's status column"""
+    INACTIVE = 0
+    ACTIVE = 1
+    DESTROYED = 2
+    
+    @property
+    def label(self) -> str:
+        """Lowercase name used in API responses"""
+        return _STATUS_LABELS[self]
+
+
+_STATUS_LABELS = tuple(status.name.lower() for status in ShipStatus)
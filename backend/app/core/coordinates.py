@@ -6,8 +6,10 @@ for the Galactic Empire game engine, ported from the original C code.
 """
 
 import math
+from functools import lru_cache
 from typing import Tuple, NamedTuple
 from dataclasses import dataclass
+import numpy as np
 
 
 class Coordinate(NamedTuple):
@@ -16,9 +18,9 @@ class Coordinate(NamedTuple):
     y: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Sector:
-    """Sector coordinates in the galaxy grid"""
+    """Sector coordinates in the galaxy grid (immutable, so results can be shared)"""
     x: int
     y: int
 
@@ -68,6 +70,13 @@ def distance(coord1: Coordinate, coord2: Coordinate) -> float:
     return math.sqrt(dx * dx + dy * dy)
 
 
+def dist_sq(coord1: Coordinate, coord2: Coordinate) -> float:
+    """Calculate the squared distance between two coordinates (for range checks)"""
+    dx = coord1.x - coord2.x
+    dy = coord1.y - coord2.y
+    return dx * dx + dy * dy
+
+
 def vector(coord1: Coordinate, coord2: Coordinate) -> float:
     """Calculate the angle from one coordinate to another"""
     if coord1.x >= coord2.x and coord1.y <= coord2.y:
@@ -140,8 +149,9 @@ def coord2(dcoord: float) -> int:
     return int(fractional_part * SSMAX)
 
 
+@lru_cache(maxsize=4096)
 def get_sector(coord: Coordinate) -> Sector:
-    """Get sector coordinates from a coordinate"""
+    """Get sector coordinates from a coordinate (cached; hub sectors recur)"""
     return Sector(
         x=coord1(coord.x),
         y=coord1(coord.y)
@@ -150,9 +160,7 @@ def get_sector(coord: Coordinate) -> Sector:
 
 def same_sector(coord1: Coordinate, coord2: Coordinate) -> bool:
     """Check if two coordinates are in the same sector"""
-    sector1 = get_sector(coord1)
-    sector2 = get_sector(coord2)
-    return sector1.x == sector2.x and sector1.y == sector2.y
+    return get_sector(coord1) == get_sector(coord2)
 
 
 def move_coord(source: Coordinate, dest: Coordinate) -> Coordinate:
@@ -209,6 +217,22 @@ def calculate_bearing(x1: float, y1: float, x2: float, y2: float) -> float:
     return vector(coord1, coord2)
 
 
+def calculate_bearings(x: float, y: float, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """
+    Calculate bearings from one coordinate point to many (vectorized calculate_bearing)
+    
+    x and y may also be arrays, giving the bearing of each pair of points.
+    Matches vector() exactly, including the fixed angles it gives for points
+    straight above, below or to the right of the origin.
+    """
+    dx = xs - x
+    dy = ys - y
+    angles = np.mod(np.degrees(np.arctan2(dx, -dy)), 360.0)
+    # vector() measures these through a zero angle_b or angle_c
+    angles = np.where(dx == 0, 270.0, angles)
+    return np.where((dx > 0) & (dy == 0), 180.0, angles)
+
+
 def distance_between_coords(coord1: Coordinate, coord2: Coordinate) -> float:
     """Calculate distance between two Coordinate objects"""
     return distance(coord1, coord2)
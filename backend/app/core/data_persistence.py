@@ -5,20 +5,35 @@ Handles database backup, restore, export/import, and data validation
 operations for the game state.
 """
 
+import functools
 import json
+import operator
 import os
 import shutil
+import struct
 import zipfile
 import tempfile
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+import weakref
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 import logging
 from sqlalchemy.orm import Session
-from sqlalchemy import text, inspect
+from sqlalchemy import text, inspect, DateTime
 import psycopg2
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to the json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional dependency; exports are then parsed in full
+    ijson = None
+
+from app.core._uring_stat import batched_statx, batched_unlink
 from app.core.database import engine, SessionLocal
 from app.core.config import settings
 from app.models.base import Base
@@ -26,6 +41,106 @@ from app.models import *
 
 logger = logging.getLogger(__name__)
 
+# Members of a backup archive
+BACKUP_DUMP_MEMBER = "dump.sql"
+BACKUP_METADATA_MEMBER = "metadata.json"
+
+# Backups written before archives were used: a plain SQL dump with its
+# metadata in a <name>_metadata.json file next to it
+LEGACY_BACKUP_SUFFIX = ".sql"
+LEGACY_METADATA_SUFFIX = "_metadata.json"
+
+# Subdirectory of the export directory holding cached export summaries
+EXPORT_SUMMARY_DIR = ".summaries"
+
+# Cached directory listings; the export index is hidden so it is never
+# listed as an export itself
+BACKUP_INDEX_FILE = "index.json"
+EXPORT_INDEX_FILE = ".export_index.json"
+
+# libpq service name used by pg_dump/psql
+PG_SERVICE_NAME = "ge"
+
+# Buffer size for streaming dumps in and out of backup archives
+_COPY_CHUNK_SIZE = 1 << 20
+
+# Fixed part of a zip local file header; the last two fields are the
+# lengths of the file name and extra field that follow it
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+# Tables included in game state exports, keyed by their section in the export file
+_EXPORT_MODELS = {
+    "users": User,
+    "ships": Ship,
+    "planets": Planet,
+    "teams": Team,
+    "communications": Mail,
+}
+
+# Credentials are never written to export files
+_EXPORT_EXCLUDED_COLUMNS = frozenset({"password_hash", "password", "secret"})
+
+# Columns assigned by the database on insert
+_IMPORT_SKIPPED_COLUMNS = frozenset({"id", "created_at", "updated_at"})
+
+# Columns identifying an existing row on import (None means always insert)
+_IMPORT_UNIQUE_KEYS = {
+    "users": ("userid",),
+    "ships": ("user_id", "shipno"),
+    "planets": ("xsect", "ysect", "plnum"),
+    "teams": ("teamcode",),
+    "communications": None,
+}
+
+# Column lists are read from the mappers once at import time; generated
+# columns are left out since the database derives them and rejects inserts
+_EXPORT_COLUMNS = {
+    data_key: tuple(
+        attr.key for attr in inspect(model).column_attrs
+        if attr.key not in _EXPORT_EXCLUDED_COLUMNS and attr.columns[0].computed is None
+    )
+    for data_key, model in _EXPORT_MODELS.items()
+}
+_EXPORT_GETTERS = {
+    data_key: operator.attrgetter(*columns)
+    for data_key, columns in _EXPORT_COLUMNS.items()
+}
+_DATETIME_COLUMNS = {
+    data_key: frozenset(
+        attr.key for attr in inspect(model).column_attrs
+        if isinstance(attr.columns[0].type, DateTime)
+    )
+    for data_key, model in _EXPORT_MODELS.items()
+}
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the json module does not handle natively"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@functools.lru_cache(maxsize=8192)
+def _iso(ts: int) -> str:
+    """ISO format of a whole-second timestamp, memoized for directory listings"""
+    return datetime.fromtimestamp(ts).isoformat()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON document from raw bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to indented JSON bytes"""
+    if orjson is not None:
+        # orjson formats datetimes natively in C
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z)
+    return json.dumps(obj, indent=2, default=_json_default).encode("utf-8")
+
 
 class DataPersistenceService:
     """Service for managing data persistence operations"""
@@ -35,46 +150,89 @@ class DataPersistenceService:
         self.backup_dir.mkdir(exist_ok=True)
         self.export_dir = Path("exports")
         self.export_dir.mkdir(exist_ok=True)
+        self._pg_env: Optional[Dict[str, str]] = None
+    
+    def _get_pg_env(self) -> Dict[str, str]:
+        """
+        Get the environment for pg_dump/psql subprocesses
+        
+        Connection details are written once to a private libpq service file
+        and password file, so the password never appears in the process
+        environment or on the command line.
         
-    def create_backup(self, backup_name: Optional[str] = None, include_data: bool = True) -> Dict[str, Any]:
+        Returns:
+            Environment dict shared by all subprocess calls
+        """
+        if self._pg_env is not None:
+            return self._pg_env
+        
+        # Extract connection details
+        db_url = settings.database_url
+        parts = db_url.replace("postgresql://", "").split("/")
+        db_name = parts[-1]
+        auth_parts = parts[0].split("@")
+        user_pass = auth_parts[0].split(":")
+        username = user_pass[0]
+        password = user_pass[1] if len(user_pass) > 1 else ""
+        host_port = auth_parts[1].split(":")
+        host = host_port[0]
+        port = host_port[1] if len(host_port) > 1 else "5432"
+        
+        # mkdtemp creates the directory readable by this user only; it holds
+        # the password, so it is removed with the service or at exit
+        pg_dir = Path(tempfile.mkdtemp(prefix="ge_pg_"))
+        weakref.finalize(self, shutil.rmtree, pg_dir, ignore_errors=True)
+        service_file = pg_dir / "pg_service.conf"
+        service_file.write_text(
+            f"[{PG_SERVICE_NAME}]\nhost={host}\nport={port}\nuser={username}\ndbname={db_name}\n"
+        )
+        
+        def _pgpass_escape(value: str) -> str:
+            return value.replace("\\", "\\\\").replace(":", "\\:")
+        
+        pgpass_file = pg_dir / "pgpass"
+        fd = os.open(pgpass_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(":".join(_pgpass_escape(v) for v in (host, port, db_name, username, password)) + "\n")
+        
+        self._pg_env = {
+            **os.environ,
+            "PGSERVICEFILE": str(service_file),
+            "PGPASSFILE": str(pgpass_file),
+        }
+        return self._pg_env
+        
+    def create_backup(self, backup_name: Optional[str] = None, include_data: bool = True,
+                      compress: bool = True) -> Dict[str, Any]:
         """
         Create a complete database backup
         
         Args:
             backup_name: Custom name for backup (optional)
             include_data: Whether to include actual data or just schema
+            compress: Whether to deflate the dump; uncompressed backups are
+                      larger but are restored without decompressing, with the
+                      dump spliced straight into psql
             
         Returns:
             Dict with backup information
         """
+        tmp_path = None
         try:
             if not backup_name:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_name = f"ge_backup_{timestamp}"
             
-            backup_path = self.backup_dir / f"{backup_name}.sql"
+            backup_path = self.backup_dir / f"{backup_name}.zip"
+            index_path = self.backup_dir / BACKUP_INDEX_FILE
+            index = self._read_index(index_path, self.backup_dir)
             
-            # Parse database URL to get connection details
             db_url = settings.database_url
             if db_url.startswith("postgresql://"):
-                # Extract connection details
-                parts = db_url.replace("postgresql://", "").split("/")
-                db_name = parts[-1]
-                auth_parts = parts[0].split("@")
-                user_pass = auth_parts[0].split(":")
-                username = user_pass[0]
-                password = user_pass[1] if len(user_pass) > 1 else ""
-                host_port = auth_parts[1].split(":")
-                host = host_port[0]
-                port = host_port[1] if len(host_port) > 1 else "5432"
-                
                 # Use pg_dump to create backup
                 cmd = [
                     "pg_dump",
-                    f"--host={host}",
-                    f"--port={port}",
-                    f"--username={username}",
-                    f"--dbname={db_name}",
+                    f"--dbname=service={PG_SERVICE_NAME}",
                     "--no-password",
                     "--verbose",
                     "--clean",
@@ -87,35 +245,62 @@ class DataPersistenceService:
                 else:
                     cmd.append("--schema-only")
                 
-                # Set password environment variable
-                env = os.environ.copy()
-                env["PGPASSWORD"] = password
+                env = self._get_pg_env()
                 
+                # The archive is written under a hidden temporary name and only
+                # renamed over backup_path once complete, so a failed backup
+                # never replaces or removes an existing one
+                fd, tmp_name = tempfile.mkstemp(prefix=f".{backup_name}.", suffix=".tmp",
+                                                dir=self.backup_dir)
+                os.close(fd)
+                tmp_path = Path(tmp_name)
+                
+                # Stream the dump straight into a single archive; stderr goes
+                # to a temp file so --verbose output cannot block the pipe
                 import subprocess
-                with open(backup_path, 'w') as f:
-                    result = subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, env=env)
+                compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+                with zipfile.ZipFile(tmp_path, "w", compression=compression,
+                                     compresslevel=1) as zf:
+                    with tempfile.TemporaryFile() as err, \
+                            zf.open(BACKUP_DUMP_MEMBER, "w", force_zip64=True) as dump:
+                        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err, env=env)
+                        try:
+                            shutil.copyfileobj(proc.stdout, dump, _COPY_CHUNK_SIZE)
+                        except BaseException:
+                            proc.kill()
+                            raise
+                        finally:
+                            proc.stdout.close()
+                            returncode = proc.wait()
+                        
+                        if returncode != 0:
+                            err.seek(0)
+                            raise Exception(f"pg_dump failed: {err.read().decode()}")
+                    
+                    # Create backup metadata
+                    metadata = {
+                        "backup_name": backup_name,
+                        "backup_path": str(backup_path),
+                        "created_at": datetime.now().isoformat(),
+                        "database_url": db_url,
+                        "include_data": include_data,
+                        "compressed": compress,
+                        "dump_size_bytes": zf.getinfo(BACKUP_DUMP_MEMBER).file_size
+                    }
+                    zf.writestr(BACKUP_METADATA_MEMBER, _dumps(metadata))
                 
-                if result.returncode != 0:
-                    raise Exception(f"pg_dump failed: {result.stderr.decode()}")
+                os.replace(tmp_path, backup_path)
+                tmp_path = None
                 
                 # Get backup size
                 backup_size = backup_path.stat().st_size
+                metadata["backup_size_bytes"] = backup_size
+                metadata["backup_size_mb"] = round(backup_size / (1024 * 1024), 2)
                 
-                # Create backup metadata
-                metadata = {
-                    "backup_name": backup_name,
-                    "backup_path": str(backup_path),
-                    "created_at": datetime.now().isoformat(),
-                    "database_url": db_url,
-                    "include_data": include_data,
-                    "backup_size_bytes": backup_size,
-                    "backup_size_mb": round(backup_size / (1024 * 1024), 2)
-                }
-                
-                # Save metadata
-                metadata_path = self.backup_dir / f"{backup_name}_metadata.json"
-                with open(metadata_path, 'w') as f:
-                    json.dump(metadata, f, indent=2)
+                if index is not None:
+                    index = [b for b in index if b["backup_name"] != backup_name]
+                    index.append(self._backup_entry(backup_path, backup_path.stat()))
+                    self._write_index(index_path, index)
                 
                 logger.info(f"Backup created successfully: {backup_name}")
                 return metadata
@@ -125,6 +310,8 @@ class DataPersistenceService:
                 
         except Exception as e:
             logger.error(f"Failed to create backup: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
             raise
     
     def restore_backup(self, backup_name: str, confirm: bool = False) -> Dict[str, Any]:
@@ -142,50 +329,48 @@ class DataPersistenceService:
             raise Exception("Restore operation requires confirmation")
         
         try:
-            backup_path = self.backup_dir / f"{backup_name}.sql"
-            metadata_path = self.backup_dir / f"{backup_name}_metadata.json"
+            backup_path = self.backup_dir / f"{backup_name}.zip"
+            legacy_path = self.backup_dir / f"{backup_name}{LEGACY_BACKUP_SUFFIX}"
             
-            if not backup_path.exists():
+            if not backup_path.exists() and not legacy_path.exists():
                 raise Exception(f"Backup file not found: {backup_path}")
             
-            # Load metadata
-            metadata = {}
-            if metadata_path.exists():
-                with open(metadata_path, 'r') as f:
-                    metadata = json.load(f)
-            
-            # Parse database URL
             db_url = settings.database_url
-            parts = db_url.replace("postgresql://", "").split("/")
-            db_name = parts[-1]
-            auth_parts = parts[0].split("@")
-            user_pass = auth_parts[0].split(":")
-            username = user_pass[0]
-            password = user_pass[1] if len(user_pass) > 1 else ""
-            host_port = auth_parts[1].split(":")
-            host = host_port[0]
-            port = host_port[1] if len(host_port) > 1 else "5432"
             
             # Use psql to restore backup
             cmd = [
                 "psql",
-                f"--host={host}",
-                f"--port={port}",
-                f"--username={username}",
-                f"--dbname={db_name}",
+                f"--dbname=service={PG_SERVICE_NAME}",
                 "--no-password",
                 "--quiet"
             ]
             
-            env = os.environ.copy()
-            env["PGPASSWORD"] = password
+            env = self._get_pg_env()
             
             import subprocess
-            with open(backup_path, 'r') as f:
-                result = subprocess.run(cmd, stdin=f, stderr=subprocess.PIPE, env=env)
-            
-            if result.returncode != 0:
-                raise Exception(f"Restore failed: {result.stderr.decode()}")
+            if not backup_path.exists():
+                # Legacy plain dump; psql reads the file directly
+                metadata = self._read_legacy_metadata(legacy_path)
+                with open(legacy_path, "rb") as dump:
+                    result = subprocess.run(cmd, stdin=dump, stderr=subprocess.PIPE, env=env)
+                
+                if result.returncode != 0:
+                    raise Exception(f"Restore failed: {result.stderr.decode()}")
+            else:
+                with zipfile.ZipFile(backup_path) as zf:
+                    metadata = self._read_backup_metadata(zf)
+                    
+                    with tempfile.TemporaryFile() as err:
+                        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=err, env=env)
+                        try:
+                            self._copy_dump(zf, backup_path, proc.stdin)
+                        finally:
+                            proc.stdin.close()
+                        returncode = proc.wait()
+                        
+                        if returncode != 0:
+                            err.seek(0)
+                            raise Exception(f"Restore failed: {err.read().decode()}")
             
             restore_info = {
                 "backup_name": backup_name,
@@ -201,6 +386,60 @@ class DataPersistenceService:
             logger.error(f"Failed to restore backup: {e}")
             raise
     
+    def _copy_dump(self, zf: zipfile.ZipFile, backup_path: Path, out) -> None:
+        """
+        Copy the SQL dump of a backup archive into a writable pipe
+        
+        Uncompressed members (create_backup with compress=False) are moved
+        with os.splice() straight from the archive file to the pipe where the
+        platform supports it, so the bytes never pass through Python.
+        Deflated members are decompressed and copied in chunks.
+        
+        Args:
+            zf: Open backup archive
+            backup_path: Path of the archive on disk
+            out: Binary file object wrapping the destination pipe
+        """
+        info = zf.getinfo(BACKUP_DUMP_MEMBER)
+        
+        if info.compress_type == zipfile.ZIP_STORED and hasattr(os, "splice"):
+            fd_in = os.open(backup_path, os.O_RDONLY)
+            try:
+                # Member data starts after the local file header and its variable fields
+                header = os.pread(fd_in, _ZIP_LOCAL_HEADER.size, info.header_offset)
+                fields = _ZIP_LOCAL_HEADER.unpack(header)
+                offset = info.header_offset + _ZIP_LOCAL_HEADER.size + fields[-2] + fields[-1]
+                remaining = info.file_size
+                
+                out.flush()
+                while remaining:
+                    n = os.splice(fd_in, out.fileno(), min(remaining, _COPY_CHUNK_SIZE),
+                                  offset_src=offset)
+                    if n == 0:
+                        raise Exception("Backup archive truncated")
+                    offset += n
+                    remaining -= n
+            finally:
+                os.close(fd_in)
+            return
+        
+        with zf.open(BACKUP_DUMP_MEMBER) as dump:
+            shutil.copyfileobj(dump, out, _COPY_CHUNK_SIZE)
+    
+    def _read_backup_metadata(self, zf: zipfile.ZipFile) -> Dict[str, Any]:
+        """Read the metadata stored alongside the dump in a backup archive"""
+        if BACKUP_METADATA_MEMBER not in zf.namelist():
+            return {}
+        return _loads(zf.read(BACKUP_METADATA_MEMBER))
+    
+    def _read_legacy_metadata(self, backup_file: Path) -> Dict[str, Any]:
+        """Read the metadata file of a legacy plain SQL backup"""
+        metadata_file = backup_file.with_name(f"{backup_file.stem}{LEGACY_METADATA_SUFFIX}")
+        try:
+            return _loads(metadata_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+    
     def export_game_state(self, export_name: Optional[str] = None, 
                          include_users: bool = True,
                          include_ships: bool = True,
@@ -222,18 +461,22 @@ class DataPersistenceService:
             Dict with export information
         """
         try:
+            now = datetime.now()
+            exported_at = now.isoformat()
             if not export_name:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 export_name = f"ge_export_{timestamp}"
             
             export_path = self.export_dir / f"{export_name}.json"
+            index_path = self.export_dir / EXPORT_INDEX_FILE
+            index = self._read_index(index_path, self.export_dir)
             
             db = SessionLocal()
             try:
                 export_data = {
                     "export_info": {
                         "export_name": export_name,
-                        "exported_at": datetime.now().isoformat(),
+                        "exported_at": exported_at,
                         "game_version": "1.0.0",
                         "database_url": settings.database_url,
                         "includes": {
@@ -247,123 +490,42 @@ class DataPersistenceService:
                     "data": {}
                 }
                 
-                # Export users
-                if include_users:
-                    users = db.query(User).all()
-                    export_data["data"]["users"] = [
-                        {
-                            "id": user.id,
-                            "userid": user.userid,
-                            "email": user.email,
-                            "score": user.score,
-                            "kills": user.kills,
-                            "planets": user.planets,
-                            "cash": user.cash,
-                            "debt": user.debt,
-                            "teamcode": user.teamcode,
-                            "created_at": user.created_at.isoformat() if user.created_at else None,
-                            "last_login": user.last_login.isoformat() if user.last_login else None
-                        }
-                        for user in users
-                    ]
-                
-                # Export ships
-                if include_ships:
-                    ships = db.query(Ship).all()
-                    export_data["data"]["ships"] = [
-                        {
-                            "id": ship.id,
-                            "shipno": ship.shipno,
-                            "userid": ship.userid,
-                            "shipname": ship.shipname,
-                            "class_number": ship.class_number,
-                            "x_coord": ship.x_coord,
-                            "y_coord": ship.y_coord,
-                            "xsect": ship.xsect,
-                            "ysect": ship.ysect,
-                            "energy": ship.energy,
-                            "max_energy": ship.max_energy,
-                            "shields": ship.shields,
-                            "max_shields": ship.max_shields,
-                            "cargo": ship.cargo,
-                            "max_cargo": ship.max_cargo,
-                            "created_at": ship.created_at.isoformat() if ship.created_at else None
-                        }
-                        for ship in ships
-                    ]
-                
-                # Export planets
-                if include_planets:
-                    planets = db.query(Planet).all()
-                    export_data["data"]["planets"] = [
-                        {
-                            "id": planet.id,
-                            "planetno": planet.planetno,
-                            "planetname": planet.planetname,
-                            "xsect": planet.xsect,
-                            "ysect": planet.ysect,
-                            "x_coord": planet.x_coord,
-                            "y_coord": planet.y_coord,
-                            "owner": planet.owner,
-                            "population": planet.population,
-                            "max_population": planet.max_population,
-                            "environment": planet.environment,
-                            "created_at": planet.created_at.isoformat() if planet.created_at else None
-                        }
-                        for planet in planets
-                    ]
-                
-                # Export teams
-                if include_teams:
-                    teams = db.query(Team).all()
-                    export_data["data"]["teams"] = [
-                        {
-                            "id": team.id,
-                            "teamname": team.teamname,
-                            "teamcode": team.teamcode,
-                            "teamcount": team.teamcount,
-                            "teamscore": team.teamscore,
-                            "created_at": team.created_at.isoformat() if team.created_at else None
-                        }
-                        for team in teams
-                    ]
-                
-                # Export communications
-                if include_communications:
-                    mails = db.query(Mail).all()
-                    export_data["data"]["communications"] = [
-                        {
-                            "id": mail.id,
-                            "from_user": mail.from_user,
-                            "to_user": mail.to_user,
-                            "subject": mail.subject,
-                            "message": mail.message,
-                            "is_read": mail.is_read,
-                            "created_at": mail.created_at.isoformat() if mail.created_at else None
-                        }
-                        for mail in mails
-                    ]
+                # Export each requested table
+                includes = export_data["export_info"]["includes"]
+                for data_key in _EXPORT_MODELS:
+                    if includes[data_key]:
+                        export_data["data"][data_key] = self._export_rows(db, data_key)
                 
                 # Write export file
-                with open(export_path, 'w') as f:
-                    json.dump(export_data, f, indent=2)
+                export_path.write_bytes(_dumps(export_data))
                 
                 # Get export size
-                export_size = export_path.stat().st_size
+                export_stat = export_path.stat()
+                export_size = export_stat.st_size
+                
+                record_counts = {
+                    data_key: len(export_data["data"].get(data_key, []))
+                    for data_key in _EXPORT_MODELS
+                }
+                self._write_export_summary(export_path, {
+                    "export_info": export_data["export_info"],
+                    "record_counts": record_counts
+                }, export_stat)
+                
+                # Overwriting an existing export leaves the directory mtime
+                # unchanged, so the index entry is always replaced here
+                if index is not None:
+                    index = [e for e in index if e["export_name"] != export_name]
+                    index.append(self._export_entry(export_path, export_stat))
+                    self._write_index(index_path, index)
                 
                 export_info = {
                     "export_name": export_name,
                     "export_path": str(export_path),
-                    "exported_at": datetime.now().isoformat(),
+                    "exported_at": exported_at,
                     "export_size_bytes": export_size,
                     "export_size_mb": round(export_size / (1024 * 1024), 2),
-                    "record_counts": {
-                        "users": len(export_data["data"].get("users", [])),
-                        "ships": len(export_data["data"].get("ships", [])),
-                        "planets": len(export_data["data"].get("planets", [])),
-                        "teams": len(export_data["data"].get("teams", [])),
-                        "communications": len(export_data["data"].get("communications", []))
-                    }
+                    "record_counts": record_counts
                 }
                 
                 logger.info(f"Game state exported successfully: {export_name}")
@@ -397,8 +559,7 @@ class DataPersistenceService:
                 raise Exception(f"Export file not found: {export_path}")
             
             # Load export data
-            with open(export_path, 'r') as f:
-                export_data = json.load(f)
+            export_data = _loads(export_path.read_bytes())
             
             db = SessionLocal()
             try:
@@ -409,133 +570,12 @@ class DataPersistenceService:
                     "errors": []
                 }
                 
-                # Import users
-                if "users" in export_data["data"]:
-                    user_count = 0
-                    for user_data in export_data["data"]["users"]:
-                        try:
-                            # Check if user already exists
-                            existing_user = db.query(User).filter(User.userid == user_data["userid"]).first()
-                            if not existing_user:
-                                user = User(
-                                    userid=user_data["userid"],
-                                    email=user_data["email"],
-                                    score=user_data.get("score", 0),
-                                    kills=user_data.get("kills", 0),
-                                    planets=user_data.get("planets", 0),
-                                    cash=user_data.get("cash", 0),
-                                    debt=user_data.get("debt", 0),
-                                    teamcode=user_data.get("teamcode", 0)
-                                )
-                                db.add(user)
-                                user_count += 1
-                        except Exception as e:
-                            import_info["errors"].append(f"User {user_data.get('userid', 'unknown')}: {str(e)}")
-                    
-                    db.commit()
-                    import_info["imported_records"]["users"] = user_count
-                
-                # Import ships
-                if "ships" in export_data["data"]:
-                    ship_count = 0
-                    for ship_data in export_data["data"]["ships"]:
-                        try:
-                            # Check if ship already exists
-                            existing_ship = db.query(Ship).filter(Ship.shipno == ship_data["shipno"]).first()
-                            if not existing_ship:
-                                ship = Ship(
-                                    shipno=ship_data["shipno"],
-                                    userid=ship_data["userid"],
-                                    shipname=ship_data["shipname"],
-                                    class_number=ship_data["class_number"],
-                                    x_coord=ship_data["x_coord"],
-                                    y_coord=ship_data["y_coord"],
-                                    xsect=ship_data["xsect"],
-                                    ysect=ship_data["ysect"],
-                                    energy=ship_data.get("energy", 100),
-                                    max_energy=ship_data.get("max_energy", 100),
-                                    shields=ship_data.get("shields", 0),
-                                    max_shields=ship_data.get("max_shields", 0),
-                                    cargo=ship_data.get("cargo", 0),
-                                    max_cargo=ship_data.get("max_cargo", 0)
-                                )
-                                db.add(ship)
-                                ship_count += 1
-                        except Exception as e:
-                            import_info["errors"].append(f"Ship {ship_data.get('shipno', 'unknown')}: {str(e)}")
-                    
-                    db.commit()
-                    import_info["imported_records"]["ships"] = ship_count
-                
-                # Import planets
-                if "planets" in export_data["data"]:
-                    planet_count = 0
-                    for planet_data in export_data["data"]["planets"]:
-                        try:
-                            # Check if planet already exists
-                            existing_planet = db.query(Planet).filter(Planet.planetno == planet_data["planetno"]).first()
-                            if not existing_planet:
-                                planet = Planet(
-                                    planetno=planet_data["planetno"],
-                                    planetname=planet_data["planetname"],
-                                    xsect=planet_data["xsect"],
-                                    ysect=planet_data["ysect"],
-                                    x_coord=planet_data["x_coord"],
-                                    y_coord=planet_data["y_coord"],
-                                    owner=planet_data.get("owner", ""),
-                                    population=planet_data.get("population", 0),
-                                    max_population=planet_data.get("max_population", 1000),
-                                    environment=planet_data.get("environment", 0)
-                                )
-                                db.add(planet)
-                                planet_count += 1
-                        except Exception as e:
-                            import_info["errors"].append(f"Planet {planet_data.get('planetno', 'unknown')}: {str(e)}")
-                    
-                    db.commit()
-                    import_info["imported_records"]["planets"] = planet_count
-                
-                # Import teams
-                if "teams" in export_data["data"]:
-                    team_count = 0
-                    for team_data in export_data["data"]["teams"]:
-                        try:
-                            # Check if team already exists
-                            existing_team = db.query(Team).filter(Team.teamcode == team_data["teamcode"]).first()
-                            if not existing_team:
-                                team = Team(
-                                    teamname=team_data["teamname"],
-                                    teamcode=team_data["teamcode"],
-                                    teamcount=team_data.get("teamcount", 0),
-                                    teamscore=team_data.get("teamscore", 0)
-                                )
-                                db.add(team)
-                                team_count += 1
-                        except Exception as e:
-                            import_info["errors"].append(f"Team {team_data.get('teamname', 'unknown')}: {str(e)}")
-                    
-                    db.commit()
-                    import_info["imported_records"]["teams"] = team_count
-                
-                # Import communications
-                if "communications" in export_data["data"]:
-                    comm_count = 0
-                    for comm_data in export_data["data"]["communications"]:
-                        try:
-                            mail = Mail(
-                                from_user=comm_data["from_user"],
-                                to_user=comm_data["to_user"],
-                                subject=comm_data["subject"],
-                                message=comm_data["message"],
-                                is_read=comm_data.get("is_read", False)
-                            )
-                            db.add(mail)
-                            comm_count += 1
-                        except Exception as e:
-                            import_info["errors"].append(f"Communication {comm_data.get('id', 'unknown')}: {str(e)}")
-                    
-                    db.commit()
-                    import_info["imported_records"]["communications"] = comm_count
+                # Import each table present in the export
+                for data_key in _EXPORT_MODELS:
+                    if data_key in export_data["data"]:
+                        import_info["imported_records"][data_key] = self._import_rows(
+                            db, data_key, export_data["data"][data_key], import_info["errors"]
+                        )
                 
                 logger.info(f"Game state imported successfully: {export_name}")
                 return import_info
@@ -547,6 +587,55 @@ class DataPersistenceService:
             logger.error(f"Failed to import game state: {e}")
             raise
     
+    def _export_rows(self, db: Session, data_key: str) -> List[Dict[str, Any]]:
+        """Serialize every row of an exported table into plain dicts"""
+        model = _EXPORT_MODELS[data_key]
+        columns = _EXPORT_COLUMNS[data_key]
+        getter = _EXPORT_GETTERS[data_key]
+        return [dict(zip(columns, getter(row))) for row in db.query(model).all()]
+    
+    def _import_rows(self, db: Session, data_key: str, rows: List[Dict[str, Any]],
+                     errors: List[str]) -> int:
+        """
+        Insert exported rows that are not already present in the database
+        
+        Args:
+            db: Database session
+            data_key: Export section being imported
+            rows: Serialized rows from the export file
+            errors: List collecting per-row error messages
+            
+        Returns:
+            Number of rows imported
+        """
+        model = _EXPORT_MODELS[data_key]
+        columns = [c for c in _EXPORT_COLUMNS[data_key] if c not in _IMPORT_SKIPPED_COLUMNS]
+        datetime_columns = _DATETIME_COLUMNS[data_key]
+        unique_key = _IMPORT_UNIQUE_KEYS[data_key]
+        count = 0
+        
+        for row_data in rows:
+            try:
+                if unique_key:
+                    existing = db.query(model).filter_by(
+                        **{c: row_data[c] for c in unique_key}
+                    ).first()
+                    if existing:
+                        continue
+                
+                values = {c: row_data[c] for c in columns if c in row_data}
+                for c in datetime_columns.intersection(values):
+                    if values[c] is not None:
+                        values[c] = datetime.fromisoformat(values[c])
+                
+                db.add(model(**values))
+                count += 1
+            except Exception as e:
+                errors.append(f"{model.__name__} {row_data.get('id', 'unknown')}: {str(e)}")
+        
+        db.commit()
+        return count
+    
     def validate_data_integrity(self) -> Dict[str, Any]:
         """
         Validate database integrity and consistency
@@ -698,33 +787,16 @@ class DataPersistenceService:
     def get_backup_list(self) -> List[Dict[str, Any]]:
         """Get list of available backups"""
         try:
-            backups = []
-            
-            for backup_file in self.backup_dir.glob("*.sql"):
-                backup_name = backup_file.stem
-                metadata_file = self.backup_dir / f"{backup_name}_metadata.json"
-                
-                backup_info = {
-                    "backup_name": backup_name,
-                    "backup_path": str(backup_file),
-                    "created_at": datetime.fromtimestamp(backup_file.stat().st_mtime).isoformat(),
-                    "backup_size_bytes": backup_file.stat().st_size,
-                    "backup_size_mb": round(backup_file.stat().st_size / (1024 * 1024), 2)
-                }
-                
-                # Load metadata if available
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r') as f:
-                            metadata = json.load(f)
-                        backup_info.update(metadata)
-                    except Exception as e:
-                        logger.warning(f"Failed to load metadata for {backup_name}: {e}")
-                
-                backups.append(backup_info)
+            index_path = self.backup_dir / BACKUP_INDEX_FILE
+            backups = self._read_index(index_path, self.backup_dir)
+            if backups is not None:
+                return backups
             
-            # Sort by creation time (newest first)
-            backups.sort(key=lambda x: x["created_at"], reverse=True)
+            backups = [
+                self._backup_entry(backup_file, st)
+                for backup_file, st in self._scan_dir(self.backup_dir, (".zip", LEGACY_BACKUP_SUFFIX))
+            ]
+            self._write_index(index_path, backups)
             
             return backups
             
@@ -735,43 +807,16 @@ class DataPersistenceService:
     def get_export_list(self) -> List[Dict[str, Any]]:
         """Get list of available exports"""
         try:
-            exports = []
+            index_path = self.export_dir / EXPORT_INDEX_FILE
+            exports = self._read_index(index_path, self.export_dir)
+            if exports is not None:
+                return exports
             
-            for export_file in self.export_dir.glob("*.json"):
-                export_name = export_file.stem
-                
-                export_info = {
-                    "export_name": export_name,
-                    "export_path": str(export_file),
-                    "created_at": datetime.fromtimestamp(export_file.stat().st_mtime).isoformat(),
-                    "export_size_bytes": export_file.stat().st_size,
-                    "export_size_mb": round(export_file.stat().st_size / (1024 * 1024), 2)
-                }
-                
-                # Try to load export metadata
-                try:
-                    with open(export_file, 'r') as f:
-                        export_data = json.load(f)
-                    
-                    if "export_info" in export_data:
-                        export_info.update(export_data["export_info"])
-                    
-                    if "data" in export_data:
-                        export_info["record_counts"] = {
-                            "users": len(export_data["data"].get("users", [])),
-                            "ships": len(export_data["data"].get("ships", [])),
-                            "planets": len(export_data["data"].get("planets", [])),
-                            "teams": len(export_data["data"].get("teams", [])),
-                            "communications": len(export_data["data"].get("communications", []))
-                        }
-                
-                except Exception as e:
-                    logger.warning(f"Failed to load export metadata for {export_name}: {e}")
-                
-                exports.append(export_info)
-            
-            # Sort by creation time (newest first)
-            exports.sort(key=lambda x: x["created_at"], reverse=True)
+            exports = [
+                self._export_entry(export_file, st)
+                for export_file, st in self._scan_dir(self.export_dir, ".json")
+            ]
+            self._write_index(index_path, exports)
             
             return exports
             
@@ -779,6 +824,190 @@ class DataPersistenceService:
             logger.error(f"Failed to get export list: {e}")
             raise
     
+    def _backup_entry(self, backup_file: Path, st: os.stat_result) -> Dict[str, Any]:
+        """Build the backup list entry for a backup archive"""
+        backup_name = backup_file.stem
+        
+        backup_info = {
+            "backup_name": backup_name,
+            "backup_path": str(backup_file),
+            "created_at": _iso(int(st.st_mtime)),
+            "backup_size_bytes": st.st_size,
+            "backup_size_mb": round(st.st_size / (1024 * 1024), 2)
+        }
+        
+        # Load metadata if available
+        try:
+            if backup_file.suffix == LEGACY_BACKUP_SUFFIX:
+                backup_info.update(self._read_legacy_metadata(backup_file))
+            else:
+                with zipfile.ZipFile(backup_file) as zf:
+                    backup_info.update(self._read_backup_metadata(zf))
+        except Exception as e:
+            logger.warning(f"Failed to load metadata for {backup_name}: {e}")
+        
+        return backup_info
+    
+    def _export_entry(self, export_file: Path, st: os.stat_result) -> Dict[str, Any]:
+        """Build the export list entry for an export file"""
+        export_name = export_file.stem
+        
+        export_info = {
+            "export_name": export_name,
+            "export_path": str(export_file),
+            "created_at": _iso(int(st.st_mtime)),
+            "export_size_bytes": st.st_size,
+            "export_size_mb": round(st.st_size / (1024 * 1024), 2)
+        }
+        
+        # Try to load export metadata
+        try:
+            summary = self._get_export_summary(export_file, st)
+            
+            if summary["export_info"] is not None:
+                export_info.update(summary["export_info"])
+            
+            if summary["record_counts"] is not None:
+                export_info["record_counts"] = summary["record_counts"]
+        
+        except Exception as e:
+            logger.warning(f"Failed to load export metadata for {export_name}: {e}")
+        
+        return export_info
+    
+    def _read_index(self, index_path: Path, directory: Path) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read a cached directory listing
+        
+        The index is only trusted while it is strictly newer than the
+        directory, i.e. no file has been added, removed or renamed in the
+        directory since the index was written.
+        
+        Returns:
+            The cached list, or None if it is missing or stale
+        """
+        try:
+            if os.stat(directory).st_mtime_ns < index_path.stat().st_mtime_ns:
+                return _loads(index_path.read_bytes())
+        except (OSError, ValueError):
+            pass
+        return None
+    
+    def _write_index(self, index_path: Path, entries: List[Dict[str, Any]]) -> None:
+        """Sort a directory listing (newest first) and store it as the cached index"""
+        entries.sort(key=lambda x: x["created_at"], reverse=True)
+        
+        # The file is rewritten in place rather than replaced, so writing the
+        # index does not itself bump the directory mtime
+        try:
+            index_path.write_bytes(_dumps(entries))
+        except OSError as e:
+            logger.warning(f"Failed to write listing index {index_path}: {e}")
+    
+    def _scan_dir(self, directory: Path,
+                  suffix: Union[str, Tuple[str, ...]]) -> List[Tuple[Path, os.stat_result]]:
+        """
+        List the (non-hidden) files in a directory with the given suffix(es)
+        
+        File names come from one os.scandir() pass; the stat calls for all
+        matches are then submitted to the kernel as a single io_uring batch
+        (falling back to os.stat() where io_uring is unavailable).
+        
+        Returns:
+            List of (path, stat result) tuples
+        """
+        with os.scandir(directory) as entries:
+            paths = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(suffix) and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+        return list(zip(paths, batched_statx(paths)))
+    
+    def _get_export_summary(self, export_file: Path,
+                            st: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """
+        Get the export_info block and per-table record counts of an export
+        
+        Summaries are cached in a sidecar file keyed on the export's size and
+        modification time, so an unchanged export is only parsed once.
+        
+        Args:
+            export_file: Path of the export file
+            st: Stat result of the export file, if already known
+            
+        Returns:
+            Dict with export_info and record_counts (either may be None)
+        """
+        if st is None:
+            st = export_file.stat()
+        summary_path = self.export_dir / EXPORT_SUMMARY_DIR / export_file.name
+        
+        try:
+            summary = _loads(summary_path.read_bytes())
+            if summary.get("mtime_ns") == st.st_mtime_ns and summary.get("size") == st.st_size:
+                return summary
+        except (OSError, ValueError):
+            pass
+        
+        summary = self._scan_export(export_file)
+        self._write_export_summary(export_file, summary, st)
+        return summary
+    
+    def _write_export_summary(self, export_file: Path, summary: Dict[str, Any],
+                              st: Optional[os.stat_result] = None) -> None:
+        """Store an export summary in its sidecar file"""
+        if st is None:
+            st = export_file.stat()
+        summary_path = self.export_dir / EXPORT_SUMMARY_DIR / export_file.name
+        summary_path.parent.mkdir(exist_ok=True)
+        summary_path.write_bytes(_dumps({
+            **summary,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size
+        }))
+    
+    def _scan_export(self, export_file: Path) -> Dict[str, Any]:
+        """
+        Parse the export_info block and count the records of an export
+        
+        With ijson the file is parsed as an event stream in a single pass, so
+        memory use stays constant and no record dicts are built.
+        """
+        if ijson is None:
+            export_data = _loads(export_file.read_bytes())
+            record_counts = None
+            if "data" in export_data:
+                record_counts = {
+                    data_key: len(export_data["data"].get(data_key, []))
+                    for data_key in _EXPORT_MODELS
+                }
+            return {"export_info": export_data.get("export_info"), "record_counts": record_counts}
+        
+        item_prefixes = {f"data.{data_key}.item": data_key for data_key in _EXPORT_MODELS}
+        export_info = None
+        record_counts = None
+        builder = None
+        
+        with open(export_file, "rb") as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == "export_info" and event == "end_map":
+                        export_info = builder.value
+                        builder = None
+                elif event == "start_map":
+                    if prefix in item_prefixes:
+                        record_counts[item_prefixes[prefix]] += 1
+                    elif prefix == "export_info":
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix == "data":
+                        record_counts = dict.fromkeys(_EXPORT_MODELS, 0)
+        
+        return {"export_info": export_info, "record_counts": record_counts}
+    
     def cleanup_old_backups(self, days_to_keep: int = 30) -> Dict[str, Any]:
         """
         Clean up old backup files
@@ -790,23 +1019,36 @@ class DataPersistenceService:
             Dict with cleanup information
         """
         try:
-            cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+            cutoff_time = (datetime.now() - timedelta(days=days_to_keep)).timestamp()
             deleted_files = []
+            deleted_names = set()
             total_size_freed = 0
             
-            for backup_file in self.backup_dir.glob("*.sql"):
-                file_time = datetime.fromtimestamp(backup_file.stat().st_mtime)
-                
-                if file_time < cutoff_date:
-                    file_size = backup_file.stat().st_size
-                    backup_file.unlink()
-                    deleted_files.append(str(backup_file))
-                    total_size_freed += file_size
-                    
-                    # Also delete metadata file if it exists
-                    metadata_file = self.backup_dir / f"{backup_file.stem}_metadata.json"
-                    if metadata_file.exists():
-                        metadata_file.unlink()
+            # The index must be read before any unlink bumps the directory mtime
+            index_path = self.backup_dir / BACKUP_INDEX_FILE
+            index = self._read_index(index_path, self.backup_dir)
+            
+            expired = [
+                (backup_file, st)
+                for backup_file, st in self._scan_dir(self.backup_dir, (".zip", LEGACY_BACKUP_SUFFIX))
+                if st.st_mtime < cutoff_time
+            ]
+            batched_unlink([backup_file for backup_file, _ in expired])
+            
+            # Legacy backups keep their metadata in a separate file
+            for backup_file, _ in expired:
+                if backup_file.suffix == LEGACY_BACKUP_SUFFIX:
+                    backup_file.with_name(f"{backup_file.stem}{LEGACY_METADATA_SUFFIX}").unlink(missing_ok=True)
+            
+            for backup_file, st in expired:
+                deleted_files.append(str(backup_file))
+                deleted_names.add(backup_file.stem)
+                total_size_freed += st.st_size
+            
+            if index is not None and deleted_names:
+                self._write_index(index_path, [
+                    b for b in index if b["backup_name"] not in deleted_names
+                ])
             
             cleanup_info = {
                 "cleaned_at": datetime.now().isoformat(),
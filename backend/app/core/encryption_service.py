@@ -7,19 +7,43 @@ for sensitive information in the Galactic Empire game.
 
 import base64
 import hashlib
+import hmac
+import json
+import os
+import re
 import secrets
 import time
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from ..core.config import settings
 
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to the json module
+    orjson = None
+
+# PBKDF2 iterations for deriving the encryption key; can be lowered through
+# GE_PBKDF2_ITERS for tests and development, where derivation dominates startup
+KEY_DERIVATION_ITERATIONS = int(os.environ.get("GE_PBKDF2_ITERS", 100000))
+
+# Derived encryption keys by (secret, salt, iterations), shared by all
+# service instances in the process
+_key_cache: Dict[Tuple[bytes, bytes, int], bytes] = {}
+
 
 class EncryptionService:
     """Service for encrypting and decrypting sensitive data"""
     
+    # Field names containing any of these words (case-insensitive) hold sensitive data;
+    # api_key, private_key, session_token and refresh_token are covered by key/token
+    _SENSITIVE_FIELD_RE = re.compile(r'password|token|secret|key', re.IGNORECASE)
+    
+    # Fernet tokens start with the version byte 0x80, i.e. "gA" in base64; legacy
+    # values, which wrapped the token in another base64 layer, start with "Z0"
+    _FERNET_TOKEN_PREFIX = "gA"
+    
     def __init__(self):
         # Generate or use existing encryption key
         self.encryption_key = self._get_or_create_encryption_key()
@@ -38,36 +62,45 @@ class EncryptionService:
         password = secret_key.encode()
         salt = b'galactic_empire_salt'  # In production, use a random salt stored securely
         
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password))
+        cache_key = (password, salt, KEY_DERIVATION_ITERATIONS)
+        key = _key_cache.get(cache_key)
+        if key is None:
+            key = base64.urlsafe_b64encode(
+                hashlib.pbkdf2_hmac('sha256', password, salt, KEY_DERIVATION_ITERATIONS, 32)
+            )
+            _key_cache[cache_key] = key
         return key
     
+    def _encrypt_bytes(self, data: bytes) -> str:
+        """Encrypt raw bytes and return the Fernet token (already urlsafe base64)"""
+        return self.fernet.encrypt(data).decode('ascii')
+    
+    def _decrypt_bytes(self, encrypted_text: str) -> bytes:
+        """Decrypt a Fernet token, or a legacy base64 encoded token, to raw bytes"""
+        encrypted_bytes = encrypted_text.encode('ascii')
+        if not encrypted_text.startswith(self._FERNET_TOKEN_PREFIX):
+            # Values stored before tokens were kept unwrapped
+            encrypted_bytes = base64.urlsafe_b64decode(encrypted_bytes)
+        return self.fernet.decrypt(encrypted_bytes)
+    
     def encrypt_string(self, plaintext: str) -> str:
-        """Encrypt a string and return base64 encoded result"""
+        """Encrypt a string and return the urlsafe base64 encoded token"""
         if not plaintext:
             return ""
         
         try:
-            encrypted_bytes = self.fernet.encrypt(plaintext.encode('utf-8'))
-            return base64.urlsafe_b64encode(encrypted_bytes).decode('utf-8')
+            return self._encrypt_bytes(plaintext.encode('utf-8'))
         except Exception:
             # If encryption fails, return empty string (don't expose errors)
             return ""
     
     def decrypt_string(self, encrypted_text: str) -> str:
-        """Decrypt a base64 encoded encrypted string"""
+        """Decrypt an encrypted string"""
         if not encrypted_text:
             return ""
         
         try:
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_text.encode('utf-8'))
-            decrypted_bytes = self.fernet.decrypt(encrypted_bytes)
-            return decrypted_bytes.decode('utf-8')
+            return self._decrypt_bytes(encrypted_text).decode('utf-8')
         except Exception:
             # If decryption fails, return empty string (don't expose errors)
             return ""
@@ -78,9 +111,12 @@ class EncryptionService:
             return ""
         
         try:
-            import json
-            json_string = json.dumps(data, sort_keys=True)
-            return self.encrypt_string(json_string)
+            if orjson is not None:
+                # orjson produces bytes, so no separate UTF-8 encode step
+                json_bytes = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            else:
+                json_bytes = json.dumps(data, sort_keys=True).encode('utf-8')
+            return self._encrypt_bytes(json_bytes)
         except Exception:
             return ""
     
@@ -90,10 +126,11 @@ class EncryptionService:
             return {}
         
         try:
-            import json
-            json_string = self.decrypt_string(encrypted_text)
-            if json_string:
-                return json.loads(json_string)
+            json_bytes = self._decrypt_bytes(encrypted_text)
+            if json_bytes:
+                if orjson is not None:
+                    return orjson.loads(json_bytes)
+                return json.loads(json_bytes)
         except Exception:
             pass
         
@@ -104,27 +141,46 @@ class EncryptionService:
         if not salt:
             salt = secrets.token_urlsafe(32)
         
-        # Use PBKDF2 for password hashing
-        password_bytes = password.encode('utf-8')
-        salt_bytes = salt.encode('utf-8')
+        password_hash = self._derive_password_hash(password.encode('utf-8'), salt.encode('utf-8'))
+        return password_hash, salt
+    
+    def hash_password_batch(self, passwords: List[str], salt: str) -> List[str]:
+        """
+        Hash many passwords with the same salt
         
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt_bytes,
-            iterations=100000,
-        )
+        hashlib.pbkdf2_hmac releases the GIL, so the hashes are computed in
+        parallel on a thread pool sized to the available CPUs.
         
-        hash_bytes = kdf.derive(password_bytes)
-        password_hash = base64.urlsafe_b64encode(hash_bytes).decode('utf-8')
+        Args:
+            passwords: Passwords to hash
+            salt: Salt shared by all of them
+            
+        Returns:
+            Password hashes, in the same order as `passwords`
+        """
+        if not passwords:
+            return []
         
-        return password_hash, salt
+        salt_bytes = salt.encode('utf-8')
+        workers = min(len(passwords), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda password: self._derive_password_hash(password.encode('utf-8'), salt_bytes),
+                passwords
+            ))
+    
+    def _derive_password_hash(self, password_bytes: bytes, salt_bytes: bytes) -> str:
+        """Compute the base64 encoded PBKDF2 hash of a password"""
+        # Use PBKDF2 for password hashing (OpenSSL's implementation via hashlib)
+        hash_bytes = hashlib.pbkdf2_hmac('sha256', password_bytes, salt_bytes, 100000, 32)
+        return base64.urlsafe_b64encode(hash_bytes).decode('utf-8')
     
     def verify_password(self, password: str, password_hash: str, salt: str) -> bool:
         """Verify a password against its hash"""
         try:
-            computed_hash, _ = self.hash_password(password, salt)
-            return computed_hash == password_hash
+            computed_hash = self._derive_password_hash(password.encode('utf-8'), salt.encode('utf-8'))
+            # Constant-time comparison so the check does not leak how much of the hash matched
+            return hmac.compare_digest(computed_hash.encode('utf-8'), password_hash.encode('utf-8'))
         except Exception:
             return False
     
@@ -150,36 +206,30 @@ class EncryptionService:
         return hashlib.sha256(api_key.encode()).hexdigest()
     
     def encrypt_sensitive_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Encrypt sensitive fields in a data dictionary"""
-        sensitive_fields = {
-            'password', 'token', 'secret', 'key', 'api_key',
-            'private_key', 'session_token', 'refresh_token'
+        """Encrypt sensitive fields in a data dictionary (returned as-is if there are none)"""
+        sensitive_re = self._SENSITIVE_FIELD_RE
+        encrypted_fields = {
+            field: self.encrypt_string(value)
+            for field, value in data.items()
+            if isinstance(value, str) and value and sensitive_re.search(field)
         }
         
-        encrypted_data = data.copy()
-        
-        for field, value in data.items():
-            if any(sensitive_word in field.lower() for sensitive_word in sensitive_fields):
-                if isinstance(value, str) and value:
-                    encrypted_data[field] = self.encrypt_string(value)
-        
-        return encrypted_data
+        if not encrypted_fields:
+            return data
+        return {**data, **encrypted_fields}
     
     def decrypt_sensitive_data(self, encrypted_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Decrypt sensitive fields in a data dictionary"""
-        sensitive_fields = {
-            'password', 'token', 'secret', 'key', 'api_key',
-            'private_key', 'session_token', 'refresh_token'
+        """Decrypt sensitive fields in a data dictionary (returned as-is if there are none)"""
+        sensitive_re = self._SENSITIVE_FIELD_RE
+        decrypted_fields = {
+            field: self.decrypt_string(value)
+            for field, value in encrypted_data.items()
+            if isinstance(value, str) and value and sensitive_re.search(field)
         }
         
-        decrypted_data = encrypted_data.copy()
-        
-        for field, value in encrypted_data.items():
-            if any(sensitive_word in field.lower() for sensitive_word in sensitive_fields):
-                if isinstance(value, str) and value:
-                    decrypted_data[field] = self.decrypt_string(value)
-        
-        return decrypted_data
+        if not decrypted_fields:
+            return encrypted_data
+        return {**encrypted_data, **decrypted_fields}
     
     def create_secure_session_data(self, user_id: int, additional_data: Dict[str, Any] = None) -> str:
         """Create encrypted session data"""
@@ -5,13 +5,32 @@ This module implements the sector-based galaxy map system with a 30x15 grid
 (6000x6000 sectors total), ported from the original C code.
 """
 
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-import random
-import math
+import json
+import numpy as np
 from .coordinates import Coordinate, Sector, get_sector, same_sector
 
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to the json module
+    orjson = None
+
+
+# Generator for master seeds of maps created without an explicit seed
+_rng = np.random.default_rng()
+
+# Mask of the 24-bit fields of a planet's random draw used for its coordinates
+_COORD_MASK = np.uint64((1 << 24) - 1)
+
+# Number of generated sectors kept in memory per galaxy map
+SECTOR_CACHE_SIZE = 4096
+
+# Number of sectors sampled to estimate galaxy-wide planet statistics
+STATISTICS_SAMPLE_SIZE = 1024
+
 
 class SectorType(Enum):
     """Types of sectors in the galaxy"""
@@ -27,6 +46,11 @@ class PlanetType(Enum):
     ASTEROID = "asteroid"
 
 
+# Compact integer codes for planet types in the per-sector planet arrays
+PLANET_TYPES = tuple(PlanetType)
+PLANET_TYPE_CODES = {planet_type: code for code, planet_type in enumerate(PLANET_TYPES)}
+
+
 @dataclass
 class PlanetObject:
     """Planetary object in a sector"""
@@ -47,22 +71,64 @@ class PlanetObject:
 
 @dataclass
 class GalaxySector:
-    """A sector in the galaxy"""
+    """
+    A sector in the galaxy
+    
+    Besides the planets list, the planets' coordinates, type codes,
+    environment, resources and population are kept in parallel NumPy
+    arrays (one row per planet, in list order) for vectorized queries.
+    """
     sector: Sector
     sector_type: SectorType
     num_planets: int
     planets: List[PlanetObject]
     beacon_message: Optional[str] = None
     owner: Optional[str] = None
+    coord_xy: np.ndarray = field(default=None, repr=False, compare=False)
+    type_codes: np.ndarray = field(default=None, repr=False, compare=False)
+    env: np.ndarray = field(default=None, repr=False, compare=False)
+    resources: np.ndarray = field(default=None, repr=False, compare=False)
+    population: np.ndarray = field(default=None, repr=False, compare=False)
+    _info_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    _info_json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    def invalidate_info(self):
+        """Drop the cached sector info; call after changing the sector or its planets"""
+        self._info_cache = None
+        self._info_json = None
+    
+    def __post_init__(self):
+        planets = self.planets
+        self.coord_xy = np.array(
+            [(p.coord.x, p.coord.y) for p in planets], dtype=np.float64
+        ).reshape(-1, 2)
+        self.type_codes = np.array(
+            [PLANET_TYPE_CODES[p.planet_type] for p in planets], dtype=np.uint8
+        )
+        self.env = np.array([p.environment for p in planets], dtype=np.int32)
+        self.resources = np.array([p.resources for p in planets], dtype=np.int32)
+        self.population = np.array([p.population for p in planets], dtype=np.int32)
 
 
 class GalaxyMap:
-    """Main galaxy map system"""
+    """
+    Main galaxy map system
     
-    def __init__(self, galaxy_radius: int = 300):
+    Sectors are generated on demand from a per-sector seed derived from the
+    map's master seed, so the same sector always has the same planets and
+    untouched sectors can be dropped and regenerated at any time. Recently
+    used sectors are kept in an LRU cache; sectors carrying state of their
+    own (such as a beacon message) are pinned in `sectors`.
+    """
+    
+    def __init__(self, galaxy_radius: int = 300, seed: Optional[int] = None):
         self.galaxy_radius = galaxy_radius  # UNIVMAX from original
+        self.master_seed = seed if seed is not None else int(_rng.integers(2 ** 63))
         self.sectors: Dict[Tuple[int, int], GalaxySector] = {}
         self.neutral_sector = Sector(0, 0)
+        # Generated sectors by (x, y), least recently used first
+        self._sector_cache: "OrderedDict[Tuple[int, int], GalaxySector]" = OrderedDict()
+        self._planet_estimate: Optional[Dict] = None
         
         # Galaxy generation parameters
         self.planet_odds = 3  # 1 in 3 chance of planets per sector
@@ -99,15 +165,42 @@ class GalaxyMap:
     def get_sector(self, coord: Coordinate) -> GalaxySector:
         """Get or create a sector for the given coordinate"""
         sector = get_sector(coord)
-        sector_key = (sector.x, sector.y)
+        return self._get_sector_at(sector.x, sector.y)
+    
+    def _get_sector_at(self, x: int, y: int) -> GalaxySector:
+        """Get a pinned sector, or generate (or reuse) it from its seed"""
+        key = (x, y)
+        pinned = self.sectors.get(key)
+        if pinned is not None:
+            return pinned
         
-        if sector_key not in self.sectors:
-            self.sectors[sector_key] = self._create_sector(sector)
+        sector = self._sector_cache.get(key)
+        if sector is not None:
+            self._sector_cache.move_to_end(key)
+            return sector
         
-        return self.sectors[sector_key]
+        sector = self._create_sector(x, y)
+        self._sector_cache[key] = sector
+        if len(self._sector_cache) > SECTOR_CACHE_SIZE:
+            self._sector_cache.popitem(last=False)
+        return sector
+    
+    def _loaded_sectors(self) -> Dict[Tuple[int, int], GalaxySector]:
+        """Sectors currently in memory, pinned or cached, by (x, y)"""
+        return {**self._sector_cache, **self.sectors}
     
-    def _create_sector(self, sector: Sector) -> GalaxySector:
+    def _pin_sector(self, sector: GalaxySector) -> None:
+        """Keep a sector whose state has changed from being evicted and regenerated"""
+        self.sectors[(sector.sector.x, sector.sector.y)] = sector
+    
+    def _seed_for(self, x: int, y: int) -> int:
+        """Deterministic RNG seed of a sector"""
+        return hash((self.master_seed, x, y)) & 0xFFFFFFFFFFFFFFFF
+    
+    def _create_sector(self, x: int, y: int) -> GalaxySector:
         """Create a new sector with planets"""
+        sector = Sector(x, y)
+        
         # Check if this is the neutral sector
         if sector.x == 0 and sector.y == 0:
             return GalaxySector(
@@ -119,14 +212,12 @@ class GalaxyMap:
         
         # Generate planets for normal sectors
         planets = []
+        rng = np.random.default_rng(self._seed_for(x, y))
         
         # Determine number of planets (1 in 3 chance, 0-9 planets)
-        if random.randint(1, self.planet_odds) == 1:
-            num_planets = random.randint(0, self.max_planets_per_sector)
-            
-            for i in range(num_planets):
-                planet = self._generate_planet(sector, i + 1)
-                planets.append(planet)
+        if rng.integers(1, self.planet_odds + 1) == 1:
+            num_planets = int(rng.integers(0, self.max_planets_per_sector + 1))
+            planets = self._generate_planets(sector, num_planets, rng)
         
         return GalaxySector(
             sector=sector,
@@ -135,39 +226,37 @@ class GalaxyMap:
             planets=planets
         )
     
-    def _generate_planet(self, sector: Sector, planet_num: int) -> PlanetObject:
-        """Generate a random planet in a sector"""
-        # Generate random coordinates within the sector (0-9999)
-        x = random.uniform(0, 9999)
-        y = random.uniform(0, 9999)
-        
-        # Convert to absolute coordinates
-        abs_x = sector.x + (x / 10000.0)
-        abs_y = sector.y + (y / 10000.0)
-        
-        # Random planet type (mostly planets, some wormholes)
-        planet_type = PlanetType.PLANET
-        if random.randint(1, 20) == 1:  # 1 in 20 chance of wormhole
-            planet_type = PlanetType.WORMHOLE
+    def _generate_planets(self, sector: Sector, num_planets: int,
+                          rng: np.random.Generator) -> List[PlanetObject]:
+        """Generate random planets in a sector, drawing all random values in one batch"""
+        # One 64-bit draw per planet supplies its position and type: bits 0-23 and
+        # 24-47 give the coordinates within the sector (0-9999), bits 48-63 decide
+        # whether it is a wormhole (1 in 20 chance)
+        bits = rng.integers(0, 1 << 64, num_planets, dtype=np.uint64, endpoint=False)
+        xs = sector.x + (bits & _COORD_MASK) * (9999.0 / _COORD_MASK) / 10000.0
+        ys = sector.y + ((bits >> 24) & _COORD_MASK) * (9999.0 / _COORD_MASK) / 10000.0
+        wormholes = (bits >> 48) % 20 == 0
         
-        # Generate environment and resources (1-100)
-        environment = random.randint(1, 100)
-        resources = random.randint(1, 100)
+        # Environment and resources (1-100), population (0-1000000)
+        environments = rng.integers(1, 101, num_planets)
+        resources = rng.integers(1, 101, num_planets)
+        populations = rng.integers(0, 1000001, num_planets)
         
-        # Generate planet name
-        name = f"Planet {sector.x},{sector.y}-{planet_num}"
-        if planet_type == PlanetType.WORMHOLE:
-            name = f"Wormhole {sector.x},{sector.y}-{planet_num}"
-        
-        return PlanetObject(
-            planet_id=planet_num,
-            coord=Coordinate(abs_x, abs_y),
-            planet_type=planet_type,
-            name=name,
-            environment=environment,
-            resources=resources,
-            population=random.randint(0, 1000000)
-        )
+        return [
+            PlanetObject(
+                planet_id=i + 1,
+                coord=Coordinate(x, y),
+                planet_type=PlanetType.WORMHOLE if wormhole else PlanetType.PLANET,
+                name=f"{'Wormhole' if wormhole else 'Planet'} {sector.x},{sector.y}-{i + 1}",
+                environment=environment,
+                resources=resource,
+                population=population
+            )
+            for i, (x, y, wormhole, environment, resource, population) in enumerate(zip(
+                xs.tolist(), ys.tolist(), wormholes.tolist(),
+                environments.tolist(), resources.tolist(), populations.tolist()
+            ))
+        ]
     
     def get_planets_in_sector(self, coord: Coordinate) -> List[PlanetObject]:
         """Get all planets in the sector containing the given coordinate"""
@@ -176,28 +265,45 @@ class GalaxyMap:
     
     def get_planet_at_coord(self, coord: Coordinate) -> Optional[PlanetObject]:
         """Get the planet at the exact coordinate, if any"""
-        planets = self.get_planets_in_sector(coord)
+        sector = self.get_sector(coord)
+        if not sector.planets:
+            return None
         
         # Find planet closest to coordinate (within some tolerance)
         tolerance = 100.0  # Within 100 units
-        closest_planet = None
-        min_distance = float('inf')
-        
-        for planet in planets:
-            distance = math.sqrt(
-                (planet.coord.x - coord.x) ** 2 + 
-                (planet.coord.y - coord.y) ** 2
-            )
-            if distance < tolerance and distance < min_distance:
-                min_distance = distance
-                closest_planet = planet
+        xy = sector.coord_xy
+        distance_sq = (xy[:, 0] - coord.x) ** 2 + (xy[:, 1] - coord.y) ** 2
+        closest = int(np.argmin(distance_sq))
         
-        return closest_planet
+        if distance_sq[closest] < tolerance * tolerance:
+            return sector.planets[closest]
+        return None
     
     def get_sector_info(self, coord: Coordinate) -> Dict:
-        """Get information about a sector"""
-        sector = self.get_sector(coord)
+        """
+        Get information about a sector
         
+        The dict is built once and cached on the sector until the sector
+        changes, so callers must treat it as read-only.
+        """
+        sector = self.get_sector(coord)
+        if sector._info_cache is None:
+            sector._info_cache = self._build_sector_info(sector)
+        return sector._info_cache
+    
+    def get_sector_info_json(self, coord: Coordinate) -> bytes:
+        """Get the sector information serialized as JSON, cached like get_sector_info"""
+        sector = self.get_sector(coord)
+        if sector._info_json is None:
+            info = self.get_sector_info(coord)
+            if orjson is not None:
+                sector._info_json = orjson.dumps(info)
+            else:
+                sector._info_json = json.dumps(info).encode()
+        return sector._info_json
+    
+    def _build_sector_info(self, sector: GalaxySector) -> Dict:
+        """Build the information dict of a sector"""
         return {
             'sector_x': sector.sector.x,
             'sector_y': sector.sector.y,
@@ -224,6 +330,8 @@ class GalaxyMap:
         """Set a beacon message for a sector"""
         sector = self.get_sector(coord)
         sector.beacon_message = message
+        sector.invalidate_info()
+        self._pin_sector(sector)
     
     def get_beacon_message(self, coord: Coordinate) -> Optional[str]:
         """Get beacon message for a sector"""
@@ -232,8 +340,8 @@ class GalaxyMap:
     
     def is_neutral_sector(self, coord: Coordinate) -> bool:
         """Check if a coordinate is in the neutral sector (0,0)"""
-        sector = get_sector(coord)
-        return sector.x == 0 and sector.y == 0
+        # Sectors are unit squares, so sector (0,0) is [0, 1) x [0, 1)
+        return 0.0 <= coord.x < 1.0 and 0.0 <= coord.y < 1.0
     
     def get_galaxy_bounds(self) -> Tuple[Coordinate, Coordinate]:
         """Get the bounds of the galaxy"""
@@ -243,38 +351,79 @@ class GalaxyMap:
     
     def is_in_galaxy(self, coord: Coordinate) -> bool:
         """Check if a coordinate is within galaxy bounds"""
-        return (-self.galaxy_radius <= coord.x <= self.galaxy_radius and
-                -self.galaxy_radius <= coord.y <= self.galaxy_radius)
+        r = self.galaxy_radius
+        return abs(coord.x) <= r and abs(coord.y) <= r
+    
+    def is_in_galaxy_batch(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Check many coordinates against the galaxy bounds at once
+        
+        Args:
+            xs: X coordinates
+            ys: Y coordinates
+            
+        Returns:
+            Boolean array, True where the coordinate is within bounds
+        """
+        r = self.galaxy_radius
+        return (np.abs(xs) <= r) & (np.abs(ys) <= r)
     
     def get_sectors_in_range(self, center: Coordinate, range_sectors: int) -> List[GalaxySector]:
-        """Get all sectors within a given range of sectors"""
-        sectors = []
-        center_sector = get_sector(center)
+        """
+        Get the sectors in memory within a given range of sectors
         
-        for x in range(center_sector.x - range_sectors, center_sector.x + range_sectors + 1):
-            for y in range(center_sector.y - range_sectors, center_sector.y + range_sectors + 1):
-                if abs(x) <= self.galaxy_radius and abs(y) <= self.galaxy_radius:
-                    sector_key = (x, y)
-                    if sector_key in self.sectors:
-                        sectors.append(self.sectors[sector_key])
+        Only sectors that are already pinned or cached are returned; nothing
+        is generated and the cache order is left untouched.
+        """
+        center_sector = get_sector(center)
+        r = self.galaxy_radius
         
-        return sectors
+        return [
+            sector
+            for (x, y), sector in sorted(self._loaded_sectors().items())
+            if abs(x - center_sector.x) <= range_sectors and abs(y - center_sector.y) <= range_sectors
+            and abs(x) <= r and abs(y) <= r
+        ]
     
     def get_galaxy_statistics(self) -> Dict:
-        """Get statistics about the galaxy"""
-        total_sectors = len(self.sectors)
-        total_planets = sum(sector.num_planets for sector in self.sectors.values())
+        """
+        Get statistics about the galaxy
         
-        planet_types = {}
-        for sector in self.sectors.values():
-            for planet in sector.planets:
-                planet_type = planet.planet_type.value
-                planet_types[planet_type] = planet_types.get(planet_type, 0) + 1
+        total_sectors counts the sectors in memory (pinned or cached).
+        Planet counts are estimated from a fixed sample of sectors, since
+        the galaxy is generated on demand and never fully materialized.
+        """
+        if self._planet_estimate is None:
+            self._planet_estimate = self._estimate_planets()
         
         return {
-            'total_sectors': total_sectors,
-            'total_planets': total_planets,
-            'planet_types': planet_types,
+            'total_sectors': len(self._loaded_sectors()),
+            'cached_sectors': len(self._sector_cache),
+            'pinned_sectors': len(self.sectors),
+            **self._planet_estimate,
             'galaxy_radius': self.galaxy_radius,
             'max_sectors': (self.galaxy_radius * 2 + 1) ** 2
         }
+    
+    def _estimate_planets(self) -> Dict:
+        """Estimate galaxy-wide planet counts from a sample of generated sectors"""
+        max_sectors = (self.galaxy_radius * 2 + 1) ** 2
+        sample_size = min(STATISTICS_SAMPLE_SIZE, max_sectors)
+        
+        # The sample depends only on the master seed, so the estimate is stable
+        rng = np.random.default_rng(self._seed_for(self.galaxy_radius + 1, 0))
+        coords = rng.integers(-self.galaxy_radius, self.galaxy_radius + 1, (sample_size, 2))
+        
+        # Sampled sectors are generated outside the cache to avoid evicting live ones
+        type_codes = [self._create_sector(x, y).type_codes for x, y in coords.tolist()]
+        type_counts = np.bincount(np.concatenate(type_codes), minlength=len(PLANET_TYPES))
+        scale = max_sectors / sample_size
+        
+        return {
+            'total_planets': int(round(type_counts.sum() * scale)),
+            'planet_types': {
+                PLANET_TYPES[code].value: int(round(count * scale))
+                for code, count in enumerate(type_counts) if count
+            },
+            'sampled_sectors': sample_size
+        }
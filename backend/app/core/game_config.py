@@ -5,15 +5,26 @@ This module provides centralized configuration management for all game balance
 parameters, allowing real-time adjustment without server restart.
 """
 
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Callable, Deque, Iterator, Tuple, Mapping
+from types import MappingProxyType
+from collections import defaultdict, deque
+from itertools import chain, islice
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
 import json
 import logging
-from datetime import datetime
+import sys
+import time
+import numpy as np
+from datetime import datetime, timezone
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.models.base import Base
+from app.models.config import GameConfig, ConfigHistory
+
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to the json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -28,16 +39,25 @@ class ConfigCategory(Enum):
     ADMIN_SETTINGS = "admin_settings"
 
 
-class ConfigType(Enum):
-    """Configuration value types"""
-    INTEGER = "integer"
-    FLOAT = "float"
-    BOOLEAN = "boolean"
-    STRING = "string"
-    JSON = "json"
+class ConfigType(IntEnum):
+    """Configuration value types (the integer codes index per-type lookup tables)"""
+    INTEGER = 0
+    FLOAT = 1
+    BOOLEAN = 2
+    STRING = 3
+    JSON = 4
+    
+    @property
+    def label(self) -> str:
+        """Type name used in exports and the admin API"""
+        return _TYPE_LABELS[self]
+
+
+# Interned once, so every export entry shares the same label objects
+_TYPE_LABELS = tuple(sys.intern(config_type.name.lower()) for config_type in ConfigType)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigParameter:
     """Represents a single configuration parameter"""
     key: str
@@ -50,14 +70,54 @@ class ConfigParameter:
     default_value: Union[int, float, bool, str, Dict[str, Any]] = None
     requires_restart: bool = False
     validation_func: Optional[callable] = None
+    _validator: Optional[Callable[[Any], bool]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Slotted instances have no per-instance dict, so the strings they
+        # hold are the remaining per-parameter cost; share them via interning.
+        # Category values are enum members and already shared.
+        self.key = sys.intern(self.key)
+        self.description = sys.intern(self.description)
+
+
+def _range_mask(values: np.ndarray, mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+    """Check values[i] against [mins[i], maxs[i]] for every i"""
+    return (values >= mins) & (values <= maxs)
 
 
 class GameConfiguration:
     """Centralized game configuration management"""
     
+    # Source of the value type check for each configuration type, indexed by
+    # ConfigType; bools are not accepted as numbers
+    _TYPE_CHECKS = (
+        "type(x) is int",                                                   # INTEGER
+        "isinstance(x, (int, float)) and not isinstance(x, bool)",          # FLOAT
+        "isinstance(x, bool)",                                              # BOOLEAN
+        "isinstance(x, str)",                                               # STRING
+        "isinstance(x, (dict, list))",                                      # JSON
+    )
+    
+    # Types whose values are numbers and so are subject to min/max checks
+    _RANGED_TYPES = frozenset({ConfigType.INTEGER, ConfigType.FLOAT, ConfigType.BOOLEAN})
+    
     def __init__(self):
         self._config: Dict[str, ConfigParameter] = {}
-        self._config_history: List[Dict[str, Any]] = []
+        # Current value of each key, for fast reads; copy-on-write, so readers
+        # never need a lock and writers replace the whole dict
+        self._values: Dict[str, Any] = {}
+        self._by_category: Dict[ConfigCategory, Dict[str, ConfigParameter]] = defaultdict(dict)
+        # Read-only views handed out by get_all_configs/get_config_by_category
+        self._config_view: Mapping[str, ConfigParameter] = MappingProxyType(self._config)
+        self._category_views: Dict[ConfigCategory, Mapping[str, ConfigParameter]] = {
+            category: MappingProxyType(self._by_category[category]) for category in ConfigCategory
+        }
+        self._export_cache: Dict[str, Dict[str, Any]] = {}  # export_config() entry of each key
+        self._subscribers: Dict[str, List[list]] = defaultdict(list)  # Value cells handed out by bind()
+        self._config_history: Deque[Dict[str, Any]] = deque(maxlen=1000)  # Last 1000 changes
+        # Changes not yet in the database; unbounded, so nothing is lost when
+        # changes are made by callers that never flush
+        self._pending_history: Deque[Dict[str, Any]] = deque()
         self._initialize_default_config()
     
     def _initialize_default_config(self):
@@ -247,105 +307,343 @@ class GameConfiguration:
                           "Maximum concurrent players", min_value=10, max_value=1000),
         ]
         
-        # Combine all configurations
-        all_configs = (ship_configs + combat_configs + economic_configs + 
-                      scoring_configs + mechanics_configs + admin_configs)
-        
-        for config in all_configs:
+        # Register all configurations
+        for config in chain(ship_configs, combat_configs, economic_configs,
+                            scoring_configs, mechanics_configs, admin_configs):
             self._config[config.key] = config
+            self._values[config.key] = config.value
+            self._by_category[config.category][config.key] = config
             if config.default_value is None:
                 config.default_value = config.value
+            self._export_cache[config.key] = self._export_entry(config)
+            config._validator = self._compile_validator(config)
+        
+        # Integer and float values are also kept in one array for vectorized reads
+        numeric_keys = [
+            key for key, config in self._config.items()
+            if config.config_type in (ConfigType.INTEGER, ConfigType.FLOAT)
+        ]
+        self._numeric_index: Dict[str, int] = {key: i for i, key in enumerate(numeric_keys)}
+        self._numeric_values = np.array(
+            [self._values[key] for key in numeric_keys], dtype=np.float64
+        )
     
     def get_config(self, key: str) -> Any:
         """Get configuration value by key"""
-        if key not in self._config:
+        try:
+            return self._values[key]
+        except KeyError:
+            raise ValueError(f"Configuration key '{key}' not found") from None
+    
+    def get_numeric(self, key: str) -> float:
+        """Get an integer or float configuration value as a float"""
+        try:
+            return float(self._numeric_values[self._numeric_index[key]])
+        except KeyError:
+            raise ValueError(f"Numeric configuration key '{key}' not found") from None
+    
+    def get_numeric_values(self, keys: List[str]) -> np.ndarray:
+        """
+        Get several integer or float configuration values as one float64 array
+        
+        Args:
+            keys: Configuration keys, all of integer or float type
+        
+        Returns:
+            New array with the values in the order of `keys`
+        """
+        try:
+            return self._numeric_values[[self._numeric_index[key] for key in keys]]
+        except KeyError as e:
+            raise ValueError(f"Numeric configuration key {e} not found") from None
+    
+    def bind(self, key: str) -> Callable[[], Any]:
+        """
+        Bind a configuration key to a zero-argument getter
+        
+        The getter reads a cell that set_config keeps up to date, so hot code
+        can bind once at import time and read the current value cheaply:
+        
+            _recharge_rate = game_config.bind("energy_recharge_rate")
+            ...
+            energy += _recharge_rate()
+        """
+        values = self._values
+        if key not in values:
             raise ValueError(f"Configuration key '{key}' not found")
-        return self._config[key].value
+        
+        cell = [values[key]]
+        self._subscribers[key].append(cell)
+        return lambda cell=cell: cell[0]
     
-    def set_config(self, key: str, value: Any, admin_user: str = "system") -> bool:
+    def set_config(self, key: str, value: Any, admin_user: str = "system",
+                   change_reason: Optional[str] = None) -> bool:
         """Set configuration value with validation and history tracking"""
         if key not in self._config:
             raise ValueError(f"Configuration key '{key}' not found")
         
         config = self._config[key]
         
+        # Re-saving the current value is a no-op; it was validated when stored
+        if self._is_current(config, value):
+            return True
+        
         # Validate value type and range
         if not self._validate_config_value(config, value):
             return False
         
+        self._apply_config(config, value, admin_user, change_reason)
+        return True
+    
+    @staticmethod
+    def _is_current(config: ConfigParameter, value: Any) -> bool:
+        """Check whether value equals the stored value (True does not equal 1 here)"""
+        current = config.value
+        return current is value or (type(current) is type(value) and current == value)
+    
+    def _apply_config(self, config: ConfigParameter, value: Any, admin_user: str,
+                      change_reason: Optional[str] = None):
+        """Store an already validated configuration value and record the change"""
+        key = config.key
+        
         # Store old value for history
         old_value = config.value
         
         # Update configuration
         config.value = value
+        values = dict(self._values)
+        values[key] = value
+        self._values = values
+        for cell in self._subscribers.get(key, ()):
+            cell[0] = value
+        index = self._numeric_index.get(key)
+        if index is not None:
+            self._numeric_values[index] = value
+        
+        # Replace rather than patch the export entry, so earlier exports stay unchanged
+        self._export_cache[key] = {**self._export_cache[key], "value": value}
         
         # Log configuration change
-        self._log_config_change(key, old_value, value, admin_user)
+        self._log_config_change(key, old_value, value, admin_user, change_reason)
         
         logger.info(f"Configuration updated: {key} = {value} (by {admin_user})")
-        return True
     
     def _validate_config_value(self, config: ConfigParameter, value: Any) -> bool:
         """Validate configuration value"""
-        # Type validation
-        if config.config_type == ConfigType.INTEGER:
-            if not isinstance(value, int):
-                return False
-        elif config.config_type == ConfigType.FLOAT:
-            if not isinstance(value, (int, float)):
-                return False
-        elif config.config_type == ConfigType.BOOLEAN:
-            if not isinstance(value, bool):
-                return False
-        elif config.config_type == ConfigType.STRING:
-            if not isinstance(value, str):
-                return False
-        elif config.config_type == ConfigType.JSON:
-            if not isinstance(value, (dict, list)):
-                return False
+        return config._validator(value)
+    
+    def _validate_batch(self, entries: List[Tuple[ConfigParameter, Any]]) -> List[bool]:
+        """
+        Validate many (parameter, value) pairs at once
+        
+        Range checks of plain int and float values without a custom
+        validation function run as one vectorized NumPy comparison; all other
+        values (including other numeric types such as NumPy scalars) go
+        through their per-key validator.
+        """
+        results = [False] * len(entries)
+        positions, values, mins, maxs = [], [], [], []
+        
+        for i, (config, value) in enumerate(entries):
+            numeric = config.config_type in (ConfigType.INTEGER, ConfigType.FLOAT)
+            if not numeric or config.validation_func is not None:
+                results[i] = config._validator(value)
+            elif (type(value) is int or
+                  (config.config_type == ConfigType.FLOAT and type(value) is float)):
+                positions.append(i)
+                values.append(value)
+                mins.append(-np.inf if config.min_value is None else config.min_value)
+                maxs.append(np.inf if config.max_value is None else config.max_value)
+            else:
+                results[i] = config._validator(value)
+        
+        if positions:
+            try:
+                mask = _range_mask(np.array(values, dtype=np.float64),
+                                   np.array(mins, dtype=np.float64),
+                                   np.array(maxs, dtype=np.float64))
+            except OverflowError:
+                # An integer too large for a float64; fall back to exact checks
+                mask = [entries[i][0]._validator(entries[i][1]) for i in positions]
+            for i, valid in zip(positions, mask):
+                results[i] = bool(valid)
+        
+        return results
+    
+    def _compile_validator(self, config: ConfigParameter) -> Callable[[Any], bool]:
+        """
+        Generate a validator specialized to one configuration parameter
+        
+        The type check, the range bounds (as literals) and the custom
+        validation function are combined into a single expression, so
+        validating a value takes one call and no attribute lookups.
+        """
+        conditions = [self._TYPE_CHECKS[config.config_type]]
         
         # Range validation
-        if config.min_value is not None:
-            if isinstance(value, (int, float)) and value < config.min_value:
-                return False
-        if config.max_value is not None:
-            if isinstance(value, (int, float)) and value > config.max_value:
-                return False
+        if config.config_type in self._RANGED_TYPES:
+            if config.min_value is not None:
+                conditions.append(f"x >= {config.min_value!r}")
+            if config.max_value is not None:
+                conditions.append(f"x <= {config.max_value!r}")
         
         # Custom validation
-        if config.validation_func and not config.validation_func(value):
-            return False
+        if config.validation_func:
+            conditions.append("_check(x)")
         
-        return True
+        source = f"def validate(x, _check=_check):\n    return bool({' and '.join(conditions)})\n"
+        namespace = {"_check": config.validation_func}
+        exec(source, namespace)
+        return namespace["validate"]
     
-    def _log_config_change(self, key: str, old_value: Any, new_value: Any, admin_user: str):
+    def _log_config_change(self, key: str, old_value: Any, new_value: Any, admin_user: str,
+                           change_reason: Optional[str] = None):
         """Log configuration change to history"""
+        # The timestamp is formatted only when the history is read
         change_record = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "ts_ns": time.time_ns(),
             "key": key,
             "old_value": old_value,
             "new_value": new_value,
-            "admin_user": admin_user
+            "admin_user": admin_user,
+            "change_reason": change_reason
         }
         self._config_history.append(change_record)
+        self._pending_history.append(change_record)
+    
+    def flush_history(self, session: Session) -> int:
+        """
+        Write pending configuration changes to the config_history table
+        
+        All pending changes are inserted with a single executemany, each with
+        the reason and time of the change itself; batch records are written
+        as one row per key, and changes to keys without a game_configs row
+        are dropped. The caller commits.
+        
+        Args:
+            session: Database session to write with
+        
+        Returns:
+            Number of history rows written
+        """
+        if not self._pending_history:
+            return 0
+        
+        pending = list(self._pending_history)
+        self._pending_history.clear()
+        changes = [change for record in pending for change in self._expand_record(record)]
         
-        # Keep only last 1000 changes
-        if len(self._config_history) > 1000:
-            self._config_history = self._config_history[-1000:]
+        try:
+            config_ids = dict(
+                session.query(GameConfig.key, GameConfig.id)
+                .filter(GameConfig.key.in_({record["key"] for record in changes}))
+                .all()
+            )
+            rows = [
+                {
+                    "config_id": config_ids[record["key"]],
+                    "old_value": record["old_value"],
+                    "new_value": record["new_value"],
+                    "changed_by": str(record["admin_user"]),
+                    "change_reason": record.get("change_reason"),
+                    "created_at": datetime.fromtimestamp(record["ts_ns"] / 1e9, tz=timezone.utc)
+                }
+                for record in changes
+                if record["key"] in config_ids
+            ]
+            if rows:
+                session.execute(insert(ConfigHistory), rows)
+            return len(rows)
+        except Exception:
+            # Keep the changes for the next flush
+            self._pending_history.extendleft(reversed(pending))
+            raise
     
-    def get_config_by_category(self, category: ConfigCategory) -> Dict[str, ConfigParameter]:
-        """Get all configurations in a category"""
-        return {k: v for k, v in self._config.items() if v.category == category}
+    def get_config_by_category(self, category: ConfigCategory) -> Mapping[str, ConfigParameter]:
+        """Get a read-only view of all configurations in a category"""
+        return self._category_views[category]
     
-    def get_all_configs(self) -> Dict[str, ConfigParameter]:
-        """Get all configurations"""
-        return self._config.copy()
+    def get_all_configs(self) -> Mapping[str, ConfigParameter]:
+        """Get a read-only view of all configurations"""
+        return self._config_view
     
-    def get_config_history(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get configuration change history"""
-        return self._config_history[-limit:]
+    def get_config_history(self, limit: int = 100,
+                           session: Optional[Session] = None) -> List[Dict[str, Any]]:
+        """
+        Get configuration change history, oldest first
+        
+        Every entry describes the change of one key; batch changes are listed
+        key by key. Served from memory when it holds `limit` entries;
+        otherwise, if a session is given, from the persisted history followed
+        by the changes that have not been flushed yet (changes to keys
+        without a game_configs row are only ever kept in memory).
+        """
+        history = list(islice(self._iter_records(self._config_history), limit))
+        if session is not None and len(history) < limit:
+            history = list(islice(self._iter_records(self._pending_history), limit))
+            history.extend(islice(self.iter_history(session), limit - len(history)))
+        history.reverse()
+        return history
+    
+    @classmethod
+    def _iter_records(cls, records: Deque[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield change records in the public history format, newest first"""
+        # Walk back from the newest entry so only the records read are formatted
+        for record in reversed(records):
+            yield from map(cls._format_record, reversed(cls._expand_record(record)))
+    
+    @staticmethod
+    def _expand_record(record: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Split a change record into single-key records"""
+        if not record.get("batch"):
+            return [record]
+        return [
+            {"ts_ns": record["ts_ns"], "key": key, **change,
+             "admin_user": record["admin_user"], "change_reason": record.get("change_reason")}
+            for key, change in record["changes"].items()
+        ]
     
-    def reset_to_default(self, key: str, admin_user: str = "system") -> bool:
+    @staticmethod
+    def _format_record(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a single-key in-memory change record to the public history format"""
+        return {
+            "timestamp": datetime.fromtimestamp(record["ts_ns"] / 1e9, tz=timezone.utc).isoformat(),
+            "key": record["key"],
+            "old_value": record["old_value"],
+            "new_value": record["new_value"],
+            "admin_user": record["admin_user"],
+            "change_reason": record.get("change_reason")
+        }
+    
+    def iter_history(self, session: Session, chunk: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the persisted configuration history, newest first
+        
+        Rows are fetched `chunk` at a time, so memory use does not grow with
+        the size of the history table.
+        """
+        query = (
+            session.query(ConfigHistory, GameConfig.key)
+            .join(GameConfig, ConfigHistory.config_id == GameConfig.id)
+            .order_by(ConfigHistory.id.desc())
+            .yield_per(chunk)
+        )
+        for row, key in query:
+            created_at = row.created_at
+            if created_at is not None and created_at.tzinfo is None:
+                # Backends without time zone support return naive UTC times
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            yield {
+                "timestamp": created_at.isoformat() if created_at else None,
+                "key": key,
+                "old_value": row.old_value,
+                "new_value": row.new_value,
+                "admin_user": row.changed_by,
+                "change_reason": row.change_reason
+            }
+    
+    def reset_to_default(self, key: str, admin_user: str = "system",
+                         change_reason: Optional[str] = "Reset to default") -> bool:
         """Reset configuration to default value"""
         if key not in self._config:
             return False
@@ -354,43 +652,166 @@ class GameConfiguration:
         if config.default_value is None:
             return False
         
-        return self.set_config(key, config.default_value, admin_user)
+        return self.set_config(key, config.default_value, admin_user, change_reason)
     
     def export_config(self) -> Dict[str, Any]:
-        """Export current configuration as JSON-serializable dict"""
+        """
+        Export current configuration as JSON-serializable dict
+        
+        The per-key entries are cached and shared between exports, so they
+        must not be modified by the caller.
+        """
+        return dict(self._export_cache)
+    
+    def export_config_bytes(self) -> bytes:
+        """Export current configuration serialized as JSON bytes"""
+        if orjson is not None:
+            return orjson.dumps(self._export_cache, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self._export_cache).encode('utf-8')
+    
+    def _export_entry(self, config: ConfigParameter) -> Dict[str, Any]:
+        """Build the export entry of a configuration parameter"""
         return {
-            key: {
-                "value": config.value,
-                "type": config.config_type.value,
-                "category": config.category.value,
-                "description": config.description,
-                "min_value": config.min_value,
-                "max_value": config.max_value,
-                "default_value": config.default_value,
-                "requires_restart": config.requires_restart
-            }
-            for key, config in self._config.items()
+            "value": config.value,
+            "type": config.config_type.label,
+            "category": config.category.value,
+            "description": config.description,
+            "min_value": config.min_value,
+            "max_value": config.max_value,
+            "default_value": config.default_value,
+            "requires_restart": config.requires_restart
         }
     
-    def import_config(self, config_data: Dict[str, Any], admin_user: str = "system") -> List[str]:
-        """Import configuration from JSON-serializable dict"""
+    def import_config(self, config_data: Dict[str, Any], admin_user: str = "system",
+                      session: Optional[Session] = None) -> List[str]:
+        """
+        Import configuration from JSON-serializable dict
+        
+        If a session is given, the resulting history is written to the
+        database in one batch at the end (the caller commits).
+        """
         errors = []
         success_count = 0
         
+        # Collect the updates first so they can be validated in one batch;
+        # entries that fail early keep their error message in order
+        outcomes = []
+        updates = []
         for key, config_info in config_data.items():
             try:
                 if key in self._config:
-                    # Update existing configuration
-                    if self.set_config(key, config_info["value"], admin_user):
-                        success_count += 1
-                    else:
-                        errors.append(f"Failed to set {key}: validation failed")
+                    updates.append((self._config[key], config_info["value"]))
+                    outcomes.append(None)
+                else:
+                    outcomes.append(f"Unknown configuration key: {key}")
+            except Exception as e:
+                outcomes.append(f"Error setting {key}: {str(e)}")
+        
+        valid = iter(self._validate_batch(updates))
+        updates = iter(updates)
+        for outcome in outcomes:
+            if outcome is not None:
+                errors.append(outcome)
+                continue
+            
+            # Update existing configuration
+            config, value = next(updates)
+            is_valid = next(valid)
+            if self._is_current(config, value):
+                success_count += 1
+                continue
+            if not is_valid:
+                errors.append(f"Failed to set {config.key}: validation failed")
+                continue
+            try:
+                self._apply_config(config, value, admin_user, "Configuration import")
+                success_count += 1
+            except Exception as e:
+                errors.append(f"Error setting {config.key}: {str(e)}")
+        
+        if session is not None:
+            self.flush_history(session)
+        
+        logger.info(f"Configuration import completed: {success_count} successful, {len(errors)} errors")
+        return errors
+    
+    def import_config_bulk(self, config_data: Dict[str, Any], admin_user: str = "system",
+                           partial: bool = False,
+                           session: Optional[Session] = None) -> List[str]:
+        """
+        Import configuration as a single batch
+        
+        All entries are validated before anything is applied. The accepted
+        values are then swapped in together and recorded as one batch
+        history entry with one log line.
+        
+        Args:
+            config_data: Configuration in export_config format
+            admin_user: User recorded in the history
+            partial: Apply the valid entries even if others failed; by
+                     default nothing is applied when any entry fails
+            session: If given, the history is written to the database (the
+                     caller commits)
+        
+        Returns:
+            Error messages, in the same format as import_config
+        """
+        errors = []
+        staged: Dict[str, Any] = {}
+        updates = []
+        
+        for key, config_info in config_data.items():
+            try:
+                if key in self._config:
+                    updates.append((self._config[key], config_info["value"]))
                 else:
                     errors.append(f"Unknown configuration key: {key}")
             except Exception as e:
                 errors.append(f"Error setting {key}: {str(e)}")
         
-        logger.info(f"Configuration import completed: {success_count} successful, {len(errors)} errors")
+        for (config, value), is_valid in zip(updates, self._validate_batch(updates)):
+            if self._is_current(config, value):
+                continue
+            if is_valid:
+                staged[config.key] = value
+            else:
+                errors.append(f"Failed to set {config.key}: validation failed")
+        
+        if errors and not partial:
+            logger.info(f"Configuration bulk import rejected: {len(errors)} errors")
+            return errors
+        
+        if staged:
+            changes = {}
+            values = dict(self._values)
+            for key, value in staged.items():
+                config = self._config[key]
+                changes[key] = {"old_value": config.value, "new_value": value}
+                config.value = value
+                values[key] = value
+                for cell in self._subscribers.get(key, ()):
+                    cell[0] = value
+                index = self._numeric_index.get(key)
+                if index is not None:
+                    self._numeric_values[index] = value
+                self._export_cache[key] = {**self._export_cache[key], "value": value}
+            self._values = values
+            
+            change_record = {
+                "ts_ns": time.time_ns(),
+                "batch": True,
+                "changes": changes,
+                "admin_user": admin_user,
+                "change_reason": "Configuration import"
+            }
+            self._config_history.append(change_record)
+            self._pending_history.append(change_record)
+            
+            if session is not None:
+                self.flush_history(session)
+        
+        logger.info(f"Configuration bulk import completed: {len(staged)} changed, "
+                    f"{len(errors)} errors (by {admin_user})")
         return errors
 
 
@@ -408,6 +829,11 @@ def get_config_value(key: str) -> Any:
     return game_config.get_config(key)
 
 
+def bind_config(key: str) -> Callable[[], Any]:
+    """Convenience function to bind a configuration value to a getter"""
+    return game_config.bind(key)
+
+
 def set_config_value(key: str, value: Any, admin_user: str = "system") -> bool:
     """Convenience function to set configuration value"""
     return game_config.set_config(key, value, admin_user)
@@ -6,53 +6,78 @@ including the tick system, movement physics, coordinate system, and galaxy map.
 """
 
 import asyncio
+import json
 import logging
+import time
+import numpy as np
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
 
-from .coordinates import Coordinate, get_sector, same_sector, distance, bearing
-from .movement import MovementState, MovementPhysics, ShipMovement, create_movement_state
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .database import SessionLocal
+from ..models.ship import Ship as DBShip
+from .coordinates import Coordinate, get_sector, distance, bearing
+from .movement import MovementPhysics, ShipMovement, advance_ships
 from .tick_system import TickSystem, TickType
 from .galaxy import GalaxyMap, GalaxySector, PlanetObject
+from .ship_classes import CLASS_MAX_ACCELERATION, CLASS_MAX_SPEED, class_rows
+from .constants import ShipStatus
+from .ship_table import Ship, ShipTable, ns_to_datetime
+
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to the json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class Ship:
-    """Ship entity in the game"""
+@dataclass(slots=True)
+class GameState:
+    """Current state of the game"""
+    ships: ShipTable
+    galaxy_map: GalaxyMap
+    tick_system: TickSystem
+    game_time_ns: int  # Unix time of the current tick in nanoseconds
+    running: bool = False
+    tick_number: int = 0  # Global game tick counter
+
+
+@dataclass(slots=True)
+class ShipPosition:
+    """Position of a ship in a status payload"""
+    x: float
+    y: float
+
+
+@dataclass(slots=True)
+class ShipStatusDTO:
+    """Detailed ship status, laid out as the API's JSON payload"""
     ship_id: str
     user_id: str
     ship_name: str
     ship_class: int
-    position: Coordinate
+    position: ShipPosition
     heading: float
     speed: float
     max_speed: float
-    max_acceleration: float
     energy: int
     shields: int
     max_shields: int
     damage: float
-    status: str  # 'active', 'inactive', 'destroyed'
-    team_id: Optional[str] = None
-    last_update: datetime = None
+    status: str
+    team_id: Optional[str]
+    last_update: str
+    sector: Dict[str, Any]  # Cached sector info shared with get_sector_info
     
-    def __post_init__(self):
-        if self.last_update is None:
-            self.last_update = datetime.utcnow()
-
-
-@dataclass
-class GameState:
-    """Current state of the game"""
-    ships: Dict[str, Ship]
-    galaxy_map: GalaxyMap
-    tick_system: TickSystem
-    game_time: datetime
-    running: bool = False
-    tick_number: int = 0  # Global game tick counter
+    def to_json(self) -> bytes:
+        """Serialize the status as JSON"""
+        if orjson is not None:
+            return orjson.dumps(self)
+        return json.dumps(asdict(self)).encode()
 
 
 class GameEngine:
@@ -79,10 +104,10 @@ class GameEngine:
         
         # Initialize game state
         self.game_state = GameState(
-            ships={},
+            ships=ShipTable(),
             galaxy_map=galaxy_map,
             tick_system=tick_system,
-            game_time=datetime.utcnow()
+            game_time_ns=time.time_ns()
         )
         
         # Restore ships from database
@@ -94,45 +119,53 @@ class GameEngine:
         self._initialized = True
         logger.info("Game engine initialized successfully")
     
-    async def restore_ships_from_database(self):
-        """Restore ships from database to game engine"""
+    async def restore_ships_from_database(self, db: Optional[Session] = None):
+        """
+        Restore ships from database to game engine
+        
+        Args:
+            db: Database session to read with; by default a new session is
+                opened and closed again once the ships are loaded
+        """
+        if db is None:
+            with SessionLocal() as session:
+                await self.restore_ships_from_database(session)
+            return
+        
         try:
-            from ..core.database import get_db
-            from ..models.ship import Ship as DBShip
-            from sqlalchemy.orm import Session
-            
-            # Get database session
-            db = next(get_db())
-            
-            # Get all active ships from database (status = 1 means active)
-            db_ships = db.query(DBShip).filter(DBShip.status == 1).all()
+            # Stream all active ships from database (status = 1 means active),
+            # loading only the columns the engine keeps
+            result = db.execute(
+                select(DBShip.id, DBShip.user_id, DBShip.shipname, DBShip.shpclass,
+                       DBShip.x_coord, DBShip.y_coord, DBShip.heading, DBShip.speed,
+                       DBShip.energy, DBShip.shield_charge, DBShip.damage)
+                .where(DBShip.status == 1)
+                .execution_options(yield_per=10000)
+            )
             
             restored_count = 0
-            for db_ship in db_ships:
+            for rows in result.partitions():
+                (ids, user_ids, names, classes, xs, ys, headings, speeds,
+                 energies, shields, damages) = zip(*rows)
                 try:
-                    # Create ship in game engine
-                    ship = Ship(
-                        ship_id=str(db_ship.id),
-                        user_id=str(db_ship.user_id),
-                        ship_name=db_ship.shipname,
-                        ship_class=db_ship.shpclass,
-                        position=Coordinate(db_ship.x_coord, db_ship.y_coord),
-                        heading=db_ship.heading,
-                        speed=db_ship.speed,
-                        max_speed=50000.0,  # Default max speed
-                        max_acceleration=2000.0,  # Default acceleration
-                        energy=db_ship.energy,
-                        shields=db_ship.shields,
-                        max_shields=db_ship.max_shields,
-                        damage=db_ship.damage,
-                        status='active' if db_ship.status == 1 else 'inactive'
+                    self.game_state.ships.extend(
+                        [str(ship_id) for ship_id in ids],
+                        [str(user_id) for user_id in user_ids],
+                        list(names),
+                        ship_class=classes,
+                        x=xs,
+                        y=ys,
+                        heading=headings,
+                        speed=speeds,
+                        energy=energies,
+                        shields=shields,
+                        max_shields=100,  # Default max shields
+                        damage=damages,
+                        status=ShipStatus.ACTIVE
                     )
-                    
-                    self.game_state.ships[str(db_ship.id)] = ship
-                    restored_count += 1
-                    
+                    restored_count += len(ids)
                 except Exception as e:
-                    logger.error(f"Failed to restore ship {db_ship.id}: {e}")
+                    logger.error(f"Failed to restore ships {ids[0]}-{ids[-1]}: {e}")
             
             logger.info(f"Restored {restored_count} ships from database")
             
@@ -149,7 +182,7 @@ class GameEngine:
         
         logger.info("Starting Galactic Empire game...")
         self.game_state.running = True
-        self.game_state.game_time = datetime.utcnow()
+        self.game_state.game_time_ns = time.time_ns()
         
         logger.info("Galactic Empire game started")
     
@@ -177,24 +210,25 @@ class GameEngine:
             position = Coordinate(0.0, 0.0)
         
         # Create ship with default values
-        ship = Ship(
+        ships = self.game_state.ships
+        index = ships.append(
             ship_id=ship_id,
             user_id=user_id,
             ship_name=ship_name,
             ship_class=ship_class,
-            position=position,
+            x=position.x,
+            y=position.y,
             heading=0.0,
             speed=0.0,
-            max_speed=50000.0,  # Default max speed
-            max_acceleration=2000.0,  # Default acceleration
             energy=50000,  # Default energy
             shields=0,
             max_shields=100,  # Default max shields
             damage=0.0,
-            status='active'
+            status=ShipStatus.ACTIVE,
+            last_update_ns=self.game_state.game_time_ns
         )
+        ship = Ship(ships, index)
         
-        self.game_state.ships[ship_id] = ship
         logger.info(f"Created ship {ship_name} ({ship_id}) for user {user_id}")
         
         return ship
@@ -207,37 +241,58 @@ class GameEngine:
     
     def update_ship_movement(self, ship_id: str, target_speed: Optional[float] = None,
                            target_heading: Optional[float] = None) -> bool:
-        """Update ship movement"""
-        ship = self.get_ship(ship_id)
-        if not ship or ship.status != 'active':
+        """
+        Update ship movement
+        
+        Sets the ship's target speed and heading; the ship turns, accelerates
+        and moves toward them on each movement tick (update_all_ship_movement).
+        """
+        if not self.game_state:
             return False
         
-        # Create movement state
-        movement_state = create_movement_state(
-            position=ship.position,
-            heading=ship.heading,
-            speed=ship.speed,
-            max_speed=ship.max_speed,
-            max_acceleration=ship.max_acceleration
-        )
+        ships = self.game_state.ships
+        i = ships.index_of.get(ship_id)
+        if i is None or ships.status[i] != ShipStatus.ACTIVE:
+            return False
         
-        # Apply movement updates
         if target_speed is not None:
-            movement_state = self.ship_movement.accelerate_ship(movement_state, target_speed)
-        
+            ships.target_speed[i] = target_speed
         if target_heading is not None:
-            movement_state = self.ship_movement.rotate_ship(movement_state, target_heading)
+            ships.target_heading[i] = target_heading
         
-        # Update ship position
-        movement_state = self.ship_movement.move_ship(movement_state)
+        return True
+    
+    def update_all_ship_movement(self) -> int:
+        """
+        Advance all active ships by one movement tick
+        
+        Returns:
+            Number of ships whose position changed
+        """
+        if not self.game_state:
+            return 0
         
-        # Update ship with new state
-        ship.position = movement_state.position
-        ship.heading = movement_state.heading
-        ship.speed = movement_state.speed
-        ship.last_update = datetime.utcnow()
+        ships = self.game_state.ships
+        n = len(ships)
+        active = ships.status[:n] == ShipStatus.ACTIVE
+        if not active.any():
+            return 0
         
-        return True
+        x, y = ships.x[:n], ships.y[:n]
+        old_x, old_y = x.copy(), y.copy()
+        advance_ships(x, y, ships.heading[:n], ships.speed[:n],
+                      ships.target_speed[:n], ships.target_heading[:n],
+                      class_rows(ships.ship_class[:n]),
+                      CLASS_MAX_SPEED, CLASS_MAX_ACCELERATION, active)
+        
+        # Only ships whose position changed are stamped; they share the
+        # tick's timestamp
+        moved = np.flatnonzero((x != old_x) | (y != old_y))
+        if len(moved):
+            ships.update_sectors()
+            ships.last_update_ns[moved] = self.game_state.game_time_ns
+        
+        return len(moved)
     
     def get_sector_info(self, coord: Coordinate) -> Dict[str, Any]:
         """Get information about a sector"""
@@ -259,13 +314,8 @@ class GameEngine:
             return []
         
         sector = get_sector(coord)
-        ships_in_sector = []
-        
-        for ship in self.game_state.ships.values():
-            if ship.status == 'active' and same_sector(ship.position, coord):
-                ships_in_sector.append(ship)
-        
-        return ships_in_sector
+        ships = self.game_state.ships
+        return [Ship(ships, i) for i in ships.in_sector(sector.x, sector.y)]
     
     def get_ship_distance(self, ship1_id: str, ship2_id: str) -> Optional[float]:
         """Get distance between two ships"""
@@ -287,6 +337,52 @@ class GameEngine:
         
         return bearing(ship1.position, ship2.position, ship1.heading)
     
+    def distances_from(self, ship_id: str,
+                       other_ids: Optional[List[str]] = None) -> Optional[np.ndarray]:
+        """
+        Get distances from one ship to many others at once
+        
+        Args:
+            ship_id: Ship to measure from
+            other_ids: Ships to measure to; all ships in table order by default
+            
+        Returns:
+            Array of distances, or None if any ship is unknown
+        """
+        if not self.game_state:
+            return None
+        
+        ships = self.game_state.ships
+        try:
+            index = ships.index_of[ship_id]
+            rows = None if other_ids is None else [ships.index_of[i] for i in other_ids]
+        except KeyError:
+            return None
+        return ships.distances_from(index, rows)
+    
+    def bearings_from(self, ship_id: str,
+                      other_ids: Optional[List[str]] = None) -> Optional[np.ndarray]:
+        """
+        Get bearings from one ship to many others at once
+        
+        Args:
+            ship_id: Ship to measure from
+            other_ids: Ships to measure to; all ships in table order by default
+            
+        Returns:
+            Array of bearings, or None if any ship is unknown
+        """
+        if not self.game_state:
+            return None
+        
+        ships = self.game_state.ships
+        try:
+            index = ships.index_of[ship_id]
+            rows = None if other_ids is None else [ships.index_of[i] for i in other_ids]
+        except KeyError:
+            return None
+        return ships.bearings_from(index, rows)
+    
     def set_beacon_message(self, coord: Coordinate, message: str):
         """Set a beacon message for a sector"""
         if not self.game_state:
@@ -295,10 +391,16 @@ class GameEngine:
         self.game_state.galaxy_map.set_beacon_message(coord, message)
     
     def increment_tick(self):
-        """Increment the global game tick counter"""
+        """
+        Increment the global game tick counter
+        
+        The clock is read once here; everything updated during the tick
+        uses game_time_ns as its timestamp.
+        """
         if self.game_state:
             self.game_state.tick_number += 1
-            self.game_state.game_time = datetime.utcnow()
+            self.game_state.game_time_ns = time.time_ns()
+            self.update_all_ship_movement()
             logger.debug(f"Game tick incremented to {self.game_state.tick_number}")
     
     def get_current_tick(self) -> int:
@@ -327,8 +429,7 @@ class GameEngine:
                 'tick_system': {}
             }
         
-        active_ships = sum(1 for ship in self.game_state.ships.values() 
-                          if ship.status == 'active')
+        active_ships = self.game_state.ships.count_status(ShipStatus.ACTIVE)
         
         galaxy_stats = self.game_state.galaxy_map.get_galaxy_statistics()
         tick_stats = self.game_state.tick_system.get_stats()
@@ -337,41 +438,42 @@ class GameEngine:
             'total_ships': len(self.game_state.ships),
             'active_ships': active_ships,
             'game_running': self.game_state.running,
-            'game_time': self.game_state.game_time.isoformat(),
+            'game_time': ns_to_datetime(self.game_state.game_time_ns).isoformat(),
             'tick_number': self.game_state.tick_number,
             'galaxy': galaxy_stats,
             'tick_system': tick_stats
         }
     
-    def get_ship_status(self, ship_id: str) -> Optional[Dict[str, Any]]:
+    def get_ship_status(self, ship_id: str) -> Optional[ShipStatusDTO]:
         """Get detailed ship status"""
-        ship = self.get_ship(ship_id)
-        if not ship:
+        if not self.game_state:
             return None
         
-        sector_info = self.get_sector_info(ship.position)
+        ships = self.game_state.ships
+        i = ships.index_of.get(ship_id)
+        if i is None:
+            return None
         
-        return {
-            'ship_id': ship.ship_id,
-            'user_id': ship.user_id,
-            'ship_name': ship.ship_name,
-            'ship_class': ship.ship_class,
-            'position': {
-                'x': ship.position.x,
-                'y': ship.position.y
-            },
-            'heading': ship.heading,
-            'speed': ship.speed,
-            'max_speed': ship.max_speed,
-            'energy': ship.energy,
-            'shields': ship.shields,
-            'max_shields': ship.max_shields,
-            'damage': ship.damage,
-            'status': ship.status,
-            'team_id': ship.team_id,
-            'last_update': ship.last_update.isoformat(),
-            'sector': sector_info
-        }
+        x, y = float(ships.x[i]), float(ships.y[i])
+        
+        return ShipStatusDTO(
+            ship_id=ships.ids[i],
+            user_id=ships.user_ids[i],
+            ship_name=ships.ship_names[i],
+            ship_class=int(ships.ship_class[i]),
+            position=ShipPosition(x, y),
+            heading=float(ships.heading[i]),
+            speed=float(ships.speed[i]),
+            max_speed=float(CLASS_MAX_SPEED[class_rows(ships.ship_class[i])]),
+            energy=int(ships.energy[i]),
+            shields=int(ships.shields[i]),
+            max_shields=int(ships.max_shields[i]),
+            damage=float(ships.damage[i]),
+            status=ShipStatus(ships.status[i]).label,
+            team_id=ships.team_ids[i],
+            last_update=ns_to_datetime(int(ships.last_update_ns[i])).isoformat(),
+            sector=self.get_sector_info(Coordinate(x, y))
+        )
     
     async def cleanup(self):
         """Cleanup game engine resources"""
@@ -6,16 +6,100 @@ including mine deployment, field patterns, and tactical mine warfare.
 """
 
 from typing import Dict, List, Optional, Any, Tuple
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
 import random
 import math
+import numpy as np
 
 from ..models.mine import Mine, MineConstants
 from ..models.user import User
 from ..models.ship import Ship
-from ..core.coordinates import calculate_distance, calculate_bearing
+from ..core.coordinates import calculate_bearings
+
+# Random number generator for detection rolls
+_rng = np.random.default_rng()
+
+# Channels mines can be assigned
+MINE_CHANNELS = range(1000, 10000)
+
+# Mine type names, indexed by mine type
+MINE_TYPE_NAMES = (
+    "Standard",     # Standard proximity mine
+    "Proximity",    # Enhanced proximity detection
+    "Magnetic",     # Magnetic field detection
+    "Thermal",      # Heat signature detection
+    "Gravimetric",  # Mass detection
+    "Decoy",        # Decoy mine (fake)
+    "Cluster",      # Cluster mine (explodes into multiple)
+    "EMP",          # EMP mine (disables systems)
+    "Stealth",      # Stealth mine (harder to detect)
+    "Anti-Fighter"  # Specialized anti-fighter mine
+)
+
+# Per mine type modifiers, indexed by mine type; unknown types use 1.0
+_DETECTION_TYPE_MODIFIERS = np.array([
+    1.0,    # Standard - normal detection
+    0.9,    # Proximity - slightly harder
+    0.8,    # Magnetic - harder
+    0.7,    # Thermal - much harder
+    0.6,    # Gravimetric - very hard
+    1.0,    # Decoy - easy to detect (it's fake)
+    0.8,    # Cluster - harder
+    0.7,    # EMP - harder
+    0.3,    # Stealth - very hard to detect
+    0.9     # Anti-Fighter - slightly harder
+])
+
+_DAMAGE_TYPE_MODIFIERS = np.array([
+    1.0,    # Standard
+    1.2,    # Proximity - more damage
+    0.8,    # Magnetic - less damage
+    1.1,    # Thermal - slightly more
+    1.3,    # Gravimetric - much more damage
+    0.0,    # Decoy - no damage
+    1.5,    # Cluster - lots of damage
+    0.5,    # EMP - less damage but disables systems
+    1.0,    # Stealth - normal damage
+    0.7     # Anti-Fighter - less damage to capital ships
+])
+
+_DISARM_TYPE_MODIFIERS = np.array([
+    1.0,    # Standard - normal difficulty
+    0.8,    # Proximity - harder
+    0.9,    # Magnetic - slightly harder
+    0.7,    # Thermal - harder
+    0.5,    # Gravimetric - very hard
+    1.0,    # Decoy - easy (it's fake)
+    0.6,    # Cluster - harder
+    0.8,    # EMP - harder
+    0.4,    # Stealth - very hard
+    0.7     # Anti-Fighter - harder
+])
+
+# Sensor quality by ship class; other classes use 1.0
+_SHIP_DETECTION_MODIFIERS = {
+    "Interceptor": 1.2,    # Better sensors
+    "Destroyer": 1.1,      # Good sensors
+    "Cruiser": 1.0,        # Normal sensors
+    "Freighter": 0.8,      # Poor sensors
+    "Fighter": 1.3         # Excellent sensors
+}
+
+
+def _type_modifier(modifiers: np.ndarray, mine_type: int) -> float:
+    """Look up the modifier of one mine type"""
+    if 0 <= mine_type < len(modifiers):
+        return float(modifiers[mine_type])
+    return 1.0
+
+
+def _type_modifiers(modifiers: np.ndarray, mine_types: np.ndarray) -> np.ndarray:
+    """Look up the modifiers of many mine types"""
+    known = (mine_types >= 0) & (mine_types < len(modifiers))
+    return np.where(known, modifiers[np.where(known, mine_types, 0)], 1.0)
 
 
 class MineService:
@@ -27,44 +111,15 @@ class MineService:
         self.decoy_time = MineConstants.DECOYTIME  # 15 ticks
         self.mine_damage_max = MineConstants.MINE_DAMAGE_MAX  # 100 damage
         
-        self.mine_types = {
-            0: "Standard",     # Standard proximity mine
-            1: "Proximity",    # Enhanced proximity detection
-            2: "Magnetic",     # Magnetic field detection
-            3: "Thermal",      # Heat signature detection
-            4: "Gravimetric",  # Mass detection
-            5: "Decoy",        # Decoy mine (fake)
-            6: "Cluster",      # Cluster mine (explodes into multiple)
-            7: "EMP",          # EMP mine (disables systems)
-            8: "Stealth",      # Stealth mine (harder to detect)
-            9: "Anti-Fighter"  # Specialized anti-fighter mine
-        }
+        # Valid mine types by number, for validation and listings
+        self.mine_types = dict(enumerate(MINE_TYPE_NAMES))
     
     def lay_mine(self, db: Session, user_id: int, ship_id: int, x_coord: float, y_coord: float,
                 mine_type: int = 0, damage_potential: int = None, is_visible: bool = False) -> Dict[str, Any]:
         """
         Lay a mine at specified coordinates
         """
-        # Get user and ship
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-        
-        ship = db.query(Ship).filter(Ship.id == ship_id, Ship.owner_id == user_id).first()
-        if not ship:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Ship not found"
-            )
-        
-        # Check if user has reached mine limit
-        user_mines = db.query(Mine).filter(
-            Mine.owner_id == user_id,
-            Mine.is_active == True
-        ).count()
+        user_mines = self._validate_lay(db, user_id, ship_id)
         
         if user_mines >= self.max_mines:
             raise HTTPException(
@@ -72,12 +127,7 @@ class MineService:
                 detail=f"Maximum mine limit reached ({self.max_mines} mines)"
             )
         
-        # Validate mine type
-        if mine_type not in self.mine_types:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid mine type. Valid types: {list(self.mine_types.keys())}"
-            )
+        self._validate_mine_type(mine_type)
         
         # Set default damage potential
         if damage_potential is None:
@@ -87,43 +137,24 @@ class MineService:
         channel = self._generate_mine_channel(db)
         
         # Create mine
-        mine = Mine(
-            channel=channel,
-            timer=0,  # Timer for decoy mines
-            x_coord=x_coord,
-            y_coord=y_coord,
-            owner_id=user_id,
-            is_active=True,
-            damage_potential=damage_potential,
-            mine_type=mine_type,
-            is_armed=True,
-            is_visible=is_visible,
-            armed_at=datetime.utcnow()
-        )
+        mine = self._new_mine(channel, x_coord, y_coord, user_id, mine_type,
+                              damage_potential, is_visible, datetime.utcnow())
         
         db.add(mine)
         db.commit()
         db.refresh(mine)
         
-        return {
-            "id": mine.id,
-            "channel": mine.channel,
-            "x_coord": mine.x_coord,
-            "y_coord": mine.y_coord,
-            "mine_type": mine.mine_type,
-            "mine_type_name": self.mine_types[mine.mine_type],
-            "damage_potential": mine.damage_potential,
-            "is_visible": mine.is_visible,
-            "is_armed": mine.is_armed,
-            "armed_at": mine.armed_at.isoformat(),
-            "total_mines": user_mines + 1
-        }
+        return self._laid_mine_info(mine, user_mines + 1)
     
     def lay_mine_field(self, db: Session, user_id: int, ship_id: int, center_x: float, center_y: float,
                       field_size: int, mine_count: int, mine_type: int = 0, 
                       pattern: str = "grid") -> Dict[str, Any]:
         """
         Lay a mine field with multiple mines in a pattern
+        
+        The user and ship are checked once and all mines are inserted in a
+        single transaction. Mines beyond the user's limit are not laid and
+        count as failed, up to 3.
         """
         if mine_count > self.max_mines:
             raise HTTPException(
@@ -140,17 +171,34 @@ class MineService:
         # Generate mine positions based on pattern
         positions = self._generate_mine_field_positions(center_x, center_y, field_size, mine_count, pattern)
         
-        laid_mines = []
-        failed_count = 0
+        # Work out how many of the mines can be laid
+        try:
+            user_mines = self._validate_lay(db, user_id, ship_id)
+            self._validate_mine_type(mine_type)
+            available = max(0, self.max_mines - user_mines)
+        except HTTPException:
+            user_mines = available = 0
+        
+        positions_to_lay = positions[:available]
+        failed_count = min(3, len(positions) - len(positions_to_lay))  # Stop after 3 failures
         
-        for x_coord, y_coord in positions:
-            try:
-                result = self.lay_mine(db, user_id, ship_id, x_coord, y_coord, mine_type)
-                laid_mines.append(result)
-            except HTTPException:
-                failed_count += 1
-                if failed_count >= 3:  # Stop after 3 failures
-                    break
+        laid_mines = []
+        if positions_to_lay:
+            channels = self._generate_mine_channels(db, len(positions_to_lay))
+            armed_at = datetime.utcnow()
+            mines = [
+                self._new_mine(channel, x_coord, y_coord, user_id, mine_type,
+                               random.randint(50, self.mine_damage_max), False, armed_at)
+                for channel, (x_coord, y_coord) in zip(channels, positions_to_lay)
+            ]
+            
+            db.add_all(mines)
+            db.flush()
+            laid_mines = [
+                self._laid_mine_info(mine, user_mines + n)
+                for n, mine in enumerate(mines, 1)
+            ]
+            db.commit()
         
         return {
             "message": f"Laid {len(laid_mines)} mines in field",
@@ -166,6 +214,74 @@ class MineService:
             "mines": laid_mines
         }
     
+    def _validate_lay(self, db: Session, user_id: int, ship_id: int) -> int:
+        """
+        Check that a user and their ship can lay mines
+        
+        Returns:
+            Number of active mines the user already has
+        """
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        
+        ship = db.query(Ship).filter(Ship.id == ship_id, Ship.owner_id == user_id).first()
+        if not ship:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Ship not found"
+            )
+        
+        return db.query(Mine).filter(
+            Mine.owner_id == user_id,
+            Mine.is_active == True
+        ).count()
+    
+    def _validate_mine_type(self, mine_type: int):
+        """Check that a mine type exists"""
+        if mine_type not in self.mine_types:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid mine type. Valid types: {list(self.mine_types.keys())}"
+            )
+    
+    def _new_mine(self, channel: int, x_coord: float, y_coord: float, user_id: int,
+                  mine_type: int, damage_potential: int, is_visible: bool,
+                  armed_at: datetime) -> Mine:
+        """Create an armed mine"""
+        return Mine(
+            channel=channel,
+            timer=0,  # Timer for decoy mines
+            x_coord=x_coord,
+            y_coord=y_coord,
+            owner_id=user_id,
+            is_active=True,
+            damage_potential=damage_potential,
+            mine_type=mine_type,
+            is_armed=True,
+            is_visible=is_visible,
+            armed_at=armed_at
+        )
+    
+    def _laid_mine_info(self, mine: Mine, total_mines: int) -> Dict[str, Any]:
+        """Describe a newly laid mine"""
+        return {
+            "id": mine.id,
+            "channel": mine.channel,
+            "x_coord": mine.x_coord,
+            "y_coord": mine.y_coord,
+            "mine_type": mine.mine_type,
+            "mine_type_name": MINE_TYPE_NAMES[mine.mine_type],
+            "damage_potential": mine.damage_potential,
+            "is_visible": mine.is_visible,
+            "is_armed": mine.is_armed,
+            "armed_at": mine.armed_at.isoformat(),
+            "total_mines": total_mines
+        }
+    
     def detect_mines(self, db: Session, x_coord: float, y_coord: float, 
                     detection_range: float = None, ship_class: str = None) -> List[Dict[str, Any]]:
         """
@@ -174,37 +290,55 @@ class MineService:
         if detection_range is None:
             detection_range = self.mine_range
         
-        # Find mines in range
-        mines = db.query(Mine).filter(Mine.is_active == True, Mine.is_armed == True).all()
+        # Load the armed mines in the bounding box of the detection range,
+        # as plain rows rather than ORM objects
+        mines = db.query(
+            Mine.id, Mine.channel, Mine.x_coord, Mine.y_coord, Mine.mine_type,
+            Mine.damage_potential, Mine.is_visible, Mine.armed_at
+        ).filter(
+            Mine.is_active == True,
+            Mine.is_armed == True,
+            Mine.x_coord.between(x_coord - detection_range, x_coord + detection_range),
+            Mine.y_coord.between(y_coord - detection_range, y_coord + detection_range)
+        ).all()
+        if not mines:
+            return []
+        
+        # Measure all mines at once; only those in range are looked at further
+        xs = np.array([mine.x_coord for mine in mines], dtype=np.float64)
+        ys = np.array([mine.y_coord for mine in mines], dtype=np.float64)
+        distances = np.hypot(xs - x_coord, ys - y_coord)
+        in_range = np.flatnonzero(distances <= detection_range)
+        bearings = calculate_bearings(x_coord, y_coord, xs[in_range], ys[in_range])
+        
+        # Calculate detection probability based on mine type and ship class
+        mine_types = np.array([mines[i].mine_type for i in in_range.tolist()], dtype=np.int64)
+        probabilities = self._calculate_detection_probabilities(
+            mine_types, ship_class, distances[in_range], detection_range
+        )
+        
+        # Roll for detection of all mines at once, then sort by distance
+        detected = np.flatnonzero(_rng.random(len(in_range)) < probabilities)
+        detected = detected[np.argsort(distances[in_range[detected]], kind="stable")]
         
         detected_mines = []
-        for mine in mines:
-            distance = calculate_distance(x_coord, y_coord, mine.x_coord, mine.y_coord)
-            if distance <= detection_range:
-                # Calculate detection probability based on mine type and ship class
-                detection_probability = self._calculate_detection_probability(
-                    mine.mine_type, ship_class, distance, detection_range
-                )
-                
-                # Roll for detection
-                if random.random() < detection_probability:
-                    detected_mines.append({
-                        "id": mine.id,
-                        "channel": mine.channel,
-                        "x_coord": mine.x_coord,
-                        "y_coord": mine.y_coord,
-                        "distance": distance,
-                        "bearing": calculate_bearing(x_coord, y_coord, mine.x_coord, mine.y_coord),
-                        "mine_type": mine.mine_type,
-                        "mine_type_name": self.mine_types[mine.mine_type],
-                        "damage_potential": mine.damage_potential,
-                        "is_visible": mine.is_visible,
-                        "detection_confidence": detection_probability,
-                        "armed_at": mine.armed_at.isoformat() if mine.armed_at else None
-                    })
-        
-        # Sort by distance
-        detected_mines.sort(key=lambda x: x["distance"])
+        for j in detected.tolist():
+            i = int(in_range[j])
+            mine = mines[i]
+            detected_mines.append({
+                "id": mine.id,
+                "channel": mine.channel,
+                "x_coord": mine.x_coord,
+                "y_coord": mine.y_coord,
+                "distance": float(distances[i]),
+                "bearing": float(bearings[j]),
+                "mine_type": mine.mine_type,
+                "mine_type_name": MINE_TYPE_NAMES[mine.mine_type],
+                "damage_potential": mine.damage_potential,
+                "is_visible": mine.is_visible,
+                "detection_confidence": float(probabilities[j]),
+                "armed_at": mine.armed_at.isoformat() if mine.armed_at else None
+            })
         
         return detected_mines
     
@@ -249,9 +383,9 @@ class MineService:
         db.commit()
         
         return {
-            "message": f"Mine triggered! {self.mine_types[mine.mine_type]} mine exploded",
+            "message": f"Mine triggered! {MINE_TYPE_NAMES[mine.mine_type]} mine exploded",
             "mine_type": mine.mine_type,
-            "mine_type_name": self.mine_types[mine.mine_type],
+            "mine_type_name": MINE_TYPE_NAMES[mine.mine_type],
             "total_damage": damage,
             "shield_damage": shield_damage,
             "hull_damage": hull_damage,
@@ -288,7 +422,7 @@ class MineService:
             return {
                 "message": "Mine disarmed successfully",
                 "mine_id": mine.id,
-                "mine_type": self.mine_types[mine.mine_type],
+                "mine_type": MINE_TYPE_NAMES[mine.mine_type],
                 "disarmed_by": "owner"
             }
         
@@ -303,7 +437,7 @@ class MineService:
             return {
                 "message": "Mine disarmed successfully",
                 "mine_id": mine.id,
-                "mine_type": self.mine_types[mine.mine_type],
+                "mine_type": MINE_TYPE_NAMES[mine.mine_type],
                 "disarmed_by": "enemy",
                 "disarm_probability": disarm_probability
             }
@@ -318,14 +452,14 @@ class MineService:
                 return {
                     "message": "Disarm attempt failed - mine exploded!",
                     "mine_id": mine.id,
-                    "mine_type": self.mine_types[mine.mine_type],
+                    "mine_type": MINE_TYPE_NAMES[mine.mine_type],
                     "exploded": True
                 }
             else:
                 return {
                     "message": "Disarm attempt failed",
                     "mine_id": mine.id,
-                    "mine_type": self.mine_types[mine.mine_type],
+                    "mine_type": MINE_TYPE_NAMES[mine.mine_type],
                     "exploded": False,
                     "disarm_probability": disarm_probability
                 }
@@ -344,7 +478,7 @@ class MineService:
                 "x_coord": mine.x_coord,
                 "y_coord": mine.y_coord,
                 "mine_type": mine.mine_type,
-                "mine_type_name": self.mine_types[mine.mine_type],
+                "mine_type_name": MINE_TYPE_NAMES[mine.mine_type],
                 "damage_potential": mine.damage_potential,
                 "is_armed": mine.is_armed,
                 "is_visible": mine.is_visible,
@@ -356,30 +490,31 @@ class MineService:
     
     def get_mine_field_statistics(self, db: Session) -> Dict[str, Any]:
         """Get mine field system statistics"""
-        total_mines = db.query(Mine).filter(Mine.is_active == True).count()
-        armed_mines = db.query(Mine).filter(
-            Mine.is_active == True,
-            Mine.is_armed == True
-        ).count()
-        
-        exploded_mines = db.query(Mine).filter(
-            Mine.exploded_at.isnot(None)
-        ).count()
+        # All counts come from one pass over the mines, grouped by type
+        recent_cutoff = datetime.utcnow() - timedelta(hours=24)
+        rows = db.query(
+            Mine.mine_type,
+            func.count().filter(Mine.is_active == True),
+            func.count().filter(and_(Mine.is_active == True, Mine.is_armed == True)),
+            func.count().filter(Mine.exploded_at.isnot(None)),
+            # Recent mines (last 24 hours)
+            func.count().filter(and_(Mine.is_active == True, Mine.armed_at > recent_cutoff))
+        ).group_by(Mine.mine_type).all()
+        
+        total_mines = armed_mines = exploded_mines = recent_mines = 0
+        active_by_type = {}
+        for mine_type, active, armed, exploded, recent in rows:
+            total_mines += active
+            armed_mines += armed
+            exploded_mines += exploded
+            recent_mines += recent
+            active_by_type[mine_type] = active
         
         # Count by type
-        type_counts = {}
-        for mine_type, type_name in self.mine_types.items():
-            count = db.query(Mine).filter(
-                Mine.mine_type == mine_type,
-                Mine.is_active == True
-            ).count()
-            type_counts[type_name] = count
-        
-        # Recent mines (last 24 hours)
-        recent_mines = db.query(Mine).filter(
-            Mine.is_active == True,
-            Mine.armed_at > datetime.utcnow() - timedelta(hours=24)
-        ).count()
+        type_counts = {
+            type_name: active_by_type.get(mine_type, 0)
+            for mine_type, type_name in enumerate(MINE_TYPE_NAMES)
+        }
         
         return {
             "total_mines": total_mines,
@@ -393,11 +528,18 @@ class MineService:
     
     def _generate_mine_channel(self, db: Session) -> int:
         """Generate a unique channel for a mine"""
-        while True:
-            channel = random.randint(1000, 9999)
-            existing = db.query(Mine).filter(Mine.channel == channel).first()
-            if not existing:
-                return channel
+        return self._generate_mine_channels(db, 1)[0]
+    
+    def _generate_mine_channels(self, db: Session, count: int) -> List[int]:
+        """Pick unique channels for several mines from those not yet in use"""
+        used = {channel for (channel,) in db.query(Mine.channel)}
+        available = [channel for channel in MINE_CHANNELS if channel not in used]
+        if len(available) < count:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Not enough free mine channels"
+            )
+        return random.sample(available, count)
     
     def _generate_mine_field_positions(self, center_x: float, center_y: float, 
                                      field_size: int, mine_count: int, pattern: str) -> List[Tuple[float, float]]:
@@ -409,19 +551,18 @@ class MineService:
             grid_size = int(math.sqrt(mine_count))
             spacing = field_size / grid_size
             
-            for i in range(mine_count):
-                x = center_x + (i % grid_size - grid_size // 2) * spacing
-                y = center_y + (i // grid_size - grid_size // 2) * spacing
-                positions.append((x, y))
+            i = np.arange(mine_count)
+            xs = center_x + (i % grid_size - grid_size // 2) * spacing
+            ys = center_y + (i // grid_size - grid_size // 2) * spacing
+            positions = list(zip(xs.tolist(), ys.tolist()))
         
         elif pattern == "circular":
             # Circular pattern
             radius = field_size / 2
-            for i in range(mine_count):
-                angle = (2 * math.pi * i) / mine_count
-                x = center_x + radius * math.cos(angle)
-                y = center_y + radius * math.sin(angle)
-                positions.append((x, y))
+            angles = (2 * np.pi * np.arange(mine_count)) / mine_count
+            xs = center_x + radius * np.cos(angles)
+            ys = center_y + radius * np.sin(angles)
+            positions = list(zip(xs.tolist(), ys.tolist()))
         
         elif pattern == "random":
             # Random pattern
@@ -440,55 +581,29 @@ class MineService:
         # Reduce probability based on distance
         distance_factor = 1.0 - (distance / max_range)
         
-        # Modify based on mine type
-        type_modifiers = {
-            0: 1.0,    # Standard - normal detection
-            1: 0.9,    # Proximity - slightly harder
-            2: 0.8,    # Magnetic - harder
-            3: 0.7,    # Thermal - much harder
-            4: 0.6,    # Gravimetric - very hard
-            5: 1.0,    # Decoy - easy to detect (it's fake)
-            6: 0.8,    # Cluster - harder
-            7: 0.7,    # EMP - harder
-            8: 0.3,    # Stealth - very hard to detect
-            9: 0.9     # Anti-Fighter - slightly harder
-        }
-        
-        type_modifier = type_modifiers.get(mine_type, 1.0)
-        
-        # Ship class modifiers (if available)
-        ship_modifiers = {
-            "Interceptor": 1.2,    # Better sensors
-            "Destroyer": 1.1,      # Good sensors
-            "Cruiser": 1.0,        # Normal sensors
-            "Freighter": 0.8,      # Poor sensors
-            "Fighter": 1.3         # Excellent sensors
-        }
-        
-        ship_modifier = ship_modifiers.get(ship_class, 1.0)
+        # Modify based on mine type and ship class (if available)
+        type_modifier = _type_modifier(_DETECTION_TYPE_MODIFIERS, mine_type)
+        ship_modifier = _SHIP_DETECTION_MODIFIERS.get(ship_class, 1.0)
         
         final_probability = base_probability * distance_factor * type_modifier * ship_modifier
         return max(0.1, min(1.0, final_probability))  # Clamp between 10% and 100%
     
+    def _calculate_detection_probabilities(self, mine_types: np.ndarray, ship_class: str,
+                                           distances: np.ndarray, max_range: float) -> np.ndarray:
+        """Vectorized _calculate_detection_probability for many mines"""
+        distance_factors = 1.0 - (distances / max_range)
+        type_modifiers = _type_modifiers(_DETECTION_TYPE_MODIFIERS, mine_types)
+        ship_modifier = _SHIP_DETECTION_MODIFIERS.get(ship_class, 1.0)
+        
+        probabilities = 0.8 * distance_factors * type_modifiers * ship_modifier
+        return np.clip(probabilities, 0.1, 1.0)
+    
     def _calculate_mine_damage(self, mine: Mine, ship: Ship) -> int:
         """Calculate damage dealt by mine to ship"""
         base_damage = mine.damage_potential
         
         # Modify damage based on mine type
-        type_damage_modifiers = {
-            0: 1.0,    # Standard
-            1: 1.2,    # Proximity - more damage
-            2: 0.8,    # Magnetic - less damage
-            3: 1.1,    # Thermal - slightly more
-            4: 1.3,    # Gravimetric - much more damage
-            5: 0.0,    # Decoy - no damage
-            6: 1.5,    # Cluster - lots of damage
-            7: 0.5,    # EMP - less damage but disables systems
-            8: 1.0,    # Stealth - normal damage
-            9: 0.7     # Anti-Fighter - less damage to capital ships
-        }
-        
-        damage_modifier = type_damage_modifiers.get(mine.mine_type, 1.0)
+        damage_modifier = _type_modifier(_DAMAGE_TYPE_MODIFIERS, mine.mine_type)
         
         # Apply some randomness
         random_factor = random.uniform(0.8, 1.2)
@@ -501,20 +616,7 @@ class MineService:
         base_probability = 0.6  # 60% base chance
         
         # Modify based on mine type
-        type_modifiers = {
-            0: 1.0,    # Standard - normal difficulty
-            1: 0.8,    # Proximity - harder
-            2: 0.9,    # Magnetic - slightly harder
-            3: 0.7,    # Thermal - harder
-            4: 0.5,    # Gravimetric - very hard
-            5: 1.0,    # Decoy - easy (it's fake)
-            6: 0.6,    # Cluster - harder
-            7: 0.8,    # EMP - harder
-            8: 0.4,    # Stealth - very hard
-            9: 0.7     # Anti-Fighter - harder
-        }
-        
-        type_modifier = type_modifiers.get(mine.mine_type, 1.0)
+        type_modifier = _type_modifier(_DISARM_TYPE_MODIFIERS, mine.mine_type)
         
         return base_probability * type_modifier
 
@@ -8,12 +8,25 @@ rotation, and movement calculations ported from the original C code.
 import math
 from typing import Optional
 from dataclasses import dataclass
-from .coordinates import Coordinate, deg_to_rad, wrap_coordinate, clamp_to_galaxy
+import numpy as np
+from .coordinates import Coordinate, wrap_coordinate, clamp_to_galaxy, UNIVMAX
 
+try:
+    from numba import njit, prange
+except ImportError:  # optional dependency; batches are stepped with NumPy instead
+    njit = None
+    prange = range
 
-@dataclass
+# Movement scaling factor from original code
+MOVEMENT_SCALE = 65000.0
+
+# Degrees to radians, as in coordinates.deg_to_rad
+_DEG2RAD = math.pi / 180
+
+
+@dataclass(slots=True)
 class MovementState:
-    """Current movement state of a ship"""
+    """Current movement state of a ship (updated in place by the movement operations)"""
     position: Coordinate
     heading: float  # 0-360 degrees
     speed: float
@@ -34,37 +47,62 @@ class MovementPhysics:
         self.movement_scale = 65000.0
     
     def calculate_movement(self, state: MovementState, wrap_enabled: bool = True) -> MovementState:
-        """Calculate new position based on current movement state"""
+        """Move the ship one step along its heading, updating the state in place"""
         if state.speed <= 0:
             return state
         
         # Calculate movement delta using trigonometry
         # Original formula: coord += (speed * sin/cos(heading)) / 65000.0
-        dx = (state.speed * math.sin(deg_to_rad(state.heading))) / self.movement_scale
-        dy = (state.speed * math.cos(deg_to_rad(state.heading))) / self.movement_scale
+        rad = state.heading * _DEG2RAD
+        step = state.speed / self.movement_scale
+        dx = step * math.sin(rad)
+        dy = step * math.cos(rad)
         
         # Apply movement (note: Y is inverted in original coordinate system)
-        new_x = state.position.x + dx
-        new_y = state.position.y - dy  # Y is inverted
+        new_position = Coordinate(state.position.x + dx, state.position.y - dy)
+        
+        # Handle galaxy boundaries
+        if wrap_enabled:
+            state.position = wrap_coordinate(new_position, wrap_enabled)
+        else:
+            state.position = clamp_to_galaxy(new_position)
+        
+        return state
+    
+    def calculate_movement_batch(self, positions: np.ndarray, headings: np.ndarray,
+                                 speeds: np.ndarray, wrap_enabled: bool = True) -> np.ndarray:
+        """
+        Vectorized calculate_movement for many ships
+        
+        Args:
+            positions: (N, 2) array of x, y coordinates
+            headings: Heading of each ship in degrees
+            speeds: Speed of each ship; ships with speed <= 0 stay put
+            wrap_enabled: Wrap around the galaxy edges instead of clamping
         
-        new_position = Coordinate(new_x, new_y)
+        Returns:
+            (N, 2) array of new positions
+        """
+        moving = speeds > 0
+        rad = headings * _DEG2RAD
+        step = np.where(moving, speeds / self.movement_scale, 0.0)
+        new_x = positions[:, 0] + step * np.sin(rad)
+        new_y = positions[:, 1] - step * np.cos(rad)  # Y is inverted
         
         # Handle galaxy boundaries
         if wrap_enabled:
-            new_position = wrap_coordinate(new_position, wrap_enabled)
+            span = UNIVMAX * 2
+            new_x = np.where(new_x > UNIVMAX, new_x - span, np.where(new_x < -UNIVMAX, new_x + span, new_x))
+            new_y = np.where(new_y > UNIVMAX, new_y - span, np.where(new_y < -UNIVMAX, new_y + span, new_y))
         else:
-            new_position = clamp_to_galaxy(new_position)
-        
-        return MovementState(
-            position=new_position,
-            heading=state.heading,
-            speed=state.speed,
-            target_speed=state.target_speed,
-            acceleration=state.acceleration,
-            deceleration=state.deceleration,
-            max_speed=state.max_speed,
-            max_acceleration=state.max_acceleration
-        )
+            new_x = np.clip(new_x, -UNIVMAX + 2, UNIVMAX - 2)
+            new_y = np.clip(new_y, -UNIVMAX + 2, UNIVMAX - 2)
+        
+        # Ships that are not moving are left exactly where they are
+        new_x = np.where(moving, new_x, positions[:, 0])
+        new_y = np.where(moving, new_y, positions[:, 1])
+        
+        return np.column_stack((new_x, new_y))
     
     def accelerate(self, state: MovementState, target_speed: float) -> MovementState:
         """Apply acceleration to reach target speed"""
@@ -89,20 +127,9 @@ class MovementPhysics:
     
     def rotate(self, state: MovementState, target_heading: float) -> MovementState:
         """Rotate ship to target heading"""
-        # Normalize headings to 0-360 range
-        current = state.heading % 360
-        target = target_heading % 360
-        
-        # Calculate shortest rotation direction
-        diff = target - current
-        if diff > 180:
-            diff -= 360
-        elif diff < -180:
-            diff += 360
-        
-        # Apply rotation (assuming instant rotation for now)
-        # In original code, rotation was also gradual
-        state.heading = target % 360
+        # Rotation is instant for now; in the original code it was gradual,
+        # stepping along the shorter direction toward the target
+        state.heading = target_heading % 360
         
         return state
     
@@ -147,14 +174,42 @@ class ShipMovement:
         self.physics = physics
     
     def move_ship(self, state: MovementState, wrap_enabled: bool = True) -> MovementState:
-        """Main ship movement function - equivalent to moveship() in original"""
+        """
+        Main ship movement function - equivalent to moveship() in original
+        
+        Applies MovementPhysics.accelerate toward the target speed and then
+        calculate_movement, inlined into one pass over the state. Like the
+        other movement operations, this updates the state in place and
+        returns it.
+        """
         # Apply acceleration to reach target speed
-        state = self.physics.accelerate(state, state.target_speed)
+        target_speed = max(0, min(state.target_speed, state.max_speed))
+        state.target_speed = target_speed
+        speed = state.speed
+        if abs(speed - target_speed) <= state.acceleration:
+            speed = target_speed
+        elif speed < target_speed:
+            speed += state.acceleration
+        else:
+            speed -= state.deceleration
+        state.speed = speed
+        
+        if speed <= 0:
+            return state
         
-        # Calculate new position
-        new_state = self.physics.calculate_movement(state, wrap_enabled)
+        # Calculate new position (Y is inverted in original coordinate system)
+        rad = state.heading * _DEG2RAD
+        step = speed / self.physics.movement_scale
+        new_position = Coordinate(state.position.x + step * math.sin(rad),
+                                  state.position.y - step * math.cos(rad))
         
-        return new_state
+        # Handle galaxy boundaries
+        if wrap_enabled:
+            state.position = wrap_coordinate(new_position, wrap_enabled)
+        else:
+            state.position = clamp_to_galaxy(new_position)
+        
+        return state
     
     def rotate_ship(self, state: MovementState, target_heading: float) -> MovementState:
         """Rotate ship to target heading"""
@@ -195,3 +250,100 @@ def create_movement_state(
         max_speed=max_speed,
         max_acceleration=max_acceleration
     )
+
+
+def _advance_ships_numpy(x, y, heading, speed, target_speed, target_heading,
+                         limit_row, max_speed, max_accel, active):
+    """NumPy version of advance_ships"""
+    idx = np.flatnonzero(active)
+    limits = limit_row[idx]
+    
+    # Rotation is instant, as in MovementPhysics.rotate
+    new_heading = np.mod(target_heading[idx], 360.0)
+    heading[idx] = new_heading
+    
+    # One acceleration step toward the clamped target speed
+    target = np.maximum(np.minimum(target_speed[idx], max_speed[limits]), 0.0)
+    current = speed[idx]
+    accel = max_accel[limits]
+    new_speed = np.where(np.abs(current - target) <= accel, target,
+                         np.where(current < target, current + accel, current - accel))
+    speed[idx] = new_speed
+    
+    moving = new_speed > 0
+    rad = new_heading * _DEG2RAD
+    new_x = x[idx] + np.where(moving, new_speed * np.sin(rad) / MOVEMENT_SCALE, 0.0)
+    new_y = y[idx] - np.where(moving, new_speed * np.cos(rad) / MOVEMENT_SCALE, 0.0)
+    
+    # Wrap around the galaxy edges
+    span = UNIVMAX * 2
+    x[idx] = np.where(new_x > UNIVMAX, new_x - span, np.where(new_x < -UNIVMAX, new_x + span, new_x))
+    y[idx] = np.where(new_y > UNIVMAX, new_y - span, np.where(new_y < -UNIVMAX, new_y + span, new_y))
+
+
+def _advance_ships_loop(x, y, heading, speed, target_speed, target_heading,
+                       limit_row, max_speed, max_accel, active):
+    """Per-ship loop version of advance_ships, compiled with numba when it is installed"""
+    span = UNIVMAX * 2
+    for i in prange(x.shape[0]):
+        if not active[i]:
+            continue
+        
+        h = target_heading[i] % 360.0
+        heading[i] = h
+        
+        target = min(target_speed[i], max_speed[limit_row[i]])
+        if target < 0.0:
+            target = 0.0
+        accel = max_accel[limit_row[i]]
+        s = speed[i]
+        if abs(s - target) <= accel:
+            s = target
+        elif s < target:
+            s += accel
+        else:
+            s -= accel
+        speed[i] = s
+        
+        if s > 0.0:
+            rad = h * _DEG2RAD
+            nx = x[i] + s * math.sin(rad) / MOVEMENT_SCALE
+            ny = y[i] - s * math.cos(rad) / MOVEMENT_SCALE
+            if nx > UNIVMAX:
+                nx -= span
+            elif nx < -UNIVMAX:
+                nx += span
+            if ny > UNIVMAX:
+                ny -= span
+            elif ny < -UNIVMAX:
+                ny += span
+            x[i] = nx
+            y[i] = ny
+
+
+if njit is not None:
+    _advance_ships = njit(parallel=True, fastmath=True, cache=True)(_advance_ships_loop)
+else:
+    _advance_ships = _advance_ships_numpy
+
+
+def advance_ships(x: np.ndarray, y: np.ndarray, heading: np.ndarray, speed: np.ndarray,
+                  target_speed: np.ndarray, target_heading: np.ndarray, limit_row: np.ndarray,
+                  max_speed: np.ndarray, max_accel: np.ndarray, active: np.ndarray):
+    """
+    Advance a batch of ships by one movement tick, in place
+    
+    Each active ship turns to its target heading, takes one acceleration
+    step toward its target speed and moves, wrapping at the galaxy edges;
+    the same rules as ShipMovement.rotate_ship followed by move_ship. The
+    loop is compiled with numba when it is installed.
+    
+    Args:
+        x, y, heading, speed: Ship state columns, updated in place
+        target_speed, target_heading: Requested speed and heading
+        limit_row: Row of each ship in the limit tables
+        max_speed, max_accel: Limit tables, e.g. indexed by ship class
+        active: Boolean mask of the ships to move
+    """
+    _advance_ships(x, y, heading, speed, target_speed, target_heading,
+                   limit_row, max_speed, max_accel, active)
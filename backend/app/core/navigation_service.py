@@ -5,93 +5,216 @@ This module provides navigation-related services including sector navigation,
 cargo management, ship maintenance, and other missing commands from the original game.
 """
 
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Mapping, Tuple
+from types import MappingProxyType
 import logging
 import math
+import numpy as np
 from datetime import datetime, timedelta
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
-from app.core.coordinates import Coordinate, get_sector, distance, bearing
+from app.core.coordinates import Coordinate, Sector, dist_sq, calculate_bearings
 from app.core.game_config import game_config
 from app.models.ship import Ship, ShipClass
 from app.models.planet import Planet
 from app.models.user import User
 from app.models.user_account import UserAccount
 
+try:
+    from numba import njit
+except ImportError:  # optional dependency; navigation math runs as plain Python
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Cargo item codes and the ship attribute that holds each
+ITEM_ATTRIBUTES: Mapping[str, str] = MappingProxyType({
+    "men": "men",
+    "tro": "troops",
+    "mis": "missiles",
+    "tor": "torpedoes",
+    "ion": "ion_cannons",
+    "flu": "flux_pods",
+    "foo": "food",
+    "fig": "fighters",
+    "dec": "decoys",
+    "min": "mines",
+    "jam": "jammers",
+    "zip": "zippers",
+    "gol": "gold"
+})
+
+# Base price of each cargo item at Zygor
+ITEM_BASE_PRICES: Mapping[str, int] = MappingProxyType({
+    "men": 2,
+    "tro": 1,
+    "mis": 20,
+    "tor": 7,
+    "ion": 33,
+    "flu": 200,
+    "foo": 2,
+    "fig": 50,
+    "dec": 18,
+    "min": 50,
+    "jam": 50,
+    "zip": 50,
+    "gol": 100
+})
+
+# Base costs for different ship classes
+SHIP_COSTS: Mapping[int, int] = MappingProxyType({
+    1: 50000,    # Interceptor
+    2: 100000,   # Light Freighter
+    3: 200000,   # Heavy Freighter
+    4: 500000,   # Destroyer
+    5: 1000000,  # Star Cruiser
+    6: 2000000,  # Battle Cruiser
+    7: 5000000,  # Frigate
+    8: 10000000, # Dreadnought
+    9: 20000000, # Flagship
+    10: 1500000, # Cyborg
+    11: 3000000  # Droid
+})
+
+SHIP_CLASS_NAMES: Mapping[int, str] = MappingProxyType({
+    1: "Interceptor",
+    2: "Light Freighter",
+    3: "Heavy Freighter",
+    4: "Destroyer",
+    5: "Star Cruiser",
+    6: "Battle Cruiser",
+    7: "Frigate",
+    8: "Dreadnought",
+    9: "Flagship",
+    10: "Cybertron",
+    11: "Droid"
+})
+
+
+def _navigation(x1: float, y1: float, x2: float, y2: float):
+    """
+    Distance, bearing, travel time estimate and both sectors for one leg
+    
+    The bearing follows coordinates.vector(); sectors are the integer part
+    of each coordinate, as in get_sector(). Compiled with numba when it is
+    installed.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    dist = math.sqrt(dx * dx + dy * dy)
+    
+    if dx == 0:
+        bear = 270.0
+    elif dx > 0 and dy == 0:
+        bear = 180.0
+    else:
+        bear = math.degrees(math.atan2(dx, -dy)) % 360.0
+    
+    # Estimate travel time (assuming average speed); this would need to be
+    # calculated based on ship's actual speed
+    estimated_time = dist / 50000.0  # Rough estimate in game ticks
+    
+    return (dist, bear, estimated_time,
+            int(math.floor(x1)), int(math.floor(y1)),
+            int(math.floor(x2)), int(math.floor(y2)))
+
+
+if njit is not None:
+    _navigation = njit(cache=True, fastmath=True)(_navigation)
+
 
 class NavigationService:
     """Service for navigation-related operations"""
     
     def __init__(self, db: Session):
         self.db = db
+        # Accounts already loaded by this service, keyed by user id
+        self._user_accounts: Dict[int, UserAccount] = {}
+    
+    def _get_user_account(self, user_id: int) -> Optional[UserAccount]:
+        """Get a user's account, querying only the first time it is needed"""
+        user_account = self._user_accounts.get(user_id)
+        if user_account is None:
+            user_account = self.db.query(UserAccount).filter(UserAccount.user_id == user_id).first()
+            if user_account is not None:
+                self._user_accounts[user_id] = user_account
+        return user_account
     
     def calculate_navigation(self, current_position: Coordinate, 
                            target_position: Coordinate) -> Dict[str, Any]:
         """Calculate navigation information between two points"""
         try:
-            # Calculate distance
-            dist = distance(current_position, target_position)
-            
-            # Calculate bearing
-            bear = bearing(current_position, target_position)
-            
-            # Estimate travel time (assuming average speed)
-            # This would need to be calculated based on ship's actual speed
-            estimated_time = dist / 50000.0  # Rough estimate in game ticks
+            dist, bear, estimated_time, cx, cy, tx, ty = _navigation(
+                current_position.x, current_position.y,
+                target_position.x, target_position.y
+            )
             
             return {
                 "distance": dist,
                 "bearing": bear,
                 "estimated_time": estimated_time,
-                "current_sector": get_sector(current_position),
-                "target_sector": get_sector(target_position)
+                "current_sector": Sector(cx, cy),
+                "target_sector": Sector(tx, ty)
+            }
+        
+        except Exception as e:
+            logger.error("Error calculating navigation: %s", e)
+            raise
+    
+    def calculate_navigation_batch(self, current_positions: np.ndarray,
+                                   target_positions: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculate navigation information for many pairs of points at once
+        
+        Args:
+            current_positions: (N, 2) array of x, y starting points
+            target_positions: (N, 2) array of x, y destinations
+            
+        Returns:
+            The fields of calculate_navigation as arrays, with sectors as
+            (N, 2) integer arrays
+        """
+        try:
+            current = np.asarray(current_positions, dtype=np.float64)
+            target = np.asarray(target_positions, dtype=np.float64)
+            
+            dist = np.hypot(target[:, 0] - current[:, 0], target[:, 1] - current[:, 1])
+            
+            return {
+                "distance": dist,
+                "bearing": calculate_bearings(current[:, 0], current[:, 1],
+                                              target[:, 0], target[:, 1]),
+                "estimated_time": dist / 50000.0,  # Rough estimate in game ticks
+                "current_sector": np.floor(current).astype(np.int64),
+                "target_sector": np.floor(target).astype(np.int64)
             }
             
         except Exception as e:
-            logger.error(f"Error calculating navigation: {e}")
+            logger.error("Error calculating navigation batch: %s", e)
             raise
     
     def jettison_cargo(self, ship_id: int, item_type: str, 
                       quantity: Optional[int] = None) -> Dict[str, Any]:
         """Jettison cargo from ship"""
         try:
-            ship = self.db.query(Ship).filter(Ship.id == ship_id).first()
+            ship = self.db.get(Ship, ship_id)
             if not ship:
                 return {"success": False, "message": "Ship not found"}
             
-            # Map item types to ship attributes
-            item_mapping = {
-                "men": "men",
-                "tro": "troops", 
-                "mis": "missiles",
-                "tor": "torpedoes",
-                "ion": "ion_cannons",
-                "flu": "flux_pods",
-                "foo": "food",
-                "fig": "fighters",
-                "dec": "decoys",
-                "min": "mines",
-                "jam": "jammers",
-                "zip": "zippers",
-                "gol": "gold"
-            }
-            
-            if item_type not in item_mapping:
+            # Map item type to ship attribute
+            attr_name = ITEM_ATTRIBUTES.get(item_type)
+            if attr_name is None:
                 return {"success": False, "message": f"Unknown item type: {item_type}"}
             
             # Get current quantity
-            attr_name = item_mapping[item_type]
             current_quantity = getattr(ship, attr_name, 0)
             
             if current_quantity <= 0:
                 return {"success": False, "message": f"No {item_type} to jettison"}
             
-            # Determine quantity to jettison
-            if quantity is None:
-                jettison_quantity = current_quantity  # Jettison all
-            else:
-                jettison_quantity = min(quantity, current_quantity)
+            # Determine quantity to jettison (all of it when none is given)
+            requested = current_quantity if quantity is None else quantity
+            jettison_quantity = requested if requested < current_quantity else current_quantity
             
             # Update ship cargo
             new_quantity = current_quantity - jettison_quantity
@@ -108,37 +231,42 @@ class NavigationService:
                 "jettisoned": jettison_quantity,
                 "remaining": new_quantity
             }
-            
+        
         except Exception as e:
-            logger.error(f"Error jettisoning cargo: {e}")
+            logger.error("Error jettisoning cargo: %s", e)
             self.db.rollback()
             return {"success": False, "message": f"Jettison failed: {str(e)}"}
     
     def request_maintenance(self, ship_id: int, planet_id: Optional[int] = None) -> Dict[str, Any]:
         """Request ship maintenance"""
         try:
-            ship = self.db.query(Ship).filter(Ship.id == ship_id).first()
-            if not ship:
+            # The owner's account comes back with the ship
+            row = self.db.query(Ship, UserAccount).outerjoin(
+                UserAccount, UserAccount.user_id == Ship.user_id
+            ).filter(Ship.id == ship_id).first()
+            if not row:
                 return {"success": False, "message": "Ship not found"}
+            ship, user_account = row
+            if user_account is not None:
+                self._user_accounts[ship.user_id] = user_account
             
             # Determine maintenance location
             if planet_id:
-                planet = self.db.query(Planet).filter(Planet.id == planet_id).first()
+                planet = self.db.get(Planet, planet_id)
                 if not planet:
                     return {"success": False, "message": "Planet not found"}
                 
                 # Check if ship is in orbit around the planet
-                planet_distance = distance(
+                planet_dist_sq = dist_sq(
                     Coordinate(ship.x_coord, ship.y_coord),
                     Coordinate(planet.x_coord, planet.y_coord)
                 )
                 
-                if planet_distance > 250:
+                if planet_dist_sq > 250 * 250:
                     return {"success": False, "message": "Ship must be within 250 units of planet for maintenance"}
                 
                 # Check if planet belongs to user or is Zygor
-                user = self.db.query(User).filter(User.id == ship.user_id).first()
-                if planet.owner_id != user.id and planet.id != 1:  # Assuming Zygor is planet ID 1
+                if planet.owner_id != ship.user_id and planet.id != 1:  # Assuming Zygor is planet ID 1
                     return {"success": False, "message": "Can only get maintenance at own planets or Zygor"}
                 
                 # Calculate cost based on location
@@ -146,43 +274,38 @@ class NavigationService:
                     cost = 2500
                 else:
                     cost = 200
-                    
+            
             else:
-                # Use current planet if in orbit
-                current_sector = get_sector(Coordinate(ship.x_coord, ship.y_coord))
-                planets = self.db.query(Planet).filter(
-                    Planet.sector_x == current_sector.x,
-                    Planet.sector_y == current_sector.y
-                ).all()
+                # Use current planet if in orbit; the ship's stored sector
+                # selects the candidates
+                planets = self.db.query(
+                    Planet.id, Planet.owner_id, Planet.x_coord, Planet.y_coord
+                ).join(Ship, and_(
+                    Planet.xsect == Ship.sector_x,
+                    Planet.ysect == Ship.sector_y
+                )).filter(Ship.id == ship_id).all()
                 
                 if not planets:
                     return {"success": False, "message": "No planet available for maintenance"}
                 
-                # Find closest planet
-                closest_planet = None
-                min_distance = float('inf')
-                
-                for planet in planets:
-                    planet_distance = distance(
-                        Coordinate(ship.x_coord, ship.y_coord),
-                        Coordinate(planet.x_coord, planet.y_coord)
-                    )
-                    if planet_distance < min_distance and planet_distance <= 250:
-                        min_distance = planet_distance
-                        closest_planet = planet
+                # Find closest planet within 250 units (squared distances,
+                # first planet wins ties)
+                ids, owner_ids, xs, ys = zip(*planets)
+                d2 = ((np.asarray(xs, dtype=np.float64) - ship.x_coord) ** 2
+                      + (np.asarray(ys, dtype=np.float64) - ship.y_coord) ** 2)
+                d2[d2 > 250 * 250] = np.inf
+                closest = int(d2.argmin())
                 
-                if not closest_planet:
+                if d2[closest] == np.inf:
                     return {"success": False, "message": "No planet within 250 units for maintenance"}
                 
                 # Check ownership
-                user = self.db.query(User).filter(User.id == ship.user_id).first()
-                if closest_planet.owner_id != user.id and closest_planet.id != 1:
+                if owner_ids[closest] != ship.user_id and ids[closest] != 1:
                     return {"success": False, "message": "Can only get maintenance at own planets or Zygor"}
                 
-                cost = 200 if closest_planet.id != 1 else 2500
+                cost = 200 if ids[closest] != 1 else 2500
             
             # Check if user has enough cash
-            user_account = self.db.query(UserAccount).filter(UserAccount.user_id == ship.user_id).first()
             if not user_account or user_account.cash < cost:
                 return {"success": False, "message": f"Insufficient funds. Cost: {cost} credits"}
             
@@ -204,9 +327,9 @@ class NavigationService:
                 "cost": cost,
                 "repair_time": repair_time
             }
-            
+        
         except Exception as e:
-            logger.error(f"Error requesting maintenance: {e}")
+            logger.error("Error requesting maintenance: %s", e)
             self.db.rollback()
             return {"success": False, "message": f"Maintenance request failed: {str(e)}"}
     
@@ -214,26 +337,17 @@ class NavigationService:
                               class_number: int) -> Dict[str, Any]:
         """Purchase new ship, shield, or phaser system"""
         try:
-            ship = self.db.query(Ship).filter(Ship.id == ship_id).first()
+            ship = self.db.get(Ship, ship_id)
             if not ship:
                 return {"success": False, "message": "Ship not found"}
             
-            # Check if ship is at Zygor (sector 0,0)
-            current_sector = get_sector(Coordinate(ship.x_coord, ship.y_coord))
-            if current_sector.x != 0 or current_sector.y != 0:
+            # Check if ship is at Zygor (sector 0,0, the unit square at the
+            # origin); that also keeps it within 250 units of Zygor
+            if not (0 <= ship.x_coord < 1 and 0 <= ship.y_coord < 1):
                 return {"success": False, "message": "Must be at Zygor (sector 0,0) to purchase equipment"}
             
-            # Check if ship is in orbit around Zygor
-            zygor_distance = distance(
-                Coordinate(ship.x_coord, ship.y_coord),
-                Coordinate(0, 0)  # Zygor coordinates
-            )
-            
-            if zygor_distance > 250:
-                return {"success": False, "message": "Must be within 250 units of Zygor to purchase equipment"}
-            
             # Get user account
-            user_account = self.db.query(UserAccount).filter(UserAccount.user_id == ship.user_id).first()
+            user_account = self._get_user_account(ship.user_id)
             if not user_account:
                 return {"success": False, "message": "User account not found"}
             
@@ -282,53 +396,36 @@ class NavigationService:
                     "name": equipment_name
                 }
             }
-            
+        
         except Exception as e:
-            logger.error(f"Error purchasing equipment: {e}")
+            logger.error("Error purchasing equipment: %s", e)
             self.db.rollback()
             return {"success": False, "message": f"Purchase failed: {str(e)}"}
     
     def sell_goods(self, ship_id: int, item_type: str, quantity: int) -> Dict[str, Any]:
         """Sell goods back to Zygor"""
         try:
-            ship = self.db.query(Ship).filter(Ship.id == ship_id).first()
+            ship = self.db.get(Ship, ship_id)
             if not ship:
                 return {"success": False, "message": "Ship not found"}
             
-            # Check if ship is at Zygor
-            current_sector = get_sector(Coordinate(ship.x_coord, ship.y_coord))
-            if current_sector.x != 0 or current_sector.y != 0:
+            # Check if ship is at Zygor (sector 0,0)
+            if not (0 <= ship.x_coord < 1 and 0 <= ship.y_coord < 1):
                 return {"success": False, "message": "Must be at Zygor (sector 0,0) to sell goods"}
             
-            # Map item types to ship attributes
-            item_mapping = {
-                "men": "men",
-                "tro": "troops", 
-                "mis": "missiles",
-                "tor": "torpedoes",
-                "ion": "ion_cannons",
-                "flu": "flux_pods",
-                "foo": "food",
-                "fig": "fighters",
-                "dec": "decoys",
-                "min": "mines",
-                "jam": "jammers",
-                "zip": "zippers",
-                "gol": "gold"
-            }
-            
-            if item_type not in item_mapping:
+            # Map item type to ship attribute
+            attr_name = ITEM_ATTRIBUTES.get(item_type)
+            if attr_name is None:
                 return {"success": False, "message": f"Unknown item type: {item_type}"}
             
             # Get current quantity
-            attr_name = item_mapping[item_type]
             current_quantity = getattr(ship, attr_name, 0)
             
             if current_quantity <= 0:
                 return {"success": False, "message": f"No {item_type} to sell"}
             
             # Determine quantity to sell
-            sell_quantity = min(quantity, current_quantity)
+            sell_quantity = quantity if quantity < current_quantity else current_quantity
             
             # Calculate payment (base price with transfer tax)
             base_price = self._get_item_base_price(item_type)
@@ -341,7 +438,7 @@ class NavigationService:
             setattr(ship, attr_name, new_quantity)
             
             # Add payment to user account
-            user_account = self.db.query(UserAccount).filter(UserAccount.user_id == ship.user_id).first()
+            user_account = self._get_user_account(ship.user_id)
             if user_account:
                 user_account.cash += payment
             
@@ -354,9 +451,9 @@ class NavigationService:
                 "payment": payment,
                 "transfer_tax": transfer_tax
             }
-            
+        
         except Exception as e:
-            logger.error(f"Error selling goods: {e}")
+            logger.error("Error selling goods: %s", e)
             self.db.rollback()
             return {"success": False, "message": f"Sell failed: {str(e)}"}
     
@@ -365,7 +462,7 @@ class NavigationService:
         """Set communication channel frequency"""
         try:
             # Get user account
-            user_account = self.db.query(UserAccount).filter(UserAccount.user_id == user_id).first()
+            user_account = self._get_user_account(user_id)
             if not user_account:
                 return {"success": False, "message": "User account not found"}
             
@@ -388,70 +485,70 @@ class NavigationService:
             # This would need to be added to the UserAccount model
             # For now, we'll just log the change
             
-            logger.info(f"User {user_id} set channel {channel} to frequency {freq_value}")
+            logger.info("User %s set channel %s to frequency %s", user_id, channel, freq_value)
             
             return {
                 "success": True,
                 "message": f"Channel {channel} set to {freq_value}",
                 "frequency": freq_value
             }
-            
+        
         except Exception as e:
-            logger.error(f"Error setting frequency: {e}")
+            logger.error("Error setting frequency: %s", e)
             return {"success": False, "message": f"Frequency setting failed: {str(e)}"}
     
     def get_online_players(self, show_all: bool = False) -> List[Dict[str, Any]]:
         """Get list of online players"""
         try:
-            # Get active users (this would need to be enhanced with actual online status)
-            users = self.db.query(User).filter(User.is_active == True).all()
-            
-            players = []
-            for user in users:
-                # Get user's ship
-                ship = self.db.query(Ship).filter(
-                    Ship.user_id == user.id,
-                    Ship.status == 1  # Active
-                ).first()
-                
-                if ship:
-                    current_sector = get_sector(Coordinate(ship.x_coord, ship.y_coord))
-                    
-                    players.append({
-                        "user_id": user.id,
-                        "username": user.username,
-                        "ship_name": ship.shipname,
-                        "sector": {
-                            "x": current_sector.x,
-                            "y": current_sector.y
-                        },
-                        "ship_class": ship.shpclass,
-                        "status": "online"  # This would need actual online status tracking
-                    })
+            # One row per active ship of an active user, lowest ship id first
+            # (online status would need actual tracking)
+            rows = self.db.query(
+                Ship.user_id, User.userid, Ship.shipname, Ship.shpclass,
+                Ship.x_coord, Ship.y_coord
+            ).join(User, Ship.user_id == User.id).filter(
+                User.is_active == True,
+                Ship.status == 1  # Active
+            ).order_by(Ship.id).yield_per(1000)
+            
+            # Keep each user's first ship, streaming the rows in batches
+            first_ships = {}
+            for row in rows:
+                first_ships.setdefault(row[0], row)
+            
+            if not first_ships:
+                return []
+            
+            user_ids, usernames, ship_names, ship_classes, xs, ys = zip(*first_ships.values())
+            
+            # Sector numbers are the integer part of each coordinate
+            coords = np.asarray((xs, ys), dtype=np.float64)
+            sector_xs, sector_ys = np.floor(coords).astype(np.int64).tolist()
+            
+            players = [
+                {
+                    "user_id": user_id,
+                    "username": username,
+                    "ship_name": ship_name,
+                    "sector": {
+                        "x": sector_x,
+                        "y": sector_y
+                    },
+                    "ship_class": ship_class,
+                    "status": "online"  # This would need actual online status tracking
+                }
+                for user_id, username, ship_name, ship_class, sector_x, sector_y
+                in zip(user_ids, usernames, ship_names, ship_classes, sector_xs, sector_ys)
+            ]
             
             return players
-            
+        
         except Exception as e:
-            logger.error(f"Error getting online players: {e}")
+            logger.error("Error getting online players: %s", e)
             return []
     
     def _calculate_ship_cost(self, class_number: int) -> int:
         """Calculate ship cost based on class number"""
-        # Base costs for different ship classes
-        ship_costs = {
-            1: 50000,    # Interceptor
-            2: 100000,   # Light Freighter
-            3: 200000,   # Heavy Freighter
-            4: 500000,   # Destroyer
-            5: 1000000,  # Star Cruiser
-            6: 2000000,  # Battle Cruiser
-            7: 5000000,  # Frigate
-            8: 10000000, # Dreadnought
-            9: 20000000, # Flagship
-            10: 1500000, # Cyborg
-            11: 3000000  # Droid
-        }
-        return ship_costs.get(class_number, 1000000)
+        return SHIP_COSTS.get(class_number, 1000000)
     
     def _calculate_shield_cost(self, class_number: int) -> int:
         """Calculate shield cost based on class number"""
@@ -463,20 +560,7 @@ class NavigationService:
     
     def _get_ship_class_name(self, class_number: int) -> str:
         """Get ship class name based on class number"""
-        ship_names = {
-            1: "Interceptor",
-            2: "Light Freighter",
-            3: "Heavy Freighter",
-            4: "Destroyer",
-            5: "Star Cruiser",
-            6: "Battle Cruiser",
-            7: "Frigate",
-            8: "Dreadnought",
-            9: "Flagship",
-            10: "Cybertron",
-            11: "Droid"
-        }
-        return ship_names.get(class_number, "Unknown")
+        return SHIP_CLASS_NAMES.get(class_number, "Unknown")
     
     def _get_shield_capacity(self, class_number: int) -> int:
         """Get shield capacity based on class number"""
@@ -493,19 +577,4 @@ class NavigationService:
     
     def _get_item_base_price(self, item_type: str) -> int:
         """Get base price for item type"""
-        prices = {
-            "men": 2,
-            "tro": 1,
-            "mis": 20,
-            "tor": 7,
-            "ion": 33,
-            "flu": 200,
-            "foo": 2,
-            "fig": 50,
-            "dec": 18,
-            "min": 50,
-            "jam": 50,
-            "zip": 50,
-            "gol": 100
-        }
-        return prices.get(item_type, 10)
+        return ITEM_BASE_PRICES.get(item_type, 10)
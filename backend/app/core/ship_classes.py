@@ -0,0 +1,195 @@
+"""
+Galactic Empire - Ship Class Configuration
+
+The 12 ship classes of the original game (MBMGESHP.MSG), defined once at
+import as immutable specs. They seed the ship_classes table and provide
+per-class limits to the game engine.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class ShipClassSpec:
+    """Capabilities of one ship class, as stored in the ship_classes table"""
+    class_number: int
+    typename: str
+    shipname: str
+    ship_type: str  # USER, CYBORG or DROID; resolved to ship_type_id on insert
+    max_shields: int
+    max_phasers: int
+    max_torpedoes: int
+    max_missiles: int
+    has_decoy: bool
+    has_jammer: bool
+    has_zipper: bool
+    has_mine: bool
+    has_attack_planet: bool
+    has_cloaking: bool
+    max_acceleration: int
+    max_warp: int
+    max_tons: int
+    max_price: int
+    max_points: int
+    scan_range: int
+    cybs_can_attack: bool
+    number_to_attack: int
+    damage_factor: int
+    total_to_create: int
+    lowest_to_attack: int = 1
+    tough_factor: int = 0
+
+
+# Complete ship classes configuration based on MBMGESHP.MSG
+SHIP_CLASSES: Tuple[ShipClassSpec, ...] = (
+    # USER Ships (Classes 1-8)
+    ShipClassSpec(
+        class_number=1, typename="Interceptor", shipname="",
+        ship_type="USER", max_shields=10, max_phasers=10,
+        max_torpedoes=1, max_missiles=0, has_decoy=True, has_jammer=True,
+        has_zipper=True, has_mine=True, has_attack_planet=False,
+        has_cloaking=False, max_acceleration=5000, max_warp=10,
+        max_tons=1000, max_price=65000, max_points=750,
+        scan_range=100000, cybs_can_attack=True, number_to_attack=1,
+        damage_factor=90, total_to_create=3
+    ),
+    ShipClassSpec(
+        class_number=2, typename="Stealth Fighter", shipname="",
+        ship_type="USER", max_shields=15, max_phasers=15,
+        max_torpedoes=1, max_missiles=1, has_decoy=True, has_jammer=True,
+        has_zipper=True, has_mine=True, has_attack_planet=True,
+        has_cloaking=True, max_acceleration=5000, max_warp=20,
+        max_tons=2000, max_price=500000, max_points=1500,
+        scan_range=200000, cybs_can_attack=True, number_to_attack=2,
+        damage_factor=90, total_to_create=3
+    ),
+    ShipClassSpec(
+        class_number=3, typename="Heavy Freighter", shipname="",
+        ship_type="USER", max_shields=5, max_phasers=5,
+        max_torpedoes=1, max_missiles=0, has_decoy=True, has_jammer=True,
+        has_zipper=False, has_mine=True, has_attack_planet=True,
+        has_cloaking=False, max_acceleration=3000, max_warp=8,
+        max_tons=60000, max_price=40000, max_points=500,
+        scan_range=50000, cybs_can_attack=False, number_to_attack=0,
+        damage_factor=200, total_to_create=3
+    ),
+    ShipClassSpec(
+        class_number=4, typename="Destroyer", shipname="",
+        ship_type="USER", max_shields=15, max_phasers=15,
+        max_torpedoes=1, max_missiles=1, has_decoy=True, has_jammer=True,
+        has_zipper=True, has_mine=True, has_attack_planet=True,
+        has_cloaking=False, max_acceleration=5000, max_warp=25,
+        max_tons=5000, max_price=600000, max_points=2000,
+        scan_range=100000, cybs_can_attack=True, number_to_attack=2,
+        damage_factor=90, total_to_create=3
+    ),
+    ShipClassSpec(
+        class_number=5, typename="Star Cruiser", shipname="",
+        ship_type="USER", max_shields=15, max_phasers=15,
+        max_torpedoes=1, max_missiles=1, has_decoy=True, has_jammer=True,
+        has_zipper=True, has_mine=True, has_attack_planet=True,
+        has_cloaking=True, max_acceleration=10000, max_warp=25,
+        max_tons=3000, max_price=700000, max_points=5000,
+        scan_range=200000, cybs_can_attack=True, number_to_attack=2,
+        damage_factor=90, total_to_create=3
+    ),
+    ShipClassSpec(
+        class_number=6, typename="Battleship", shipname="",
+        ship_type="USER", max_shields=18, max_phasers=18,
+        max_torpedoes=1, max_missiles=1, has_decoy=True, has_jammer=True,
+        has_zipper=True, has_mine=True, has_attack_planet=True,
+        has_cloaking=False, max_acceleration=3000, max_warp=15,
+        max_tons=8000, max_price=1200000, max_points=8000,
+        scan_range=150000, cybs_can_attack=True, number_to_attack=3,
+        damage_factor=90, total_to_create=3
+    ),
+    ShipClassSpec(
+        class_number=7, typename="Dreadnought", shipname="",
+        ship_type="USER", max_shields=19, max_phasers=19,
+        max_torpedoes=1, max_missiles=1, has_decoy=True, has_jammer=True,
+        has_zipper=True, has_mine=True, has_attack_planet=True,
+        has_cloaking=False, max_acceleration=2000, max_warp=12,
+        max_tons=12000, max_price=2000000, max_points=15000,
+        scan_range=120000, cybs_can_attack=True, number_to_attack=3,
+        damage_factor=90, total_to_create=2
+    ),
+    ShipClassSpec(
+        class_number=8, typename="Flagship", shipname="",
+        ship_type="USER", max_shields=19, max_phasers=19,
+        max_torpedoes=1, max_missiles=1, has_decoy=True, has_jammer=True,
+        has_zipper=True, has_mine=True, has_attack_planet=True,
+        has_cloaking=True, max_acceleration=1500, max_warp=10,
+        max_tons=15000, max_price=5000000, max_points=30000,
+        scan_range=100000, cybs_can_attack=True, number_to_attack=4,
+        damage_factor=90, total_to_create=1
+    ),
+    # CYBORG Ships (Classes 9-10)
+    ShipClassSpec(
+        class_number=9, typename="Cyber-Destroyer", shipname="Cyber-Destroyer",
+        ship_type="CYBORG", max_shields=15, max_phasers=15,
+        max_torpedoes=1, max_missiles=1, has_decoy=True, has_jammer=True,
+        has_zipper=True, has_mine=True, has_attack_planet=True,
+        has_cloaking=False, max_acceleration=6000, max_warp=30,
+        max_tons=3000, max_price=0, max_points=2500,
+        scan_range=150000, cybs_can_attack=False, number_to_attack=0,
+        lowest_to_attack=1, damage_factor=95, tough_factor=0,
+        total_to_create=5
+    ),
+    ShipClassSpec(
+        class_number=10, typename="Cyber-Cruiser", shipname="Cyber-Cruiser",
+        ship_type="CYBORG", max_shields=18, max_phasers=18,
+        max_torpedoes=1, max_missiles=1, has_decoy=True, has_jammer=True,
+        has_zipper=True, has_mine=True, has_attack_planet=True,
+        has_cloaking=True, max_acceleration=8000, max_warp=35,
+        max_tons=2000, max_price=0, max_points=5000,
+        scan_range=200000, cybs_can_attack=False, number_to_attack=0,
+        lowest_to_attack=3, damage_factor=100, tough_factor=1,
+        total_to_create=3
+    ),
+    # DROID Ships (Classes 11-12)
+    ShipClassSpec(
+        class_number=11, typename="Mining Droid", shipname="Mining Droid",
+        ship_type="DROID", max_shields=2, max_phasers=2,
+        max_torpedoes=0, max_missiles=0, has_decoy=False, has_jammer=False,
+        has_zipper=False, has_mine=False, has_attack_planet=False,
+        has_cloaking=False, max_acceleration=1000, max_warp=5,
+        max_tons=50000, max_price=0, max_points=100,
+        scan_range=25000, cybs_can_attack=False, number_to_attack=0,
+        damage_factor=50, total_to_create=10
+    ),
+    ShipClassSpec(
+        class_number=12, typename="Scout Droid", shipname="Scout Droid",
+        ship_type="DROID", max_shields=1, max_phasers=1,
+        max_torpedoes=0, max_missiles=0, has_decoy=False, has_jammer=False,
+        has_zipper=False, has_mine=False, has_attack_planet=False,
+        has_cloaking=True, max_acceleration=8000, max_warp=40,
+        max_tons=100, max_price=0, max_points=50,
+        scan_range=300000, cybs_can_attack=False, number_to_attack=0,
+        damage_factor=25, total_to_create=15
+    )
+)
+
+# Movement limits of ships whose class has no spec (row 0 of the tables)
+DEFAULT_MAX_SPEED = 50000.0
+DEFAULT_MAX_ACCELERATION = 2000.0
+
+# Per-class lookup tables indexed by class number, for batch kernels that
+# gather class parameters per ship; the specs have no speed limit, so every
+# class uses the default
+CLASS_MAX_SPEED = np.full(max(spec.class_number for spec in SHIP_CLASSES) + 1,
+                          DEFAULT_MAX_SPEED, dtype=np.float64)
+CLASS_MAX_ACCELERATION = np.full(len(CLASS_MAX_SPEED), DEFAULT_MAX_ACCELERATION, dtype=np.float64)
+for _spec in SHIP_CLASSES:
+    CLASS_MAX_ACCELERATION[_spec.class_number] = _spec.max_acceleration
+del _spec
+CLASS_MAX_SPEED.flags.writeable = False
+CLASS_MAX_ACCELERATION.flags.writeable = False
+
+
+def class_rows(ship_classes: np.ndarray) -> np.ndarray:
+    """Map class numbers to rows of the class tables (unknown classes to row 0)"""
+    known = (ship_classes > 0) & (ship_classes < len(CLASS_MAX_SPEED))
+    return np.where(known, ship_classes, 0)
@@ -0,0 +1,417 @@
+"""
+Galactic Empire - Ship Table
+
+This module stores the in-memory state of all ships as a structure of arrays:
+one NumPy column per numeric field plus parallel Python lists for the string
+fields. Sweeps over every ship (sector scans, statistics, movement) then
+touch only the columns they need instead of walking ship objects. Ship is a
+lightweight view of one row with the attribute interface of the former
+ship dataclass.
+"""
+
+import math
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .constants import ShipStatus
+from .coordinates import Coordinate
+from .ship_classes import CLASS_MAX_ACCELERATION, CLASS_MAX_SPEED, class_rows
+
+# Numeric columns and their dtypes
+_COLUMNS = (
+    ('x', np.float64),
+    ('y', np.float64),
+    ('heading', np.float64),
+    ('speed', np.float64),
+    ('target_heading', np.float64),
+    ('target_speed', np.float64),
+    ('damage', np.float64),
+    ('energy', np.int32),
+    ('shields', np.int32),
+    ('max_shields', np.int32),
+    ('ship_class', np.int32),
+    ('status', np.uint8),
+    ('sector_x', np.int64),  # Sector of the ship as of its last index update
+    ('sector_y', np.int64),
+    ('last_update_ns', np.int64),  # Unix time in nanoseconds
+)
+
+
+def ns_to_datetime(ns: int) -> datetime:
+    """Convert a nanosecond Unix timestamp to a naive UTC datetime"""
+    return datetime.utcfromtimestamp(ns / 1e9)
+
+
+class ShipTable:
+    """Structure-of-arrays storage for all ships in the game"""
+    
+    def __init__(self, capacity: int = 64):
+        self._capacity = max(capacity, 1)
+        self._size = 0
+        for name, dtype in _COLUMNS:
+            setattr(self, name, np.zeros(self._capacity, dtype=dtype))
+        self.ids: List[str] = []
+        self.user_ids: List[str] = []
+        self.ship_names: List[str] = []
+        self.team_ids: List[Optional[str]] = []
+        self.index_of: Dict[str, int] = {}
+        # Number of ships with each status code; status changes must go
+        # through set_status to keep it in step
+        self._status_counts = [0] * len(ShipStatus)
+        # Rows of all ships by sector, whatever their status
+        self._sector_index: Dict[Tuple[int, int], Set[int]] = defaultdict(set)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __contains__(self, ship_id: str) -> bool:
+        return ship_id in self.index_of
+    
+    def _grow(self, min_capacity: int):
+        """Grow every column geometrically to hold at least min_capacity rows"""
+        capacity = max(self._capacity * 2, min_capacity)
+        for name, dtype in _COLUMNS:
+            column = np.zeros(capacity, dtype=dtype)
+            column[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, column)
+        self._capacity = capacity
+    
+    def append(self, ship_id: str, user_id: str, ship_name: str, ship_class: int,
+               x: float, y: float, heading: float, speed: float,
+               energy: int, shields: int,
+               max_shields: int, damage: float, status: ShipStatus,
+               team_id: Optional[str] = None,
+               last_update_ns: Optional[int] = None) -> int:
+        """
+        Add a ship, replacing the row of an existing ship with the same ID
+        
+        Returns:
+            Row index of the ship
+        """
+        if last_update_ns is None:
+            last_update_ns = time.time_ns()
+        
+        index = self.index_of.get(ship_id)
+        if index is None:
+            index = self._size
+            if index == self._capacity:
+                self._grow(index + 1)
+            self._size += 1
+            self.index_of[ship_id] = index
+            self.ids.append(ship_id)
+            self.user_ids.append(user_id)
+            self.ship_names.append(ship_name)
+            self.team_ids.append(team_id)
+            self.sector_x[index] = math.floor(x)
+            self.sector_y[index] = math.floor(y)
+            self._sector_index[(math.floor(x), math.floor(y))].add(index)
+        else:
+            self.user_ids[index] = user_id
+            self.ship_names[index] = ship_name
+            self.team_ids[index] = team_id
+            self._status_counts[self.status[index]] -= 1
+        
+        self.x[index] = x
+        self.y[index] = y
+        self.heading[index] = heading
+        self.speed[index] = speed
+        self.target_heading[index] = heading
+        self.target_speed[index] = speed
+        self.damage[index] = damage
+        self.energy[index] = energy
+        self.shields[index] = shields
+        self.max_shields[index] = max_shields
+        self.ship_class[index] = ship_class
+        self.last_update_ns[index] = last_update_ns
+        self.status[index] = status
+        self._status_counts[status] += 1
+        self.update_sector(index)
+        return index
+    
+    def extend(self, ship_ids: Sequence[str], user_ids: Sequence[str],
+               ship_names: Sequence[str], **columns: Any):
+        """
+        Add many new ships at once
+        
+        Args:
+            ship_ids, user_ids, ship_names: String fields of each ship
+            **columns: Numeric columns by name, as in append; each is a
+                       sequence with one value per ship, where None stands
+                       for 0, or a scalar shared by all ships. target_heading and target_speed
+                       default to heading and speed, last_update_ns to the
+                       current time, other columns to 0.
+            
+        Raises:
+            ValueError: If a ship ID is already in the table
+        """
+        count = len(ship_ids)
+        if not count:
+            return
+        
+        existing = self.index_of.keys() & set(ship_ids)
+        if existing or len(set(ship_ids)) != count:
+            raise ValueError(f"Duplicate ship IDs: {sorted(existing)}")
+        
+        columns.setdefault('target_heading', columns.get('heading', 0))
+        columns.setdefault('target_speed', columns.get('speed', 0))
+        columns.setdefault('last_update_ns', time.time_ns())
+        
+        start = self._size
+        end = start + count
+        if end > self._capacity:
+            self._grow(end)
+        
+        for name, dtype in _COLUMNS:
+            values = columns.get(name, 0)
+            if isinstance(values, (list, tuple)):
+                values = np.fromiter((0 if v is None else v for v in values),
+                                     dtype=dtype, count=count)
+            getattr(self, name)[start:end] = values
+        
+        counts = np.bincount(self.status[start:end], minlength=len(ShipStatus))
+        for code, count_of_code in enumerate(counts.tolist()):
+            self._status_counts[code] += count_of_code
+        
+        sector_x = np.floor(self.x[start:end]).astype(np.int64)
+        sector_y = np.floor(self.y[start:end]).astype(np.int64)
+        self.sector_x[start:end] = sector_x
+        self.sector_y[start:end] = sector_y
+        for index, sector in enumerate(zip(sector_x.tolist(), sector_y.tolist()), start):
+            self._sector_index[sector].add(index)
+        
+        self._size = end
+        self.ids.extend(ship_ids)
+        self.user_ids.extend(user_ids)
+        self.ship_names.extend(ship_names)
+        self.team_ids.extend([None] * count)
+        self.index_of.update(zip(ship_ids, range(start, end)))
+    
+    def update_sector(self, index: int):
+        """Move one row to the sector bucket of its current position"""
+        old = (int(self.sector_x[index]), int(self.sector_y[index]))
+        new = (math.floor(self.x[index]), math.floor(self.y[index]))
+        if new != old:
+            self._sector_index[old].discard(index)
+            self._sector_index[new].add(index)
+            self.sector_x[index], self.sector_y[index] = new
+    
+    def update_sectors(self):
+        """Move every row whose position changed sector to its new bucket"""
+        n = self._size
+        sector_x = np.floor(self.x[:n]).astype(np.int64)
+        sector_y = np.floor(self.y[:n]).astype(np.int64)
+        moved = np.flatnonzero((sector_x != self.sector_x[:n]) | (sector_y != self.sector_y[:n]))
+        if not len(moved):
+            return
+        
+        index = self._sector_index
+        old_x, old_y = self.sector_x[moved].tolist(), self.sector_y[moved].tolist()
+        new_x, new_y = sector_x[moved].tolist(), sector_y[moved].tolist()
+        for i, ox, oy, nx, ny in zip(moved.tolist(), old_x, old_y, new_x, new_y):
+            index[(ox, oy)].discard(i)
+            index[(nx, ny)].add(i)
+        self.sector_x[moved] = sector_x[moved]
+        self.sector_y[moved] = sector_y[moved]
+    
+    def in_sector(self, sector_x: int, sector_y: int) -> List[int]:
+        """
+        Find the active ships in a sector
+        
+        Sectors are the unit squares of the coordinate grid, as in
+        coordinates.get_sector. Rows are looked up in the sector index, so
+        the cost depends on the number of ships in the sector only.
+        
+        Returns:
+            Row indices of the ships, in ascending order
+        """
+        bucket = self._sector_index.get((sector_x, sector_y))
+        if not bucket:
+            return []
+        status = self.status
+        return sorted(i for i in bucket if status[i] == ShipStatus.ACTIVE)
+    
+    def set_status(self, index: int, status: ShipStatus):
+        """Change the status code of a row"""
+        self._status_counts[self.status[index]] -= 1
+        self._status_counts[status] += 1
+        self.status[index] = status
+    
+    def count_status(self, status: ShipStatus) -> int:
+        """Count the ships with a status code"""
+        return self._status_counts[status]
+    
+    def distances_from(self, index: int, rows: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Distances from one ship to others
+        
+        Args:
+            index: Row of the ship to measure from
+            rows: Rows to measure to; all ships by default
+            
+        Returns:
+            Distances in the order of `rows` (or of the table)
+        """
+        x, y = self.x[:self._size], self.y[:self._size]
+        if rows is not None:
+            x, y = x[rows], y[rows]
+        return np.hypot(x - self.x[index], y - self.y[index])
+    
+    def bearings_from(self, index: int, rows: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Bearings from one ship to others, relative to its heading
+        
+        Vectorized coordinates.bearing: the angle is measured clockwise from
+        the -y direction (heading 0), in the range (-180, 180].
+        
+        Args:
+            index: Row of the ship to measure from
+            rows: Rows to measure to; all ships by default
+            
+        Returns:
+            Bearings in degrees in the order of `rows` (or of the table)
+        """
+        x, y = self.x[:self._size], self.y[:self._size]
+        if rows is not None:
+            x, y = x[rows], y[rows]
+        # Same small offset as coordinates.bearing, so a ship's bearing to
+        # its own position is defined
+        dx = x - (self.x[index] + 0.000001)
+        dy = y - (self.y[index] + 0.000001)
+        vector = np.degrees(np.arctan2(dx, -dy))
+        bearings = np.mod(360.0 - self.heading[index] + vector, 360.0)
+        return np.where(bearings > 180, bearings - 360, bearings)
+    
+    def get(self, ship_id: str) -> Optional["Ship"]:
+        """Get a view of a ship by ID"""
+        index = self.index_of.get(ship_id)
+        if index is None:
+            return None
+        return Ship(self, index)
+    
+    def values(self) -> Iterator["Ship"]:
+        """Iterate over views of all ships"""
+        for index in range(self._size):
+            yield Ship(self, index)
+
+
+class Ship:
+    """View of one ship in a ShipTable"""
+    
+    __slots__ = ('_table', '_index')
+    
+    def __init__(self, table: ShipTable, index: int):
+        self._table = table
+        self._index = index
+    
+    def __repr__(self) -> str:
+        return f"<Ship(ship_id='{self.ship_id}', ship_name='{self.ship_name}')>"
+    
+    @property
+    def ship_id(self) -> str:
+        return self._table.ids[self._index]
+    
+    @property
+    def user_id(self) -> str:
+        return self._table.user_ids[self._index]
+    
+    @property
+    def ship_name(self) -> str:
+        return self._table.ship_names[self._index]
+    
+    @property
+    def team_id(self) -> Optional[str]:
+        return self._table.team_ids[self._index]
+    
+    @team_id.setter
+    def team_id(self, value: Optional[str]):
+        self._table.team_ids[self._index] = value
+    
+    @property
+    def ship_class(self) -> int:
+        return int(self._table.ship_class[self._index])
+    
+    @property
+    def position(self) -> Coordinate:
+        return Coordinate(float(self._table.x[self._index]), float(self._table.y[self._index]))
+    
+    @position.setter
+    def position(self, value: Coordinate):
+        self._table.x[self._index] = value.x
+        self._table.y[self._index] = value.y
+        self._table.update_sector(self._index)
+    
+    @property
+    def heading(self) -> float:
+        return float(self._table.heading[self._index])
+    
+    @heading.setter
+    def heading(self, value: float):
+        self._table.heading[self._index] = value
+    
+    @property
+    def speed(self) -> float:
+        return float(self._table.speed[self._index])
+    
+    @speed.setter
+    def speed(self, value: float):
+        self._table.speed[self._index] = value
+    
+    @property
+    def max_speed(self) -> float:
+        return float(CLASS_MAX_SPEED[class_rows(self._table.ship_class[self._index])])
+    
+    @property
+    def max_acceleration(self) -> float:
+        return float(CLASS_MAX_ACCELERATION[class_rows(self._table.ship_class[self._index])])
+    
+    @property
+    def energy(self) -> int:
+        return int(self._table.energy[self._index])
+    
+    @energy.setter
+    def energy(self, value: int):
+        self._table.energy[self._index] = value
+    
+    @property
+    def shields(self) -> int:
+        return int(self._table.shields[self._index])
+    
+    @shields.setter
+    def shields(self, value: int):
+        self._table.shields[self._index] = value
+    
+    @property
+    def max_shields(self) -> int:
+        return int(self._table.max_shields[self._index])
+    
+    @property
+    def damage(self) -> float:
+        return float(self._table.damage[self._index])
+    
+    @damage.setter
+    def damage(self, value: float):
+        self._table.damage[self._index] = value
+    
+    @property
+    def status(self) -> ShipStatus:
+        return ShipStatus(self._table.status[self._index])
+    
+    @status.setter
+    def status(self, value: ShipStatus):
+        self._table.set_status(self._index, value)
+    
+    @property
+    def last_update(self) -> datetime:
+        return ns_to_datetime(self.last_update_ns)
+    
+    @property
+    def last_update_ns(self) -> int:
+        return int(self._table.last_update_ns[self._index])
+    
+    @last_update_ns.setter
+    def last_update_ns(self, value: int):
+        self._table.last_update_ns[self._index] = value
@@ -65,7 +65,8 @@ class ZipperService:
             if distance <= self.zipper_range:
                 triggered_mines.append(mine)
         
-        # Trigger all mines in range
+        # Trigger all mines in range; they explode together
+        exploded_at = datetime.utcnow()
         mine_results = []
         for mine in triggered_mines:
             # Calculate damage to ship (original game: mines damage the ship that triggers them)
@@ -81,7 +82,7 @@ class ZipperService:
             # Deactivate mine
             mine.is_active = False
             mine.is_armed = False
-            mine.exploded_at = datetime.utcnow()
+            mine.exploded_at = exploded_at
             
             mine_results.append({
                 "mine_id": mine.id,
@@ -2,7 +2,7 @@
 Mine system model based on MINE structure
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .base import Base
@@ -11,6 +11,10 @@ from .base import Base
 class Mine(Base):
     """Mine model based on MINE structure"""
     __tablename__ = "mines"
+    __table_args__ = (
+        # Range queries over armed mines (MineService.detect_mines)
+        Index("ix_mines_active_armed_coords", "is_active", "is_armed", "x_coord", "y_coord"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
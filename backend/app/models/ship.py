@@ -2,7 +2,7 @@
 Ship management models based on WARSHP structure
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, BigInteger, ForeignKey, Text, DateTime
+from sqlalchemy import Column, Integer, String, Float, Boolean, BigInteger, ForeignKey, Text, DateTime, Computed, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .base import Base
@@ -86,6 +86,10 @@ class ShipClass(Base):
 class Ship(Base):
     """Ship model based on WARSHP structure"""
     __tablename__ = "ships"
+    __table_args__ = (
+        # Sector lookups (NavigationService.request_maintenance)
+        Index("ix_ships_sector", "sector_x", "sector_y"),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -109,6 +113,10 @@ class Ship(Base):
     x_coord = Column(Float, default=0.0)    # WARSHP.coord.xcoord
     y_coord = Column(Float, default=0.0)    # WARSHP.coord.ycoord
     
+    # Sector of the position (integer part, as coordinates.get_sector), kept by the database
+    sector_x = Column(Integer, Computed("CAST(floor(x_coord) AS INTEGER)", persisted=True))
+    sector_y = Column(Integer, Computed("CAST(floor(y_coord) AS INTEGER)", persisted=True))
+    
     # Ship condition (from WARSHP)
     damage = Column(Float, default=0.0)     # WARSHP.damage - damage percentage (0-100)
     energy = Column(Float, default=0.0)     # WARSHP.energy - available energy
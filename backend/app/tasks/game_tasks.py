@@ -354,8 +354,9 @@ def _process_beacon_system(db: Session) -> None:
     # Update beacon timestamps
     beacons = db.query(Beacon).filter(Beacon.active == True).all()
     
+    now = datetime.utcnow()
     for beacon in beacons:
-        beacon.updated_at = datetime.utcnow()
+        beacon.updated_at = now
 
 
 def _update_game_time(db: Session, game_time: datetime) -> None:
@@ -0,0 +1,112 @@
+"""
+Tests that batched ship movement matches ShipMovement.rotate_ship + move_ship
+"""
+
+import numpy as np
+import pytest
+
+from app.core import movement
+from app.core.constants import ShipStatus
+from app.core.coordinates import Coordinate, UNIVMAX
+from app.core.movement import MovementPhysics, ShipMovement, create_movement_state
+from app.core.ship_classes import CLASS_MAX_ACCELERATION, CLASS_MAX_SPEED, class_rows
+
+
+ADVANCE_PATHS = [
+    pytest.param(movement._advance_ships_numpy, id="numpy"),
+    pytest.param(movement._advance_ships_loop, id="loop"),
+]
+if movement.njit is not None:
+    ADVANCE_PATHS.append(pytest.param(movement._advance_ships, id="jit"))
+
+
+def random_state(rng, n):
+    """Ship state columns covering stopped, inactive and edge-wrapping ships"""
+    x = rng.uniform(-UNIVMAX, UNIVMAX, n)
+    y = rng.uniform(-UNIVMAX, UNIVMAX, n)
+    x[:n // 10] = rng.choice([UNIVMAX - 1e-4, -UNIVMAX + 1e-4], n // 10)
+    y[n // 10:n // 5] = rng.choice([UNIVMAX - 1e-4, -UNIVMAX + 1e-4], n // 5 - n // 10)
+    return {
+        "x": x,
+        "y": y,
+        "heading": rng.uniform(0, 360, n),
+        "speed": rng.choice([0.0, 100.0, 3000.0, 45000.0, 60000.0], n),
+        "target_speed": rng.choice([0.0, -5.0, 2500.0, 50000.0, 100000.0], n),
+        "target_heading": rng.uniform(-720, 720, n),
+        "limit_row": rng.integers(0, 3, n),
+        "active": rng.random(n) < 0.8,
+    }
+
+
+def reference_step(state, max_speed, max_accel):
+    """Step every active ship with rotate_ship followed by move_ship"""
+    ship_movement = ShipMovement(MovementPhysics())
+    expected = {key: state[key].copy() for key in ("x", "y", "heading", "speed")}
+    for i in np.flatnonzero(state["active"]):
+        row = state["limit_row"][i]
+        ship = create_movement_state(Coordinate(state["x"][i], state["y"][i]),
+                                     state["heading"][i], state["speed"][i],
+                                     max_speed[row], max_accel[row])
+        ship.target_speed = state["target_speed"][i]
+        ship = ship_movement.rotate_ship(ship, state["target_heading"][i])
+        ship = ship_movement.move_ship(ship)
+        expected["x"][i], expected["y"][i] = ship.position.x, ship.position.y
+        expected["heading"][i], expected["speed"][i] = ship.heading, ship.speed
+    return expected
+
+
+@pytest.mark.parametrize("advance", ADVANCE_PATHS)
+@pytest.mark.parametrize("seed", range(5))
+def test_advance_ships_matches_ship_movement(advance, seed):
+    rng = np.random.default_rng(seed)
+    state = random_state(rng, 1000)
+    max_speed = np.array([50000.0, 30000.0, 2000.0])
+    max_accel = np.array([2000.0, 500.0, 4000.0])
+    expected = reference_step(state, max_speed, max_accel)
+
+    advance(state["x"], state["y"], state["heading"], state["speed"],
+            state["target_speed"], state["target_heading"], state["limit_row"],
+            max_speed, max_accel, state["active"])
+
+    for key, values in expected.items():
+        np.testing.assert_allclose(state[key], values, rtol=0, atol=1e-9, err_msg=key)
+
+
+def test_update_all_ship_movement_matches_ship_movement():
+    from app.core.galaxy import GalaxyMap
+    from app.core.game_engine import GameEngine, GameState
+    from app.core.ship_table import ShipTable
+    from app.core.tick_system import TickSystem
+
+    rng = np.random.default_rng(7)
+    n = 200
+    state = random_state(rng, n)
+    ship_class = rng.integers(0, len(CLASS_MAX_SPEED) + 2, n)
+    state["limit_row"] = class_rows(ship_class)
+
+    engine = GameEngine()
+    engine.game_state = GameState(ships=ShipTable(), galaxy_map=GalaxyMap(seed=1),
+                                  tick_system=TickSystem(), game_time_ns=1_000)
+    for i in range(n):
+        engine.create_ship(f"ship{i}", "user", f"Ship {i}", int(ship_class[i]),
+                           Coordinate(state["x"][i], state["y"][i]))
+    ships = engine.game_state.ships
+    ships.heading[:n] = state["heading"]
+    ships.speed[:n] = state["speed"]
+    ships.target_speed[:n] = state["target_speed"]
+    ships.target_heading[:n] = state["target_heading"]
+    ships.status[:n] = np.where(state["active"], ShipStatus.ACTIVE, ShipStatus.INACTIVE)
+    expected = reference_step(state, CLASS_MAX_SPEED, CLASS_MAX_ACCELERATION)
+
+    engine.game_state.game_time_ns = 2_000
+    moved = engine.update_all_ship_movement()
+
+    for key, values in expected.items():
+        np.testing.assert_allclose(getattr(ships, key)[:n], values, rtol=0, atol=1e-9, err_msg=key)
+
+    # Only ships whose position changed get the tick's timestamp
+    changed = (expected["x"] != state["x"]) | (expected["y"] != state["y"])
+    assert 0 < moved == changed.sum() < n
+    np.testing.assert_array_equal(ships.last_update_ns[:n], np.where(changed, 2_000, 1_000))
+    np.testing.assert_array_equal(ships.sector_x[:n], np.floor(expected["x"]))
+    np.testing.assert_array_equal(ships.sector_y[:n], np.floor(expected["y"]))
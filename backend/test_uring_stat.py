@@ -0,0 +1,114 @@
+"""
+Tests for the batched io_uring stat/unlink helpers against os.stat/os.unlink
+"""
+
+import os
+
+import pytest
+
+from app.core import _uring_stat
+
+
+STAT_FIELDS = ("st_mode", "st_ino", "st_dev", "st_nlink", "st_uid", "st_gid", "st_size",
+               "st_atime_ns", "st_mtime_ns", "st_ctime_ns", "st_blksize", "st_blocks", "st_rdev")
+
+
+@pytest.fixture(params=[False, True], ids=["io_uring", "fallback"])
+def disabled(request, monkeypatch):
+    """Run a test both with io_uring (where available) and with GE_DISABLE_IO_URING set"""
+    if request.param:
+        monkeypatch.setenv("GE_DISABLE_IO_URING", "1")
+    else:
+        monkeypatch.delenv("GE_DISABLE_IO_URING", raising=False)
+    return request.param
+
+
+def make_files(directory, count):
+    paths = []
+    for i in range(count):
+        path = directory / f"file_{i}.dat"
+        path.write_bytes(b"x" * i)
+        paths.append(path)
+    return paths
+
+
+def test_batched_statx_matches_os_stat(tmp_path, disabled):
+    """Every stat field matches os.stat, also across several ring-sized chunks"""
+    paths = make_files(tmp_path, _uring_stat.RING_ENTRIES * 2 + 3)
+    os.symlink(paths[0], tmp_path / "link")
+    paths.append(tmp_path / "link")
+    paths.append(str(tmp_path))
+
+    results = _uring_stat.batched_statx(paths)
+
+    assert len(results) == len(paths)
+    for path, result in zip(paths, results):
+        expected = os.stat(path)
+        for field in STAT_FIELDS:
+            assert getattr(result, field) == getattr(expected, field), (path, field)
+        assert result.st_mtime == expected.st_mtime
+
+
+def test_batched_statx_missing_file(tmp_path, disabled):
+    """A missing file raises the same error as os.stat"""
+    paths = make_files(tmp_path, 3)
+    paths.insert(1, tmp_path / "missing")
+
+    with pytest.raises(FileNotFoundError):
+        _uring_stat.batched_statx(paths)
+
+
+def test_batched_statx_empty(disabled):
+    assert _uring_stat.batched_statx([]) == []
+
+
+def test_batched_unlink_removes_files(tmp_path, disabled):
+    """All files are removed, as with os.unlink"""
+    paths = make_files(tmp_path, _uring_stat.RING_ENTRIES + 5)
+
+    _uring_stat.batched_unlink(paths)
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_batched_unlink_missing_file(tmp_path, disabled):
+    """A missing file raises the same error as os.unlink; with io_uring the rest are still removed"""
+    paths = make_files(tmp_path, 4)
+    paths.insert(2, tmp_path / "missing")
+
+    with pytest.raises(FileNotFoundError):
+        _uring_stat.batched_unlink(paths)
+
+    remaining = set(os.listdir(tmp_path))
+    if disabled:
+        assert remaining == {"file_2.dat", "file_3.dat"}
+    elif _uring_stat._io_uring_supported():
+        assert remaining == set()
+
+
+def test_fallback_does_not_create_ring(tmp_path, monkeypatch):
+    """With GE_DISABLE_IO_URING set no ring is created"""
+    monkeypatch.setenv("GE_DISABLE_IO_URING", "1")
+    monkeypatch.setattr(_uring_stat, "_Ring", None)
+
+    paths = make_files(tmp_path, 2)
+    assert [r.st_size for r in _uring_stat.batched_statx(paths)] == [0, 1]
+    _uring_stat.batched_unlink(paths)
+    assert os.listdir(tmp_path) == []
+
+
+def test_ring_is_reused(tmp_path, monkeypatch):
+    """Calls share one ring per process instead of creating one each"""
+    monkeypatch.delenv("GE_DISABLE_IO_URING", raising=False)
+    if not _uring_stat._io_uring_supported():
+        pytest.skip("io_uring is not available")
+
+    paths = make_files(tmp_path, 3)
+    _uring_stat.batched_statx(paths)
+    ring = _uring_stat._ring
+
+    _uring_stat.batched_statx(paths)
+    _uring_stat.batched_unlink(paths)
+
+    assert _uring_stat._ring is ring
+    assert ring.fd >= 0